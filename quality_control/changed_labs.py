@@ -0,0 +1,123 @@
+"""
+Select labs affected by changes since a git revision.
+"""
+
+import functools
+from pathlib import Path
+from typing import Optional
+
+from quality_control.cli_unifier import _run_console_tool, handles_console_error
+from quality_control.console_logging import get_child_logger
+from quality_control.constants import CORE_UTILS_PACKAGE_PATH
+from quality_control.file_index import FileIndex
+from quality_control.import_closure import get_external_imports
+
+logger = get_child_logger(__file__)
+
+SHARED_PATHS = (
+    CORE_UTILS_PACKAGE_PATH.name,
+    "pyproject.toml",
+    "project_config.json",
+    "conftest.py",
+    "requirements.txt",
+    "requirements_qa.txt",
+)
+
+
+@handles_console_error()
+def run_git_diff(root_dir: Path, ref: str) -> tuple[str, str, int]:
+    """
+    List files changed since the revision.
+
+    Args:
+        root_dir (Path): Root directory of the project
+        ref (str): Git revision to compare with
+
+    Returns:
+        tuple[str, str, int]: stdout, stderr, exit code
+    """
+    return _run_console_tool("git", ["diff", "--name-only", "--relative", ref], cwd=root_dir)
+
+
+@functools.lru_cache
+def get_changed_files(root_dir: Path, ref: str) -> tuple[Path, ...]:
+    """
+    Get files changed since the revision.
+
+    Args:
+        root_dir (Path): Root directory of the project
+        ref (str): Git revision to compare with
+
+    Returns:
+        tuple[Path, ...]: Paths to changed files relative to the root directory
+    """
+    stdout, _, _ = run_git_diff(root_dir, ref)
+    return tuple(Path(line) for line in stdout.splitlines() if line)
+
+
+def is_full_run_required(changed_files: tuple[Path, ...]) -> bool:
+    """
+    Determine whether shared files were changed so that every lab is affected.
+
+    Args:
+        changed_files (tuple[Path, ...]): Paths to changed files relative to the root directory
+
+    Returns:
+        bool: True if some of shared files were changed
+    """
+    return any(file.parts[0] in SHARED_PATHS for file in changed_files)
+
+
+def select_changed_paths(
+    paths: list[Path], root_dir: Path, changed_since: Optional[str]
+) -> list[Path]:
+    """
+    Get paths to labs or addons affected by changes since the revision.
+
+    A lab is affected by changes of its own files and of files of other labs
+    it imports, directly or through other imported files.
+
+    Args:
+        paths (list[Path]): Paths to labs or addons
+        root_dir (Path): Root directory of the project
+        changed_since (Optional[str]): Git revision to compare with, None for all paths
+
+    Returns:
+        list[Path]: Paths to affected labs or addons
+    """
+    if changed_since is None:
+        return paths
+    changed_files = get_changed_files(root_dir, changed_since)
+    if is_full_run_required(changed_files):
+        logger.info(f"Shared files changed since {changed_since}, processing everything.")
+        return paths
+    changed_folders = {file.parts[0] for file in changed_files if len(file.parts) > 1}
+    changed_paths = {root_dir / file for file in changed_files}
+    file_index = FileIndex(root_dir)
+    imports: dict[Path, list[Path]] = {}
+    selected = [
+        path
+        for path in paths
+        if path.name in changed_folders
+        or changed_paths.intersection(get_external_imports(path, root_dir, file_index, imports))
+    ]
+    logger.info(f"Changed since {changed_since}: {[path.name for path in selected]}")
+    return selected
+
+
+def select_changed_names(
+    names: list[str], root_dir: Path, changed_since: Optional[str]
+) -> list[str]:
+    """
+    Get names of labs or addons affected by changes since the revision.
+
+    Args:
+        names (list[str]): Names of labs or addons
+        root_dir (Path): Root directory of the project
+        changed_since (Optional[str]): Git revision to compare with, None for all names
+
+    Returns:
+        list[str]: Names of affected labs or addons
+    """
+    paths = [root_dir / name for name in names]
+    return [path.name for path in select_changed_paths(paths, root_dir, changed_since)]
@@ -3,12 +3,45 @@ Some simple checks for start.py lab files.
 """
 
 import argparse
+import ast
 import sys
+from pathlib import Path
+
+from pydantic.dataclasses import dataclass
 
 from quality_control.console_logging import get_child_logger
 
 logger = get_child_logger(__file__)
 
+RESULT_NAMES = ("result", "RESULT")
+
+
+@dataclass
+class StartContentResult:
+    """
+    DTO for storing result of start.py content check of a lab.
+    """
+
+    lab_name: str
+    passed: bool
+    message: str
+
+
+def is_result_assert(node: ast.AST) -> bool:
+    """
+    Determine whether node is an assert of the result variable.
+
+    Args:
+        node (ast.AST): Node of a syntax tree
+
+    Returns:
+        bool: True for assert result and assert result <comparison> statements
+    """
+    if not isinstance(node, ast.Assert):
+        return False
+    tested = node.test.left if isinstance(node.test, ast.Compare) else node.test
+    return isinstance(tested, ast.Name) and tested.id in RESULT_NAMES
+
 
 def check_assert_line(content: str) -> bool:
     """
@@ -20,9 +53,50 @@ def check_assert_line(content: str) -> bool:
     Returns:
         bool: Is expected in content or not
     """
-    expected = "assert result"
-    expected_alternative = "assert RESULT"
-    return expected in content or expected_alternative in content
+    try:
+        tree = ast.parse(content)
+    except SyntaxError:
+        return False
+    return any(is_result_assert(node) for node in ast.walk(tree))
+
+
+def check_start_py(lab_name: str, root_dir: Path) -> StartContentResult:
+    """
+    Check content of start.py of a lab.
+
+    Args:
+        lab_name (str): Name of the lab directory
+        root_dir (Path): Root directory of the project
+
+    Returns:
+        StartContentResult: Result of the check
+    """
+    start_py_path = root_dir / lab_name / "start.py"
+    if not start_py_path.exists():
+        return StartContentResult(lab_name=lab_name, passed=False, message="No start.py file")
+    if not check_assert_line(start_py_path.read_text(encoding="utf-8")):
+        return StartContentResult(
+            lab_name=lab_name,
+            passed=False,
+            message="Make sure you made assert result in start.py file",
+        )
+    return StartContentResult(lab_name=lab_name, passed=True, message="Passed")
+
+
+def check_labs_start_content(
+    labs_names: list[str], root_dir: Path
+) -> dict[str, StartContentResult]:
+    """
+    Check content of start.py of several labs.
+
+    Args:
+        labs_names (list[str]): Names of the lab directories
+        root_dir (Path): Root directory of the project
+
+    Returns:
+        dict[str, StartContentResult]: Result of the check for each lab
+    """
+    return {lab_name: check_start_py(lab_name, root_dir) for lab_name in labs_names}
 
 
 if __name__ == "__main__":
@@ -35,6 +109,3 @@ if __name__ == "__main__":
         sys.exit(0)
     logger.info("Make sure you made assert result in start.py file")
     sys.exit(1)
-
-# Test: a) assert RESULT is in file
-# Test: b) call start.py, expect it does not throw Error
@@ -2,19 +2,22 @@
 CLI commands.
 """
 
+import asyncio
 import functools
 import platform
 import re
 import subprocess
 import sys
 from pathlib import Path
-from typing import Any, Callable
+from typing import Any, Awaitable, Callable, Coroutine, Iterable, TypeVar
 
 from quality_control.console_logging import get_child_logger
 from quality_control.constants import PROJECT_ROOT, USE_VENV
 
 logger = get_child_logger(__file__)
 
+T = TypeVar("T")
+
 
 def convert_raw_output_to_str(content: bytes) -> str:
     """
@@ -110,17 +113,17 @@ def modify_path(path: str) -> str:
     return modified_path
 
 
-def _run_console_tool(exe: str, /, args: list[str], **kwargs: Any) -> tuple[str, str, int]:
+def _prepare_console_tool_options(exe: str, args: list[str], kwargs: dict[str, Any]) -> list[str]:
     """
-    Run CLI commands.
+    Build the full command line for a console tool.
 
     Args:
         exe (str): A path to python exe
         args (list[str]): Arguments
-        **kwargs (Any): Options
+        kwargs (dict[str, Any]): Options
 
     Returns:
-        tuple[str, str, int]: stdout, stderr, exit code
+        list[str]: Command line to execute
     """
     kwargs_processed: list[str] = []
     for item in kwargs.items():
@@ -142,14 +145,30 @@ def _run_console_tool(exe: str, /, args: list[str], **kwargs: Any) -> tuple[str,
             f"Attempting to run with the following arguments: "
             f'{" ".join([modify_path(str(exe)), *arguments])}'
         )
+    return options
 
-    env = kwargs.get("env")
-    if env:
-        result = subprocess.run(options, capture_output=True, check=True, env=env)
-    elif kwargs.get("cwd"):
-        result = subprocess.run(options, capture_output=True, check=True, cwd=kwargs.get("cwd"))
-    else:
-        result = subprocess.run(options, capture_output=True, check=True)
+
+def _run_console_tool(exe: str, /, args: list[str], **kwargs: Any) -> tuple[str, str, int]:
+    """
+    Run CLI commands.
+
+    Args:
+        exe (str): A path to python exe
+        args (list[str]): Arguments
+        **kwargs (Any): Options
+
+    Returns:
+        tuple[str, str, int]: stdout, stderr, exit code
+    """
+    options = _prepare_console_tool_options(exe, args, kwargs)
+
+    result = subprocess.run(
+        options,
+        capture_output=True,
+        check=True,
+        env=kwargs.get("env"),
+        cwd=kwargs.get("cwd"),
+    )
     return (
         convert_raw_output_to_str(result.stdout),
         convert_raw_output_to_str(result.stderr),
@@ -157,6 +176,89 @@ def _run_console_tool(exe: str, /, args: list[str], **kwargs: Any) -> tuple[str,
     )
 
 
+async def _run_console_tool_async(
+    exe: str, /, args: list[str], **kwargs: Any
+) -> tuple[str, str, int]:
+    """
+    Run CLI commands without blocking the event loop.
+
+    Args:
+        exe (str): A path to python exe
+        args (list[str]): Arguments
+        **kwargs (Any): Options
+
+    Returns:
+        tuple[str, str, int]: stdout, stderr, exit code
+
+    Raises:
+        CalledProcessError: If the process finishes with a non-zero exit code
+    """
+    options = _prepare_console_tool_options(exe, args, kwargs)
+
+    process = await asyncio.create_subprocess_exec(
+        *options,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        env=kwargs.get("env"),
+        cwd=kwargs.get("cwd"),
+    )
+    stdout, stderr = await process.communicate()
+    return_code = process.returncode if process.returncode is not None else 0
+    if return_code:
+        raise subprocess.CalledProcessError(return_code, options, output=stdout, stderr=stderr)
+    return (
+        convert_raw_output_to_str(stdout),
+        convert_raw_output_to_str(stderr),
+        return_code,
+    )
+
+
+def run_concurrently(coroutines: Iterable[Coroutine[Any, Any, T]], jobs: int) -> list[T]:
+    """
+    Run coroutines with a bounded number of them in flight at once.
+
+    Args:
+        coroutines (Iterable[Coroutine[Any, Any, T]]): Coroutines to run
+        jobs (int): Maximum number of coroutines running at the same time
+
+    Returns:
+        list[T]: Results in the order of the submitted coroutines
+    """
+
+    async def gather() -> list[T]:
+        semaphore = asyncio.Semaphore(max(jobs, 1))
+
+        async def bounded(coroutine: Coroutine[Any, Any, T]) -> T:
+            async with semaphore:
+                return await coroutine
+
+        return list(await asyncio.gather(*map(bounded, coroutines)))
+
+    return asyncio.run(gather())
+
+
+def log_console_result(result: tuple[str, str, int], ok_codes: tuple[int, ...] = (0,)) -> bool:
+    """
+    Print captured result of a finished console tool.
+
+    Args:
+        result (tuple[str, str, int]): stdout, stderr, exit code
+        ok_codes (tuple[int, ...]): Exit codes considered as success. Defaults to (0,).
+
+    Returns:
+        bool: True if exit code is considered as success
+    """
+    stdout, stderr, return_code = result
+    logger.info(f"Exit code: {return_code}.")
+    if stdout:
+        log_output("Console run stdout", stdout)
+    if return_code in ok_codes:
+        return True
+    logger.error(f"Check failed with exit code {return_code}.")
+    log_output("Console run stderr", stderr)
+    return False
+
+
 def handles_console_error(
     exit_code_on_error: int = 1, ok_codes: tuple[int, ...] = (0,)
 ) -> Callable:
@@ -220,3 +322,63 @@ def handles_console_error(
         return wrapper
 
     return decorator
+
+
+def handles_console_error_async(ok_codes: tuple[int, ...] = (0,)) -> Callable:
+    """
+    Decorator to handle console tool errors of coroutines.
+
+    Unlike handles_console_error, a failed call does not terminate the process:
+    the result is returned so that all concurrently running calls can be collected.
+
+    Args:
+        ok_codes (tuple[int, ...]): Exit codes considered as success. Defaults to (0,).
+
+    Returns:
+        Callable: The wrapped coroutine function.
+    """
+
+    def decorator(
+        func: Callable[..., Awaitable[tuple[str, str, int]]],
+    ) -> Callable[..., Awaitable[tuple[str, str, int]]]:
+        """
+        Decorator to handle console tool errors of coroutines.
+
+        Args:
+            func (Callable[..., Awaitable[tuple[str, str, int]]]): The coroutine function
+                to be decorated.
+
+        Returns:
+            Callable[..., Awaitable[tuple[str, str, int]]]: The wrapped coroutine function.
+        """
+
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> tuple[str, str, int]:
+            """
+            Wrapper function to handle console tool errors.
+
+            Args:
+                *args (Any): Variable length argument list to pass to the decorated function.
+                **kwargs (Any): Arbitrary keyword arguments to pass to the decorated function.
+
+            Returns:
+                tuple[str, str, int]: stdout, stderr, exit code
+            """
+            logger.info(f"Call to {func.__name__}")
+            try:
+                result = await func(*args, **kwargs)
+            except subprocess.CalledProcessError as error:
+                result = (
+                    convert_raw_output_to_str(error.output or b""),
+                    convert_raw_output_to_str(error.stderr or b""),
+                    error.returncode,
+                )
+            if result[2] not in ok_codes:
+                logger.error(f"Call to {func.__name__} failed with exit code {result[2]}.")
+            else:
+                logger.info(f"Call to {func.__name__} finished with exit code {result[2]}.")
+            return result
+
+        return wrapper
+
+    return decorator
@@ -10,15 +10,22 @@ from typing import Iterable, Mapping
 
 from logging518.config import fileConfig
 
+from quality_control.changed_labs import select_changed_paths
+from quality_control.cli_unifier import run_concurrently
+from quality_control.collect_coverage.coverage_cache import CoverageCache
 from quality_control.collect_coverage.run_coverage import (
+    combine_coverage,
     CoverageCreateReportError,
     CoverageRunError,
-    extract_percentage_from_report,
+    create_coverage_report,
+    get_coverage_data_path,
     run_coverage_collection,
+    run_coverage_collection_async,
 )
 from quality_control.console_logging import get_child_logger
 from quality_control.lab_settings import LabSettings
 from quality_control.project_config import ProjectConfig
+from quality_control.sharding import LabDurations, write_shard_results
 from quality_control.static_checks.check_black import QualityControlArgumentsParser
 
 logger = get_child_logger(__file__)
@@ -29,8 +36,36 @@ CoverageResults = Mapping[
 ]
 
 
+class CoverageArgumentsParser(QualityControlArgumentsParser):
+    """
+    Arguments for coverage collection.
+    """
+
+    combine: bool = False
+    json_report: bool = False
+
+
+def get_report_path(artifacts_path: Path, lab_name: str, json_report: bool) -> Path | None:
+    """
+    Get path to JSON report of a lab if it is requested.
+
+    Args:
+        artifacts_path (Path): Path to artifacts
+        lab_name (str): Name of the lab
+        json_report (bool): Whether JSON report is requested
+
+    Returns:
+        Path | None: Path to JSON report
+    """
+    return artifacts_path / f"{lab_name}.json" if json_report else None
+
+
 def collect_coverage(
-    root_dir: Path, all_labs_names: Iterable[Path], artifacts_path: Path
+    root_dir: Path,
+    all_labs_names: Iterable[Path],
+    artifacts_path: Path,
+    durations: LabDurations | None = None,
+    json_report: bool = False,
 ) -> CoverageResults:
     """
     Entrypoint for coverage collection for every required folder.
@@ -38,23 +73,31 @@ def collect_coverage(
     Args:
         all_labs_names (Iterable[Path]): Names of all labs
         artifacts_path (Path): Path to artifacts
+        durations (LabDurations | None): Durations of labs to update
+        json_report (bool): Save JSON report of each lab to artifacts
 
     Returns:
         CoverageResults: Coverage results
     """
+    if durations is None:
+        durations = LabDurations(root_dir, "coverage_analyzer")
     all_labs_results = {}
     for lab_path in all_labs_names:
         percentage = None
         try:
             check_target = True
-            run_coverage_collection(
-                lab_path=lab_path,
-                artifacts_path=artifacts_path,
-                check_target_score=check_target,
-                root_dir=root_dir,
+            with durations.measure(lab_path.name):
+                run_coverage_collection(
+                    lab_path=lab_path,
+                    artifacts_path=artifacts_path,
+                    check_target_score=check_target,
+                    root_dir=root_dir,
+                )
+            percentage = create_coverage_report(
+                get_coverage_data_path(artifacts_path, lab_path.name),
+                root_dir,
+                get_report_path(artifacts_path, lab_path.name, json_report),
             )
-            report_path = artifacts_path / f"{lab_path.name}.json"
-            percentage = extract_percentage_from_report(report_path)
         except (CoverageRunError, CoverageCreateReportError) as e:
             logger.error(str(e))
         finally:
@@ -62,6 +105,59 @@ def collect_coverage(
     return all_labs_results
 
 
+def collect_coverage_concurrently(
+    root_dir: Path,
+    all_labs_names: list[Path],
+    artifacts_path: Path,
+    durations: LabDurations,
+    jobs: int,
+    json_report: bool = False,
+) -> CoverageResults:
+    """
+    Collect coverage for several labs at once, each lab writing its own data file.
+
+    Args:
+        root_dir (Path): Root directory of the project
+        all_labs_names (list[Path]): Paths of labs
+        artifacts_path (Path): Path to artifacts
+        durations (LabDurations): Durations of labs to update
+        jobs (int): Maximum number of labs processed at the same time
+        json_report (bool): Save JSON report of each lab to artifacts
+
+    Returns:
+        CoverageResults: Coverage results
+    """
+    results = run_concurrently(
+        (
+            durations.measure_async(
+                lab_path.name,
+                run_coverage_collection_async(
+                    lab_path=lab_path, artifacts_path=artifacts_path, root_dir=root_dir
+                ),
+            )
+            for lab_path in all_labs_names
+        ),
+        jobs=jobs,
+    )
+    all_labs_results = {}
+    for lab_path, (stdout, stderr, return_code) in zip(all_labs_names, results):
+        percentage: int | None = None
+        if return_code:
+            logger.error(f"Coverage collection for {lab_path.name} failed:\n{stdout}\n{stderr}")
+            all_labs_results[lab_path.name] = (percentage,)
+            continue
+        try:
+            percentage = create_coverage_report(
+                get_coverage_data_path(artifacts_path, lab_path.name),
+                root_dir,
+                get_report_path(artifacts_path, lab_path.name, json_report),
+            )
+        except CoverageCreateReportError as e:
+            logger.error(str(e))
+        all_labs_results[lab_path.name] = (percentage,)
+    return all_labs_results
+
+
 def is_decrease_present(
     all_labs_results: CoverageResults, previous_coverage_results: dict
 ) -> tuple[bool, bool, dict]:
@@ -95,41 +191,40 @@ def is_decrease_present(
     return any_degradation, any_fallen_tests, labs_with_thresholds
 
 
-def main() -> None:
-    """
-    Entrypoint for coverage collection.
+def select_labs_with_target(labs_paths: list[Path]) -> list[Path]:
     """
-    args = QualityControlArgumentsParser(underscores_to_dashes=True).parse_args()
-
-    root_dir = args.root_dir.resolve()
-    toml_config = (args.toml_config_path or (root_dir / "pyproject.toml")).resolve()
+    Skip labs which target score is 0.
 
-    project_config_path = (args.project_config_path or (root_dir / "project_config.json")).resolve()
-
-    project_config = ProjectConfig(project_config_path)
-
-    fileConfig(toml_config)
-
-    artifacts_path = root_dir / "build" / "coverage"
-    artifacts_path.mkdir(parents=True, exist_ok=True)
-
-    coverage_thresholds = project_config.get_thresholds()
-    all_labs_names = project_config.get_labs_paths(root_dir=root_dir)
+    Args:
+        labs_paths (list[Path]): Paths of labs
 
+    Returns:
+        list[Path]: Paths of labs to collect coverage for
+    """
     not_skipped = []
-    for lab_path in all_labs_names:
-        settings = LabSettings(lab_path / "settings.json")
-        if settings.target_score == 0:
+    for lab_path in labs_paths:
+        if LabSettings(lab_path / "settings.json").target_score == 0:
             logger.info(f"Skip {lab_path} as target score is 0")
             continue
         not_skipped.append(lab_path)
+    return not_skipped
 
-    all_labs_results = collect_coverage(
-        root_dir=root_dir, all_labs_names=not_skipped, artifacts_path=artifacts_path
-    )
 
+def check_coverage_results(
+    all_labs_results: CoverageResults, project_config: ProjectConfig
+) -> bool:
+    """
+    Compare coverage of labs with thresholds and print the verdict.
+
+    Args:
+        all_labs_results (CoverageResults): Coverage results
+        project_config (ProjectConfig): Project configuration with thresholds
+
+    Returns:
+        bool: True if coverage of no lab decreased
+    """
     any_degradation, any_fallen_tests, labs_with_thresholds = is_decrease_present(
-        all_labs_results, coverage_thresholds
+        all_labs_results, project_config.get_thresholds()
     )
 
     if any_degradation:
@@ -142,16 +237,120 @@ def main() -> None:
         project_config.update_thresholds(labs_with_thresholds)
 
         logger.info(project_config.get_json())
-        sys.exit(1)
+        return False
 
     if any_fallen_tests:
         logger.info(
             "Some tests failed! We can't accept that.\n"
             "Make sure the tests pass. I wish you good luck! \n\n"
         )
-        sys.exit(1)
+        return False
 
     logger.info("Nice coverage. Anyway, write more tests!\n\n")
+    return True
+
+
+def collect_labs_coverage(
+    args: CoverageArgumentsParser,
+    labs_paths: list[Path],
+    artifacts_path: Path,
+    durations: LabDurations,
+) -> CoverageResults:
+    """
+    Collect coverage of labs in the mode selected by the arguments.
+
+    Labs unchanged since the last run reuse stored coverage when the cache is enabled.
+
+    Args:
+        args (CoverageArgumentsParser): Parsed arguments
+        labs_paths (list[Path]): Paths of labs
+        artifacts_path (Path): Path to artifacts
+        durations (LabDurations): Durations of labs to update
+
+    Returns:
+        CoverageResults: Coverage results in the order of labs
+    """
+    root_dir = args.root_dir.resolve()
+    cache = CoverageCache(root_dir, artifacts_path) if args.use_cache else None
+    reused: dict[str, tuple[int | None]] = {}
+    changed = labs_paths
+    if cache:
+        reused, changed = cache.partition(labs_paths)
+
+    if args.jobs > 1:
+        collected = collect_coverage_concurrently(
+            root_dir, changed, artifacts_path, durations, args.jobs, args.json_report
+        )
+    else:
+        collected = collect_coverage(
+            root_dir=root_dir,
+            all_labs_names=changed,
+            artifacts_path=artifacts_path,
+            durations=durations,
+            json_report=args.json_report,
+        )
+
+    if cache:
+        for lab_path in changed:
+            if (percentage := collected[lab_path.name][0]) is not None:
+                cache.store(lab_path, percentage)
+    if args.json_report:
+        for lab_name in reused:
+            create_coverage_report(
+                get_coverage_data_path(artifacts_path, lab_name),
+                root_dir,
+                get_report_path(artifacts_path, lab_name, True),
+            )
+    all_labs_results = {**reused, **collected}
+    return {lab_path.name: all_labs_results[lab_path.name] for lab_path in labs_paths}
+
+
+def main() -> None:
+    """
+    Entrypoint for coverage collection.
+    """
+    args = CoverageArgumentsParser(underscores_to_dashes=True).parse_args()
+
+    root_dir = args.root_dir.resolve()
+    toml_config = (args.toml_config_path or (root_dir / "pyproject.toml")).resolve()
+
+    project_config_path = (args.project_config_path or (root_dir / "project_config.json")).resolve()
+
+    project_config = ProjectConfig(project_config_path)
+
+    fileConfig(toml_config)
+
+    artifacts_path = root_dir / "build" / "coverage"
+    artifacts_path.mkdir(parents=True, exist_ok=True)
+
+    coverage_thresholds = project_config.get_thresholds()
+    durations = LabDurations(root_dir, "coverage_analyzer")
+    all_labs_names = durations.select_shard_paths(
+        select_changed_paths(
+            project_config.get_labs_paths(root_dir=root_dir), root_dir, args.changed_since
+        ),
+        args.shard,
+    )
+
+    all_labs_results = collect_labs_coverage(
+        args, select_labs_with_target(all_labs_names), artifacts_path, durations
+    )
+    collected = [name for name, (percentage,) in all_labs_results.items() if percentage is not None]
+    if args.combine and collected:
+        combine_coverage(collected, artifacts_path, root_dir)
+    write_shard_results(
+        root_dir,
+        "coverage_analyzer",
+        args.shard,
+        {
+            lab_name: percentage is not None and percentage >= coverage_thresholds.get(lab_name, 0)
+            for lab_name, (percentage,) in all_labs_results.items()
+        },
+        durations,
+    )
+
+    if not check_coverage_results(all_labs_results, project_config):
+        sys.exit(1)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,124 @@
+"""
+Storage of coverage data of labs for reuse while labs stay unchanged.
+"""
+
+import json
+import shutil
+from pathlib import Path
+
+from quality_control.collect_coverage.run_coverage import (
+    get_coverage_data_path,
+    get_target_score,
+    prepare_coverage_run_args,
+)
+from quality_control.console_logging import get_child_logger
+from quality_control.file_index import FileIndex
+from quality_control.hashing import hash_paths, hash_strings
+from quality_control.verdict_cache import get_lab_hash, get_shared_hash
+
+logger = get_child_logger(__file__)
+
+COVERAGE_SETTINGS_FILES = (".coveragerc", "setup.cfg", "tox.ini")
+
+
+class CoverageCache:
+    """
+    Coverage data file and percentage of the last run of each lab with hash of its inputs.
+    """
+
+    def __init__(self, root_dir: Path, artifacts_path: Path) -> None:
+        """
+        Initialize CoverageCache.
+
+        Args:
+            root_dir (Path): Root directory of the project
+            artifacts_path (Path): Path to coverage artifacts
+        """
+        self._root_dir = root_dir
+        self._artifacts_path = artifacts_path
+        self._cache_dir = root_dir / "build" / "coverage_cache"
+        self._shared_hash = hash_strings(
+            get_shared_hash(root_dir),
+            hash_paths((root_dir / name for name in COVERAGE_SETTINGS_FILES), root_dir),
+        )
+        self._file_index = FileIndex(root_dir)
+
+    def compute_hash(self, lab_path: Path) -> str:
+        """
+        Get hash of sources, tests, imported files, target score and coverage settings of a lab.
+
+        Args:
+            lab_path (Path): Path to lab
+
+        Returns:
+            str: Hex digest of lab inputs
+        """
+        return hash_strings(
+            self._shared_hash,
+            get_lab_hash(lab_path, self._root_dir, self._file_index),
+            *prepare_coverage_run_args(lab_path, f" and mark{get_target_score(lab_path)}"),
+        )
+
+    def _load_percentage(self, lab_path: Path) -> int | None:
+        """
+        Get stored percentage of a lab if its inputs match ones of the stored coverage.
+
+        Args:
+            lab_path (Path): Path to lab
+
+        Returns:
+            int | None: Stored percentage or None if it or the coverage data is outdated
+                or missing
+        """
+        entry_path = self._cache_dir / lab_path.name / "entry.json"
+        if not entry_path.exists() or not (entry_path.parent / ".coverage").exists():
+            return None
+        entry = json.loads(entry_path.read_text(encoding="utf-8"))
+        if entry["hash"] != self.compute_hash(lab_path):
+            return None
+        return int(entry["percentage"])
+
+    def partition(self, labs_paths: list[Path]) -> tuple[dict[str, tuple[int | None]], list[Path]]:
+        """
+        Split labs into unchanged ones with restored coverage data and ones to be traced.
+
+        Args:
+            labs_paths (list[Path]): Paths of labs
+
+        Returns:
+            tuple[dict[str, tuple[int | None]], list[Path]]: Coverage of unchanged labs
+                and paths of changed labs
+        """
+        reused: dict[str, tuple[int | None]] = {}
+        changed = []
+        for lab_path in labs_paths:
+            percentage = self._load_percentage(lab_path)
+            if percentage is None:
+                changed.append(lab_path)
+                continue
+            shutil.copyfile(
+                self._cache_dir / lab_path.name / ".coverage",
+                get_coverage_data_path(self._artifacts_path, lab_path.name),
+            )
+            logger.info(f"Lab {lab_path.name} is unchanged, reusing its coverage.")
+            reused[lab_path.name] = (percentage,)
+        return reused, changed
+
+    def store(self, lab_path: Path, percentage: int) -> None:
+        """
+        Save coverage data and percentage of a freshly traced lab.
+
+        Args:
+            lab_path (Path): Path to lab
+            percentage (int): Total coverage percentage of the lab
+        """
+        lab_cache_dir = self._cache_dir / lab_path.name
+        lab_cache_dir.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(
+            get_coverage_data_path(self._artifacts_path, lab_path.name),
+            lab_cache_dir / ".coverage",
+        )
+        (lab_cache_dir / "entry.json").write_text(
+            json.dumps({"hash": self.compute_hash(lab_path), "percentage": percentage}),
+            encoding="utf-8",
+        )
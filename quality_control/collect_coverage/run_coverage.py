@@ -2,14 +2,24 @@
 Runner for collecting coverage.
 """
 
+import io
 import json
+import os
 import pathlib
+from contextlib import contextmanager
 from pathlib import Path
+from typing import Iterator
+
+import coverage
+from coverage.exceptions import CoverageException
+from coverage.results import display_covered
 
 from quality_control.cli_unifier import (
     _run_console_tool,
+    _run_console_tool_async,
     choose_python_exe,
     handles_console_error,
+    handles_console_error_async,
 )
 from quality_control.console_logging import get_child_logger
 from quality_control.lab_settings import LabSettings
@@ -58,36 +68,99 @@ def extract_percentage_from_report(report_path: Path) -> int:
     return int(content["totals"]["percent_covered_display"])
 
 
-@handles_console_error()
-def run_coverage_subprocess(
-    lab_path: pathlib.Path, python_exe_path: pathlib.Path, mark_label: str
-) -> tuple[str, str, int]:
+def prepare_coverage_tracing_args(lab_name: str) -> list[str]:
     """
-    Entrypoint for a single lab coverage collection.
+    Build arguments for coverage tracing sources of a single lab.
 
     Args:
-        lab_path (Path): Path to lab
-        python_exe_path (Path): Path to python executable
-        mark_label (str): Target score label
+        lab_name (str): Name of the lab
 
     Returns:
-        tuple[str, str, int]: stdout, stderr, exit code
+        list[str]: Arguments for python executable to be followed by a module to run
     """
-    args = [
+    return [
         "-m",
         "coverage",
         "run",
         "--include",
-        f"{lab_path.name}/main.py,"
-        f"{lab_path.name}/scraper.py,"
-        f"{lab_path.name}/pipeline.py,"
-        f"{lab_path.name}/pos_pipeline.py",
+        f"{lab_name}/main.py,"
+        f"{lab_name}/scraper.py,"
+        f"{lab_name}/pipeline.py,"
+        f"{lab_name}/pos_pipeline.py",
+    ]
+
+
+def prepare_coverage_run_args(lab_path: Path, mark_label: str) -> list[str]:
+    """
+    Build arguments for coverage collection of a single lab.
+
+    Args:
+        lab_path (Path): Path to lab
+        mark_label (str): Target score label
+
+    Returns:
+        list[str]: Arguments for python executable
+    """
+    return [
+        *prepare_coverage_tracing_args(lab_path.name),
         "-m",
         "pytest",
         "-m",
         f"{lab_path.name}{mark_label}",
     ]
-    return _run_console_tool(str(python_exe_path), args, debug=True, cwd=str(lab_path.parent))
+
+
+def get_coverage_data_path(artifacts_path: Path, lab_name: str) -> Path:
+    """
+    Get path to coverage data file of a single lab.
+
+    Args:
+        artifacts_path (Path): Path to artifacts
+        lab_name (str): Name of the lab
+
+    Returns:
+        Path: Path to coverage data file
+    """
+    return artifacts_path / f".coverage.{lab_name}"
+
+
+def get_coverage_env(data_path: Path) -> dict[str, str]:
+    """
+    Get environment for coverage writing data to the given file.
+
+    Args:
+        data_path (Path): Path to coverage data file
+
+    Returns:
+        dict[str, str]: Environment variables
+    """
+    return {**os.environ, "COVERAGE_FILE": str(data_path)}
+
+
+@handles_console_error()
+def run_coverage_subprocess(
+    lab_path: pathlib.Path, python_exe_path: pathlib.Path, mark_label: str, data_path: Path
+) -> tuple[str, str, int]:
+    """
+    Entrypoint for a single lab coverage collection.
+
+    Args:
+        lab_path (Path): Path to lab
+        python_exe_path (Path): Path to python executable
+        mark_label (str): Target score label
+        data_path (Path): Path to coverage data file
+
+    Returns:
+        tuple[str, str, int]: stdout, stderr, exit code
+    """
+    args = prepare_coverage_run_args(lab_path, mark_label)
+    return _run_console_tool(
+        str(python_exe_path),
+        args,
+        debug=True,
+        cwd=str(lab_path.parent),
+        env=get_coverage_env(data_path),
+    )
 
 
 @handles_console_error()
@@ -116,8 +189,118 @@ def run_coverage_collection(
         target_score = get_target_score(lab_path)
         mark = f" and mark{target_score}"
 
-    run_coverage_subprocess(lab_path, python_exe_path, mark)
+    result: tuple[str, str, int] = run_coverage_subprocess(
+        lab_path, python_exe_path, mark, get_coverage_data_path(artifacts_path, lab_path.name)
+    )
+    return result
+
+
+@handles_console_error_async()
+async def run_coverage_collection_async(
+    lab_path: Path,
+    artifacts_path: Path,
+    root_dir: Path,
+    check_target_score: bool = True,
+) -> tuple[str, str, int]:
+    """
+    Collect coverage of a single lab into its own data file without blocking the event loop.
+
+    Args:
+        lab_path (Path): Path to lab
+        artifacts_path (Path): Path to artifacts
+        root_dir (Path): Root directory of the project
+        check_target_score (bool): Target score check
+
+    Returns:
+        tuple[str, str, int]: stdout, stderr, return code
+    """
+    logger.info(f"Processing {lab_path} ...")
+
+    python_exe_path = choose_python_exe(lab_path=root_dir)
+    mark = ""
+    if check_target_score:
+        mark = f" and mark{get_target_score(lab_path)}"
+
+    return await _run_console_tool_async(
+        str(python_exe_path),
+        prepare_coverage_run_args(lab_path, mark),
+        debug=True,
+        cwd=str(lab_path.parent),
+        env=get_coverage_env(get_coverage_data_path(artifacts_path, lab_path.name)),
+    )
+
 
-    report_path = artifacts_path / f"{lab_path.name}.json"
-    args = ["-m", "coverage", "json", "-o", str(report_path)]
-    return _run_console_tool(str(python_exe_path), args, debug=True, cwd=str(lab_path.parent))
+@contextmanager
+def working_directory(path: Path) -> Iterator[None]:
+    """
+    Temporarily change the current working directory.
+
+    Coverage looks up its settings and resolves relative file names in the current
+    directory, so reports are created from the directory coverage was run in.
+
+    Args:
+        path (Path): Directory to change to
+
+    Yields:
+        None: Control while the directory is changed
+    """
+    previous = Path.cwd()
+    os.chdir(path)
+    try:
+        yield
+    finally:
+        os.chdir(previous)
+
+
+def create_coverage_report(data_path: Path, root_dir: Path, report_path: Path | None = None) -> int:
+    """
+    Get total coverage percentage from a data file, optionally saving JSON report.
+
+    Args:
+        data_path (Path): Path to coverage data file
+        root_dir (Path): Root directory of the project
+        report_path (Path | None): Path to save JSON report to
+
+    Returns:
+        int: Total percentage as shown in the report
+
+    Raises:
+        CoverageCreateReportError: If coverage data cannot be reported
+    """
+    with working_directory(root_dir):
+        cov = coverage.Coverage(data_file=str(data_path))
+        try:
+            cov.load()
+            if report_path is None:
+                total = cov.report(file=io.StringIO())
+            else:
+                total = cov.json_report(outfile=str(report_path))
+        except CoverageException as e:
+            raise CoverageCreateReportError(f"Cannot report coverage of {data_path}: {e}") from e
+    return int(display_covered(total, cov.config.precision))
+
+
+def combine_coverage(labs_names: list[str], artifacts_path: Path, root_dir: Path) -> int:
+    """
+    Combine coverage data of labs into a single repository-wide report.
+
+    Data files of labs are kept, so that per-lab reports stay valid.
+
+    Args:
+        labs_names (list[str]): Names of labs with collected coverage data
+        artifacts_path (Path): Path to artifacts
+        root_dir (Path): Root directory of the project
+
+    Returns:
+        int: Total percentage of all labs
+    """
+    # reporting on ".coverage" would implicitly combine and delete ".coverage.*" files of labs
+    data_path = artifacts_path / "combined.coverage"
+    with working_directory(root_dir):
+        cov = coverage.Coverage(data_file=str(data_path))
+        cov.combine(
+            [str(get_coverage_data_path(artifacts_path, lab_name)) for lab_name in labs_names],
+            keep=True,
+        )
+        cov.save()
+    return create_coverage_report(data_path, root_dir, artifacts_path / "combined.json")
@@ -0,0 +1,177 @@
+"""
+Index of repository files collected in a single pass.
+"""
+
+import fnmatch
+import os
+import stat
+import subprocess
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+
+from pydantic.dataclasses import dataclass
+
+from quality_control.cli_unifier import _run_console_tool
+from quality_control.console_logging import get_child_logger
+
+logger = get_child_logger(__file__)
+
+DEFAULT_EXCLUDED_DIRS = ("venv", ".git", "__pycache__")
+
+
+@dataclass
+class IndexedFile:
+    """
+    DTO for storing a file of the index.
+    """
+
+    path: Path
+    size: int
+    mtime: float
+
+
+class FileIndex:
+    """
+    Files of a repository with their sizes and modification times.
+    """
+
+    def __init__(
+        self,
+        root_dir: Path,
+        excluded_dirs: Iterable[str] = DEFAULT_EXCLUDED_DIRS,
+        use_git: bool = True,
+    ) -> None:
+        """
+        Initialize FileIndex.
+
+        Args:
+            root_dir (Path): Root directory of the repository
+            excluded_dirs (Iterable[str]): Names of directories to skip at any depth
+            use_git (bool): List files known to git instead of walking the tree if possible
+        """
+        self._root_dir = root_dir
+        self._excluded_dirs = frozenset(excluded_dirs)
+        paths = self._list_git_files() if use_git else None
+        files = self._stat_files(paths) if paths is not None else self._walk()
+        self._files = sorted(files, key=lambda file: file.path)
+
+    @property
+    def files(self) -> list[IndexedFile]:
+        """
+        Get all files of the index.
+
+        Returns:
+            list[IndexedFile]: Files sorted by path
+        """
+        return self._files
+
+    def _list_git_files(self) -> Optional[list[Path]]:
+        """
+        Get tracked files and untracked files which are not ignored.
+
+        Returns:
+            Optional[list[Path]]: Paths to files, None if the directory is not under git
+        """
+        try:
+            stdout, _, _ = _run_console_tool(
+                "git",
+                ["ls-files", "-z", "--cached", "--others", "--exclude-standard"],
+                cwd=self._root_dir,
+            )
+        except (subprocess.CalledProcessError, OSError):
+            logger.info(f"Files of {self._root_dir} are not listed by git, walking the tree")
+            return None
+        return [self._root_dir / name for name in dict.fromkeys(stdout.split("\0")) if name]
+
+    def _stat_files(self, paths: list[Path]) -> Iterator[IndexedFile]:
+        """
+        Get sizes and modification times of existing files outside of excluded directories.
+
+        Args:
+            paths (list[Path]): Paths to files
+
+        Yields:
+            IndexedFile: File of the index
+        """
+        for path in paths:
+            if self._excluded_dirs.intersection(path.relative_to(self._root_dir).parts[:-1]):
+                continue
+            try:
+                file_stat = path.stat()
+            except OSError:
+                continue
+            if stat.S_ISREG(file_stat.st_mode):
+                yield IndexedFile(path, file_stat.st_size, file_stat.st_mtime)
+
+    def _walk(self) -> Iterator[IndexedFile]:
+        """
+        Walk the tree without descending into excluded directories.
+
+        Yields:
+            IndexedFile: File of the index
+        """
+        directories = [str(self._root_dir)]
+        while directories:
+            with os.scandir(directories.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in self._excluded_dirs:
+                            directories.append(entry.path)
+                    elif entry.is_file():
+                        file_stat = entry.stat()
+                        yield IndexedFile(Path(entry.path), file_stat.st_size, file_stat.st_mtime)
+
+    def select(
+        self, pattern: str = "*", directory: Optional[Path] = None, recursive: bool = True
+    ) -> list[Path]:
+        """
+        Get files which names match the pattern.
+
+        Args:
+            pattern (str): Shell-style pattern of file names
+            directory (Optional[Path]): Directory to look in, root directory by default
+            recursive (bool): Look in subdirectories too
+
+        Returns:
+            list[Path]: Sorted paths to files
+        """
+        directory = directory or self._root_dir
+        return [
+            file.path
+            for file in self._files
+            if fnmatch.fnmatchcase(file.path.name, pattern)
+            and (
+                file.path.is_relative_to(directory) if recursive else file.path.parent == directory
+            )
+        ]
+
+    def with_suffix(self, *suffixes: str, directory: Optional[Path] = None) -> list[Path]:
+        """
+        Get files with any of the suffixes.
+
+        Args:
+            *suffixes (str): Suffixes of files including the dot
+            directory (Optional[Path]): Directory to look in, root directory by default
+
+        Returns:
+            list[Path]: Sorted paths to files
+        """
+        directory = directory or self._root_dir
+        return [
+            file.path
+            for file in self._files
+            if file.path.suffix in suffixes and file.path.is_relative_to(directory)
+        ]
+
+    def get_directories(self) -> dict[Path, set[str]]:
+        """
+        Get directories below the root one with names of files in each of them.
+
+        Returns:
+            dict[Path, set[str]]: Names of files of each directory containing files
+        """
+        directories: dict[Path, set[str]] = {}
+        for file in self._files:
+            if file.path.parent != self._root_dir:
+                directories.setdefault(file.path.parent, set()).add(file.path.name)
+        return directories
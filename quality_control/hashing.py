@@ -0,0 +1,97 @@
+"""
+Content hashes of files used as cache keys.
+"""
+
+import hashlib
+import os
+from pathlib import Path
+from typing import Iterable
+
+EXCLUDED_DIRS = frozenset(("venv", ".git", "__pycache__", ".pytest_cache", ".mypy_cache", "build"))
+
+
+def hash_file(path: Path) -> str:
+    """
+    Get hash of the content of a file.
+
+    Args:
+        path (Path): Path to file
+
+    Returns:
+        str: Hex digest of the content
+    """
+    digest = hashlib.sha256()
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def list_files(directory: Path) -> list[Path]:
+    """
+    Get files of a directory skipping caches, virtual environments and build artifacts.
+
+    Args:
+        directory (Path): Path to directory
+
+    Returns:
+        list[Path]: Sorted paths to files
+    """
+    files = []
+    for current_dir, dir_names, file_names in os.walk(directory):
+        dir_names[:] = [name for name in dir_names if name not in EXCLUDED_DIRS]
+        files.extend(Path(current_dir) / name for name in file_names)
+    return sorted(files)
+
+
+def hash_paths(paths: Iterable[Path], root_dir: Path) -> str:
+    """
+    Get combined hash of files and directories.
+
+    Missing paths are hashed by their names only, so that creating them changes the hash.
+
+    Args:
+        paths (Iterable[Path]): Paths to files and directories
+        root_dir (Path): Root directory paths are hashed relative to
+
+    Returns:
+        str: Hex digest of names and contents of all files
+    """
+    digest = hashlib.sha256()
+    for path in paths:
+        files = list_files(path) if path.is_dir() else [path]
+        for file in files:
+            digest.update(file.relative_to(root_dir).as_posix().encode("utf-8"))
+            digest.update(hash_file(file).encode("utf-8") if file.exists() else b"-")
+    return digest.hexdigest()
+
+
+def hash_strings(*values: str) -> str:
+    """
+    Get combined hash of several strings.
+
+    Args:
+        *values (str): Strings to hash
+
+    Returns:
+        str: Hex digest of all strings
+    """
+    digest = hashlib.sha256()
+    for value in values:
+        digest.update(value.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def hash_git_blob(path: Path) -> str:
+    """
+    Get object id git assigns to the content of a file.
+
+    Args:
+        path (Path): Path to file
+
+    Returns:
+        str: Hex digest of the blob object
+    """
+    content = path.read_bytes()
+    return hashlib.sha1(b"blob %d\0" % len(content) + content, usedforsecurity=False).hexdigest()
@@ -0,0 +1,102 @@
+"""
+Files of the project imported by modules, directly or through other imported files.
+"""
+
+import ast
+from pathlib import Path
+from typing import Optional
+
+from quality_control.file_index import FileIndex
+
+
+def get_first_party_imports(module_path: Path, root_dir: Path) -> list[Path]:
+    """
+    Get files of the project a module imports, including packages on the way to them.
+
+    Args:
+        module_path (Path): Path to the module
+        root_dir (Path): Root directory of the project
+
+    Returns:
+        list[Path]: Sorted paths to imported files
+    """
+    try:
+        tree = ast.parse(module_path.read_bytes())
+    except (SyntaxError, ValueError):
+        return []
+
+    imported = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            imported.extend((root_dir, alias.name.split(".")) for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.level <= len(module_path.parents):
+            base_dir = module_path.parents[node.level - 1] if node.level else root_dir
+            parts = node.module.split(".") if node.module else []
+            imported.append((base_dir, parts))
+            imported.extend((base_dir, [*parts, alias.name]) for alias in node.names)
+
+    files = set()
+    for base_dir, parts in imported:
+        for length in range(1, len(parts) + 1):
+            package_dir = base_dir.joinpath(*parts[:length])
+            for candidate in (package_dir.with_suffix(".py"), package_dir / "__init__.py"):
+                if candidate.is_file() and candidate.is_relative_to(root_dir):
+                    files.add(candidate)
+    files.discard(module_path)
+    return sorted(files)
+
+
+def get_import_closure(
+    module_path: Path, root_dir: Path, imports: Optional[dict[Path, list[Path]]] = None
+) -> list[Path]:
+    """
+    Get files of the project a module imports directly or through other imported files.
+
+    Args:
+        module_path (Path): Path to the module
+        root_dir (Path): Root directory of the project
+        imports (Optional[dict[Path, list[Path]]]): Known direct imports of files to reuse
+
+    Returns:
+        list[Path]: Sorted paths to imported files
+    """
+    if imports is None:
+        imports = {}
+    closure = set()
+    pending = [module_path]
+    while pending:
+        path = pending.pop()
+        if path not in imports:
+            imports[path] = get_first_party_imports(path, root_dir)
+        for imported_path in imports[path]:
+            if imported_path not in closure:
+                closure.add(imported_path)
+                pending.append(imported_path)
+    closure.discard(module_path)
+    return sorted(closure)
+
+
+def get_external_imports(
+    directory: Path,
+    root_dir: Path,
+    file_index: FileIndex,
+    imports: Optional[dict[Path, list[Path]]] = None,
+) -> list[Path]:
+    """
+    Get files outside of a directory its modules import, directly or not.
+
+    Args:
+        directory (Path): Directory of a lab or an addon
+        root_dir (Path): Root directory of the project
+        file_index (FileIndex): Files of the project
+        imports (Optional[dict[Path, list[Path]]]): Known direct imports of files to reuse
+
+    Returns:
+        list[Path]: Sorted paths to imported files
+    """
+    if imports is None:
+        imports = {}
+    imported = set()
+    for module_path in file_index.with_suffix(".py", directory=directory):
+        imported.update(get_import_closure(module_path, root_dir, imports))
+    return sorted(path for path in imported if not path.is_relative_to(directory))
@@ -0,0 +1,69 @@
+"""
+Split results of a single pytest session into per-lab results.
+"""
+
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+
+def get_testcase_lab(testcase: ET.Element) -> str:
+    """
+    Get name of the lab a test case belongs to.
+
+    Args:
+        testcase (ET.Element): testcase element of a JUnit XML report
+
+    Returns:
+        str: Name of the top-level folder of the test module
+    """
+    if file_path := testcase.get("file"):
+        return Path(file_path).parts[0]
+    # errors of collecting a module have no class name, the name is the one of the module
+    return (testcase.get("classname") or testcase.get("name", "")).split(".")[0]
+
+
+def split_results_by_labs(report_path: Path, labs_names: list[str]) -> dict[str, int]:
+    """
+    Get a pytest-like exit code for each lab from a JUnit XML report.
+
+    Args:
+        report_path (Path): Path to JUnit XML report
+        labs_names (list[str]): Names of labs that took part in the session
+
+    Returns:
+        dict[str, int]: 0 if tests of a lab passed, 1 if some failed, 5 if no tests were run
+    """
+    collected = dict.fromkeys(labs_names, 0)
+    failed = dict.fromkeys(labs_names, 0)
+
+    for testcase in ET.parse(report_path).getroot().iter("testcase"):
+        lab_name = get_testcase_lab(testcase)
+        if lab_name not in collected:
+            continue
+        collected[lab_name] += 1
+        if testcase.find("failure") is not None or testcase.find("error") is not None:
+            failed[lab_name] += 1
+
+    return {
+        lab_name: 5 if not collected[lab_name] else int(bool(failed[lab_name]))
+        for lab_name in labs_names
+    }
+
+
+def sum_durations_by_labs(report_path: Path, labs_names: list[str]) -> dict[str, float]:
+    """
+    Get total duration of tests of each lab from a JUnit XML report.
+
+    Args:
+        report_path (Path): Path to JUnit XML report
+        labs_names (list[str]): Names of labs that took part in the session
+
+    Returns:
+        dict[str, float]: Duration of tests of each lab in seconds
+    """
+    durations = dict.fromkeys(labs_names, 0.0)
+    for testcase in ET.parse(report_path).getroot().iter("testcase"):
+        lab_name = get_testcase_lab(testcase)
+        if lab_name in durations:
+            durations[lab_name] += float(testcase.get("time", 0.0))
+    return durations
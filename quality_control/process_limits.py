@@ -0,0 +1,198 @@
+"""
+Run processes with wall-clock timeout and resource limits.
+"""
+
+import os
+import platform
+import signal
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import IO
+
+from pydantic.dataclasses import dataclass
+
+from quality_control.cli_unifier import convert_raw_output_to_str
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - not available on Windows
+    resource = None  # type: ignore
+
+LIMITS_WRAPPER = """
+import os
+import resource
+import sys
+
+for name, value in zip(("RLIMIT_AS", "RLIMIT_CPU"), sys.argv[1:3]):
+    if value:
+        resource.setrlimit(getattr(resource, name), (int(value), int(value)))
+os.execvp(sys.argv[3], sys.argv[3:])
+"""
+
+
+@dataclass
+class ResourceLimits:
+    """
+    DTO for storing limits of a process.
+    """
+
+    timeout: float | None = None
+    memory_mb: int | None = None
+    cpu_seconds: int | None = None
+
+
+@dataclass
+class LimitedRunResult:
+    """
+    DTO for storing outcome and resource usage of a process.
+    """
+
+    stdout: str
+    stderr: str
+    return_code: int
+    wall_time: float
+    cpu_time: float | None = None
+    max_rss_mb: float | None = None
+    timed_out: bool = False
+
+
+def wrap_with_limits(options: list[str], limits: ResourceLimits) -> list[str]:
+    """
+    Get command line applying resource limits before replacing itself with the command.
+
+    Limits are set by an interpreter exec-ing the command rather than in preexec_fn,
+    which is not safe to use while other threads of this process are running.
+
+    Args:
+        options (list[str]): Command line to execute
+        limits (ResourceLimits): Limits of the process
+
+    Returns:
+        list[str]: Command line to execute, unchanged if there is nothing to set
+    """
+    if resource is None or (limits.memory_mb is None and limits.cpu_seconds is None):
+        return options
+    memory = str(limits.memory_mb * 1024 * 1024) if limits.memory_mb is not None else ""
+    cpu = str(limits.cpu_seconds) if limits.cpu_seconds is not None else ""
+    return [sys.executable, "-c", LIMITS_WRAPPER, memory, cpu, *options]
+
+
+def convert_max_rss(max_rss: int) -> float:
+    """
+    Convert peak resident set size reported by the OS into megabytes.
+
+    Args:
+        max_rss (int): ru_maxrss value, kilobytes on Linux and bytes on macOS
+
+    Returns:
+        float: Peak resident set size in megabytes
+    """
+    if platform.system() == "Darwin":
+        return max_rss / 1024 / 1024
+    return max_rss / 1024
+
+
+def read_output(output: IO[bytes]) -> str:
+    """
+    Read captured output of a finished process.
+
+    Args:
+        output (IO[bytes]): Temporary file the output was written to
+
+    Returns:
+        str: Output of the process
+    """
+    output.seek(0)
+    return convert_raw_output_to_str(output.read())
+
+
+def _run_with_limits_posix(
+    options: list[str], cwd: Path, limits: ResourceLimits
+) -> LimitedRunResult:
+    """
+    Run process in a new process group and collect its resource usage with wait4.
+
+    Args:
+        options (list[str]): Command line to execute
+        cwd (Path): Working directory of the process
+        limits (ResourceLimits): Limits of the process
+
+    Returns:
+        LimitedRunResult: Outcome and resource usage of the process
+    """
+    timed_out = threading.Event()
+
+    def kill_group(pid: int) -> None:
+        timed_out.set()
+        try:
+            os.killpg(pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+
+    with tempfile.TemporaryFile() as stdout, tempfile.TemporaryFile() as stderr:
+        start = time.monotonic()
+        with subprocess.Popen(
+            wrap_with_limits(options, limits),
+            cwd=cwd,
+            stdout=stdout,
+            stderr=stderr,
+            start_new_session=True,
+        ) as process:
+            timer = threading.Timer(limits.timeout or 0, kill_group, [process.pid])
+            if limits.timeout is not None:
+                timer.start()
+            _, status, usage = os.wait4(process.pid, 0)
+            timer.cancel()
+            process.returncode = os.waitstatus_to_exitcode(status)
+        wall_time = time.monotonic() - start
+
+        return LimitedRunResult(
+            stdout=read_output(stdout),
+            stderr=read_output(stderr),
+            return_code=process.returncode,
+            wall_time=wall_time,
+            cpu_time=usage.ru_utime + usage.ru_stime,
+            max_rss_mb=convert_max_rss(usage.ru_maxrss),
+            timed_out=timed_out.is_set(),
+        )
+
+
+def run_with_limits(options: list[str], cwd: Path, limits: ResourceLimits) -> LimitedRunResult:
+    """
+    Run process killing it with all its children when the timeout expires.
+
+    Memory and CPU limits and resource usage are available on POSIX systems only.
+
+    Args:
+        options (list[str]): Command line to execute
+        cwd (Path): Working directory of the process
+        limits (ResourceLimits): Limits of the process
+
+    Returns:
+        LimitedRunResult: Outcome and resource usage of the process
+    """
+    if resource is not None:
+        return _run_with_limits_posix(options, cwd, limits)
+
+    start = time.monotonic()
+    with subprocess.Popen(
+        options, cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.PIPE
+    ) as process:
+        try:
+            stdout, stderr = process.communicate(timeout=limits.timeout)
+            timed_out = False
+        except subprocess.TimeoutExpired:
+            process.kill()
+            stdout, stderr = process.communicate()
+            timed_out = True
+    return LimitedRunResult(
+        stdout=convert_raw_output_to_str(stdout),
+        stderr=convert_raw_output_to_str(stderr),
+        return_code=process.returncode,
+        wall_time=time.monotonic() - start,
+        timed_out=timed_out,
+    )
@@ -79,6 +79,7 @@ class ProjectConfigDTO:
     repository: Repository = field(default_factory=Repository)
     stubs_config: Stub = field(default_factory=Stub)
     newline_config: list[str] = field(default_factory=list)
+    init_config: list[str] = field(default_factory=list)
 
 
 class ProjectConfig(ProjectConfigDTO):
@@ -249,3 +250,12 @@ class ProjectConfig(ProjectConfigDTO):
             list[str]: List of patterns to exclude.
         """
         return self._dto.newline_config
+
+    def get_init_config(self) -> list[str]:
+        """
+        Returns configuration for __init__.py check.
+
+        Returns:
+            list[str]: Names of directories to exclude.
+        """
+        return self._dto.init_config
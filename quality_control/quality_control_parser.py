@@ -17,3 +17,8 @@ class QualityControlArgumentsParser(Tap):
     toml_config_path: Optional[Path] = None
     root_dir: Optional[Path] = Path(os.getcwd())
     project_config_path: Optional[Path] = None
+    jobs: int = os.cpu_count() or 1
+    shard: Optional[str] = None
+    changed_since: Optional[str] = None
+    use_cache: bool = False
+    cache_size_mb: int = 256
@@ -0,0 +1,283 @@
+"""
+Run all quality checks as a dependency graph.
+"""
+
+# pylint: disable=duplicate-code
+
+import asyncio
+import sys
+import time
+from graphlib import TopologicalSorter
+
+from logging518.config import fileConfig
+from pydantic.dataclasses import dataclass
+
+from quality_control.cli_unifier import (
+    _run_console_tool_async,
+    handles_console_error_async,
+    log_output,
+)
+from quality_control.console_logging import get_child_logger
+from quality_control.project_config import ProjectConfig
+from quality_control.quality_control_parser import QualityControlArgumentsParser
+
+logger = get_child_logger(__file__)
+
+
+@dataclass
+class Check:
+    """
+    DTO for storing a check run by the orchestrator.
+    """
+
+    name: str
+    module: str
+    depends_on: tuple[str, ...] = ()
+    shared_arguments: bool = True
+
+
+@dataclass
+class CheckResult:
+    """
+    DTO for storing outcome of a check.
+    """
+
+    name: str
+    status: str
+    duration: float = 0
+
+
+# stubs are written into directories of labs, so checks reading them wait for the stubs
+READS_LABS = ("generate_labs_stubs",)
+
+CHECKS = (
+    Check("generate_labs_stubs", "quality_control.generate_stubs.generate_labs_stubs"),
+    Check("check_black", "quality_control.static_checks.check_black", depends_on=READS_LABS),
+    Check(
+        "check_init",
+        "quality_control.static_checks.check_init",
+        depends_on=READS_LABS,
+        shared_arguments=False,
+    ),
+    Check("check_newline", "quality_control.static_checks.check_newline", depends_on=READS_LABS),
+    Check("check_requirements", "quality_control.static_checks.check_requirements"),
+    Check("check_doc8", "quality_control.static_checks.check_doc8"),
+    Check(
+        "check_docstrings", "quality_control.static_checks.check_docstrings", depends_on=READS_LABS
+    ),
+    Check("check_spelling", "quality_control.spellcheck.check_spelling", depends_on=READS_LABS),
+    Check("check_flake8", "quality_control.static_checks.check_flake8", depends_on=READS_LABS),
+    Check("check_mypy", "quality_control.static_checks.check_mypy", depends_on=READS_LABS),
+    Check("check_lint", "quality_control.static_checks.check_lint", depends_on=READS_LABS),
+    Check(
+        "check_actual_stubs",
+        "quality_control.static_checks.check_actual_stubs",
+        depends_on=READS_LABS,
+    ),
+    Check("run_start", "quality_control.run_start", depends_on=READS_LABS),
+    Check("run_tests", "quality_control.run_tests", depends_on=READS_LABS),
+    Check(
+        "coverage_analyzer",
+        "quality_control.collect_coverage.coverage_analyzer",
+        depends_on=("run_tests",),
+    ),
+)
+
+
+class RunAllArgumentsParser(QualityControlArgumentsParser):
+    """
+    CLI for running all checks.
+    """
+
+    only: list[str] = []
+    skip: list[str] = []
+    fail_fast: bool = False
+
+    def process_args(self) -> None:
+        """
+        Validate names of checks.
+        """
+        known_names = {check.name for check in CHECKS}
+        if unknown_names := sorted(set(self.only + self.skip) - known_names):
+            self.error(f"Unknown checks: {', '.join(unknown_names)}")
+
+
+def select_checks(only: list[str], skip: list[str]) -> list[Check]:
+    """
+    Get enabled checks ordered so that every check follows its dependencies.
+
+    Args:
+        only (list[str]): Names of checks to run, empty for all checks
+        skip (list[str]): Names of checks not to run
+
+    Returns:
+        list[Check]: Checks to run
+    """
+    checks = {
+        check.name: check
+        for check in CHECKS
+        if (not only or check.name in only) and check.name not in skip
+    }
+    graph = {
+        name: [dependency for dependency in check.depends_on if dependency in checks]
+        for name, check in checks.items()
+    }
+    return [checks[name] for name in TopologicalSorter(graph).static_order()]
+
+
+def split_jobs(jobs: int, checks_count: int) -> tuple[int, int]:
+    """
+    Split the budget of jobs between checks running at once and workers of each check.
+
+    Args:
+        jobs (int): Total number of jobs
+        checks_count (int): Number of checks to run
+
+    Returns:
+        tuple[int, int]: Number of checks running at once and number of jobs of each check
+    """
+    concurrent_checks = max(min(jobs, checks_count), 1)
+    return concurrent_checks, max(jobs // concurrent_checks, 1)
+
+
+def prepare_check_args(check: Check, args: RunAllArgumentsParser, check_jobs: int) -> list[str]:
+    """
+    Build arguments for the interpreter to run a check.
+
+    Args:
+        check (Check): Check to run
+        args (RunAllArgumentsParser): Arguments of the orchestrator
+        check_jobs (int): Number of jobs of the check
+
+    Returns:
+        list[str]: Arguments for the interpreter
+    """
+    root_dir = args.root_dir.resolve()
+    if not check.shared_arguments:
+        check_args = ["-m", check.module, "--root_dir", str(root_dir)]
+        if args.project_config_path is not None:
+            check_args.extend(("--project_config_path", str(args.project_config_path)))
+        return check_args
+    check_args = ["-m", check.module, "--root-dir", str(root_dir), "--jobs", str(check_jobs)]
+    options: dict[str, object] = {
+        "--toml-config-path": args.toml_config_path,
+        "--project-config-path": args.project_config_path,
+        "--shard": args.shard,
+        "--changed-since": args.changed_since,
+    }
+    for option, value in options.items():
+        if value is not None:
+            check_args.extend((option, str(value)))
+    if args.use_cache:
+        check_args.extend(("--use-cache", "--cache-size-mb", str(args.cache_size_mb)))
+    return check_args
+
+
+@handles_console_error_async()
+async def run_check_async(
+    check: Check, args: RunAllArgumentsParser, check_jobs: int
+) -> tuple[str, str, int]:
+    """
+    Run a check in a separate interpreter.
+
+    Args:
+        check (Check): Check to run
+        args (RunAllArgumentsParser): Arguments of the orchestrator
+        check_jobs (int): Number of jobs of the check
+
+    Returns:
+        tuple[str, str, int]: stdout, stderr, exit code
+    """
+    return await _run_console_tool_async(
+        sys.executable, prepare_check_args(check, args, check_jobs), cwd=args.root_dir.resolve()
+    )
+
+
+def run_checks(checks: list[Check], args: RunAllArgumentsParser) -> list[CheckResult]:
+    """
+    Run checks as soon as their dependencies pass, several of them at once.
+
+    Checks depending on failed ones are skipped, as well as all checks not started yet
+    after a failure if the run is to stop early. The jobs are shared between checks
+    running at once, so that they do not use more processes than requested together.
+
+    Args:
+        checks (list[Check]): Checks ordered so that every check follows its dependencies
+        args (RunAllArgumentsParser): Arguments of the orchestrator
+
+    Returns:
+        list[CheckResult]: Outcomes of checks in the order of checks
+    """
+
+    async def run_all() -> list[CheckResult]:
+        concurrent_checks, check_jobs = split_jobs(args.jobs, len(checks))
+        semaphore = asyncio.Semaphore(concurrent_checks)
+        tasks: dict[str, asyncio.Task[CheckResult]] = {}
+        failed = asyncio.Event()
+
+        async def run(check: Check) -> CheckResult:
+            for dependency in check.depends_on:
+                if dependency in tasks and (await tasks[dependency]).status != "passed":
+                    return CheckResult(check.name, "skipped")
+            async with semaphore:
+                if args.fail_fast and failed.is_set():
+                    return CheckResult(check.name, "skipped")
+                logger.info(f"Starting {check.name}")
+                start = time.monotonic()
+                stdout, stderr, return_code = await run_check_async(check, args, check_jobs)
+                duration = time.monotonic() - start
+            if return_code:
+                failed.set()
+                log_output(f"{check.name} stdout", stdout)
+                log_output(f"{check.name} stderr", stderr)
+                return CheckResult(check.name, "failed", duration)
+            return CheckResult(check.name, "passed", duration)
+
+        for check in checks:
+            tasks[check.name] = asyncio.create_task(run(check))
+        return list(await asyncio.gather(*tasks.values()))
+
+    return asyncio.run(run_all())
+
+
+def report_results(results: list[CheckResult]) -> None:
+    """
+    Print status and duration of every check.
+
+    Args:
+        results (list[CheckResult]): Outcomes of checks
+    """
+    width = max((len(result.name) for result in results), default=0)
+    rows = [f"{'Check':<{width}}  {'Status':<7}  Duration"]
+    rows.extend(
+        f"{result.name:<{width}}  {result.status:<7}  {result.duration:7.1f}s" for result in results
+    )
+    logger.info("\n" + "\n".join(rows))
+
+
+def main() -> None:
+    """
+    Entrypoint for running all checks.
+    """
+    args = RunAllArgumentsParser(underscores_to_dashes=True).parse_args()
+
+    root_dir = args.root_dir.resolve()
+    toml_config = (args.toml_config_path or (root_dir / "pyproject.toml")).resolve()
+
+    project_config_path = (args.project_config_path or (root_dir / "project_config.json")).resolve()
+
+    project_config = ProjectConfig(project_config_path)
+
+    fileConfig(toml_config)
+
+    logger.info(f"Current scope: {[lab.name for lab in project_config.get_labs()]}")
+
+    results = run_checks(select_checks(args.only, args.skip), args)
+    report_results(results)
+    if any(result.status == "failed" for result in results):
+        logger.error("Some of checks were failed. Fix it.")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
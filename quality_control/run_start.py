@@ -2,24 +2,43 @@
 Run start.
 """
 
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Optional
 
 from logging518.config import fileConfig
 
+from quality_control.changed_labs import select_changed_names
+from quality_control.check_start_content import check_labs_start_content, StartContentResult
 from quality_control.cli_unifier import (
     _run_console_tool,
     choose_python_exe,
     handles_console_error,
+    log_console_result,
 )
 from quality_control.collect_coverage.run_coverage import get_target_score
 from quality_control.console_logging import get_child_logger
-from quality_control.constants import PROJECT_ROOT
+from quality_control.process_limits import LimitedRunResult, ResourceLimits, run_with_limits
 from quality_control.project_config import ProjectConfig
 from quality_control.quality_control_parser import QualityControlArgumentsParser
+from quality_control.verdict_cache import VerdictCache
 
 logger = get_child_logger(__file__)
 
 
+class RunStartArgumentsParser(QualityControlArgumentsParser):
+    """
+    CLI for start.py checks.
+    """
+
+    # start.py of labs run one by one unless parallel runs are requested explicitly
+    jobs: int = 1
+    timeout: Optional[float] = None
+    memory_limit_mb: Optional[int] = None
+    cpu_limit_seconds: Optional[int] = None
+
+
 @handles_console_error()
 def run_start(lab_name: str, root_dir: Path) -> tuple[str, str, int]:
     """
@@ -39,38 +58,147 @@ def run_start(lab_name: str, root_dir: Path) -> tuple[str, str, int]:
     )
 
 
-@handles_console_error()
-def check_start_content(lab_name: str, root_dir: Path) -> tuple[str, str, int]:
+def run_start_with_limits(
+    lab_name: str, root_dir: Path, limits: ResourceLimits
+) -> LimitedRunResult:
     """
-    Check the content of start.py script using check_start_content.py script.
+    Run start.py script in the specified lab directory within resource limits.
 
     Args:
         lab_name (str): Name of the lab directory.
+        root_dir (Path): Root directory of the project.
+        limits (ResourceLimits): Limits of the start.py process.
 
     Returns:
-        tuple[str, str, int]: stdout, stderr, exit code
+        LimitedRunResult: Outcome and resource usage of start.py
     """
-    start_py_file = root_dir / lab_name / "start.py"
-    with start_py_file.open() as f:
-        start_py_content = f.read()
+    logger.info(f"Running start.py checks for lab {lab_name}")
+    return run_with_limits(
+        [str(choose_python_exe(lab_path=root_dir)), "start.py"], root_dir / lab_name, limits
+    )
 
-    return _run_console_tool(
-        str(choose_python_exe(lab_path=root_dir)),
-        [
-            str(Path(PROJECT_ROOT, "check_start_content.py")),
-            "--start_py_content",
-            start_py_content,
-        ],
-        cwd=root_dir,
-        debug=True,
+
+def run_labs_with_limits(
+    labs_names: list[str], root_dir: Path, limits: ResourceLimits, jobs: int
+) -> dict[str, LimitedRunResult]:
+    """
+    Run start.py scripts of several labs at once.
+
+    Args:
+        labs_names (list[str]): Names of the lab directories.
+        root_dir (Path): Root directory of the project.
+        limits (ResourceLimits): Limits of each start.py process.
+        jobs (int): Maximum number of start.py processes running at the same time.
+
+    Returns:
+        dict[str, LimitedRunResult]: Outcome and resource usage of start.py for each lab
+    """
+    with ThreadPoolExecutor(max_workers=max(jobs, 1)) as executor:
+        results = executor.map(
+            lambda lab_name: run_start_with_limits(lab_name, root_dir, limits), labs_names
+        )
+        return dict(zip(labs_names, results))
+
+
+def report_start_result(lab_name: str, result: LimitedRunResult, limits: ResourceLimits) -> bool:
+    """
+    Print outcome and resource usage of start.py of a lab.
+
+    Args:
+        lab_name (str): Name of the lab directory.
+        result (LimitedRunResult): Outcome and resource usage of start.py
+        limits (ResourceLimits): Limits start.py was run with
+
+    Returns:
+        bool: True if start.py finished successfully
+    """
+    cpu_time = f"{result.cpu_time:.2f}s" if result.cpu_time is not None else "n/a"
+    max_rss = f"{result.max_rss_mb:.1f}MB" if result.max_rss_mb is not None else "n/a"
+    logger.info(
+        f"start.py of lab {lab_name}: wall time {result.wall_time:.2f}s, "
+        f"CPU time {cpu_time}, peak RSS {max_rss}"
     )
+    if result.timed_out:
+        logger.error(f"start.py of lab {lab_name} was killed after {limits.timeout}s timeout.")
+    return log_console_result((result.stdout, result.stderr, result.return_code))
+
+
+def report_content_result(result: StartContentResult) -> bool:
+    """
+    Print result of start.py content check of a lab.
+
+    Args:
+        result (StartContentResult): Result of the check
+
+    Returns:
+        bool: True if the check passed
+    """
+    if result.passed:
+        logger.info(f"Check of start.py content of lab {result.lab_name} passed")
+    else:
+        logger.error(f"Check of start.py content of lab {result.lab_name} failed: {result.message}")
+    return result.passed
+
+
+def report_cached_results(cached_results: dict[str, tuple[str, str, int]]) -> None:
+    """
+    Print stored outcomes of start.py of labs which did not change since their green run.
+
+    Args:
+        cached_results (dict[str, tuple[str, str, int]]): Stored outcomes of labs
+    """
+    for lab_name, result in cached_results.items():
+        logger.info(f"Replaying start.py checks for lab {lab_name}")
+        log_console_result(result)
+        logger.info(f"Check calling lab {lab_name} passed")
+
+
+def run_labs_in_parallel(
+    args: RunStartArgumentsParser,
+    labs_names: list[str],
+    content_results: dict[str, StartContentResult],
+    cache: VerdictCache | None,
+) -> bool:
+    """
+    Run start.py checks of labs at once within resource limits.
+
+    Args:
+        args (RunStartArgumentsParser): Parsed arguments.
+        labs_names (list[str]): Names of the lab directories.
+        content_results (dict[str, StartContentResult]): Results of start.py content checks.
+        cache (VerdictCache | None): Cache to store outcomes of passed labs to.
+
+    Returns:
+        bool: True if checks passed for every lab
+    """
+    root_dir = args.root_dir.resolve()
+    limits = ResourceLimits(
+        timeout=args.timeout, memory_mb=args.memory_limit_mb, cpu_seconds=args.cpu_limit_seconds
+    )
+    all_passed = True
+    for lab_name, limited_result in run_labs_with_limits(
+        labs_names, root_dir, limits, args.jobs
+    ).items():
+        if not report_start_result(lab_name, limited_result, limits):
+            all_passed = False
+            continue
+        logger.info(f"Check calling lab {lab_name} passed")
+        if not report_content_result(content_results[lab_name]):
+            all_passed = False
+            continue
+        if cache:
+            cache.store(
+                lab_name,
+                (limited_result.stdout, limited_result.stderr, limited_result.return_code),
+            )
+    return all_passed
 
 
 def main() -> None:
     """
     Main function to run start.py checks for each lab.
     """
-    args = QualityControlArgumentsParser(underscores_to_dashes=True).parse_args()
+    args = RunStartArgumentsParser(underscores_to_dashes=True).parse_args()
 
     root_dir = args.root_dir.resolve()
     toml_config = (args.toml_config_path or (root_dir / "pyproject.toml")).resolve()
@@ -81,19 +209,41 @@ def main() -> None:
 
     fileConfig(toml_config)
 
-    for lab in project_config.get_labs():
-        logger.info(f"Running start.py checks for lab {lab.name}")
+    labs_names = select_changed_names(
+        [lab.name for lab in project_config.get_labs()], root_dir, args.changed_since
+    )
+    labs_arguments = [(lab_name, ["start.py"]) for lab_name in labs_names]
+    cache = VerdictCache(root_dir, "run_start", args.cache_size_mb) if args.use_cache else None
+    if cache:
+        cached_results, labs_arguments = cache.partition(labs_arguments)
+        report_cached_results(cached_results)
+
+    labs_names = []
+    for lab_name, _ in labs_arguments:
+        if get_target_score(root_dir / lab_name) == 0:
+            logger.info(f"Skipping stage for lab {lab_name}. Target score is 0.")
+            continue
+        labs_names.append(lab_name)
+    content_results = check_labs_start_content(labs_names, root_dir)
+
+    if args.jobs > 1 or any((args.timeout, args.memory_limit_mb, args.cpu_limit_seconds)):
+        if not run_labs_in_parallel(args, labs_names, content_results, cache):
+            logger.error("\nSome of start.py checks were failed. Fix it.")
+            sys.exit(1)
+        logger.info("All start.py checks passed.")
+        return
 
-        target_score = get_target_score(root_dir / lab.name)
+    for lab_name in labs_names:
+        logger.info(f"Running start.py checks for lab {lab_name}")
 
-        if target_score == 0:
-            logger.info("Skipping stage. Target score is 0.")
-            continue
-        run_start(lab.name, root_dir=root_dir)
+        result = run_start(lab_name, root_dir=root_dir)
 
-        logger.info(f"Check calling lab {lab.name} passed")
+        logger.info(f"Check calling lab {lab_name} passed")
 
-        check_start_content(lab.name, root_dir)
+        if not report_content_result(content_results[lab_name]):
+            sys.exit(1)
+        if cache:
+            cache.store(lab_name, result)
 
     logger.info("All start.py checks passed.")
 
@@ -2,22 +2,44 @@
 Run tests for each lab using pytest.
 """
 
+import sys
 from pathlib import Path
 
 from logging518.config import fileConfig
 
+from quality_control.changed_labs import select_changed_names
 from quality_control.cli_unifier import (
     _run_console_tool,
+    _run_console_tool_async,
     choose_python_exe,
     handles_console_error,
+    handles_console_error_async,
+    log_console_result,
+    run_concurrently,
+)
+from quality_control.collect_coverage.coverage_analyzer import check_coverage_results
+from quality_control.collect_coverage.run_coverage import (
+    CoverageCreateReportError,
+    create_coverage_report,
+    get_coverage_data_path,
+    get_coverage_env,
+    get_target_score,
+    prepare_coverage_tracing_args,
 )
-from quality_control.collect_coverage.run_coverage import get_target_score
 from quality_control.console_logging import get_child_logger
+from quality_control.junit_report import split_results_by_labs, sum_durations_by_labs
 from quality_control.project_config import ProjectConfig
 from quality_control.quality_control_parser import QualityControlArgumentsParser
+from quality_control.sharding import LabDurations, write_shard_results
+from quality_control.test_durations.store import get_default_db_path, get_labs_durations
+from quality_control.test_impact.index import build_index, select_impacted_tests
+from quality_control.verdict_cache import VerdictCache
 
 logger = get_child_logger(__file__)
 
+DURATIONS_PLUGIN = "quality_control.test_durations.plugin"
+IMPACT_PLUGIN = "quality_control.test_impact.plugin"
+
 
 class CommandLineInterface(QualityControlArgumentsParser):
     """
@@ -26,6 +48,27 @@ class CommandLineInterface(QualityControlArgumentsParser):
 
     lab_path: str | None = None
     pytest_label: str | None = None
+    single_session: bool = False
+    with_coverage: bool = False
+    impacted_only: bool = False
+
+    def process_args(self) -> None:
+        """
+        Reject modes that cannot be combined with each other.
+        """
+        if self.impacted_only and not self.changed_since:
+            self.error("--impacted-only requires --changed-since")
+        if self.impacted_only and self.single_session:
+            self.error("--impacted-only cannot be combined with --single-session")
+        if not self.with_coverage:
+            return
+        conflicting = [
+            f"--{name.replace('_', '-')}"
+            for name in ("single_session", "use_cache", "impacted_only")
+            if getattr(self, name)
+        ]
+        if conflicting:
+            self.error(f"--with-coverage cannot be combined with {', '.join(conflicting)}")
 
 
 def prepare_pytest_args(
@@ -64,6 +107,19 @@ def prepare_pytest_args(
     return pytest_args
 
 
+def prepare_pytest_command(pytest_args: list[str]) -> list[str]:
+    """
+    Build the arguments for the interpreter to run pytest with recording of durations.
+
+    Args:
+        pytest_args (list[str]): Arguments for pytest.
+
+    Returns:
+        list[str]: List of arguments for the interpreter.
+    """
+    return ["-m", "pytest", "-p", DURATIONS_PLUGIN, *pytest_args]
+
+
 @handles_console_error(ok_codes=(0, 5))
 def run_pytest(root_dir: Path, pytest_args: list[str]) -> tuple[str, str, int]:
     """
@@ -75,7 +131,114 @@ def run_pytest(root_dir: Path, pytest_args: list[str]) -> tuple[str, str, int]:
     Returns:
         tuple[str, str, int]: stdout, stderr, exit code
     """
-    args = ["-m", "pytest", *pytest_args]
+    args = prepare_pytest_command(pytest_args)
+    return _run_console_tool(
+        str(choose_python_exe(lab_path=root_dir)), args, cwd=root_dir, debug=True
+    )
+
+
+@handles_console_error_async(ok_codes=(0, 5))
+async def run_pytest_async(root_dir: Path, pytest_args: list[str]) -> tuple[str, str, int]:
+    """
+    Run pytest with the given arguments without blocking other runs.
+
+    Args:
+        pytest_args (list[str]): Arguments for pytest.
+
+    Returns:
+        tuple[str, str, int]: stdout, stderr, exit code
+    """
+    args = prepare_pytest_command(pytest_args)
+    return await _run_console_tool_async(
+        str(choose_python_exe(lab_path=root_dir)), args, cwd=root_dir, debug=True
+    )
+
+
+@handles_console_error_async(ok_codes=(0, 5))
+async def run_pytest_with_coverage_async(
+    root_dir: Path, lab_name: str, pytest_args: list[str]
+) -> tuple[str, str, int]:
+    """
+    Run pytest under coverage tracing sources of a lab into its own data file.
+
+    Lines executed by each test are recorded in a separate coverage context.
+
+    Args:
+        root_dir (Path): Root directory of the project.
+        lab_name (str): Name of the lab.
+        pytest_args (list[str]): Arguments for pytest.
+
+    Returns:
+        tuple[str, str, int]: stdout, stderr, exit code
+    """
+    artifacts_path = root_dir / "build" / "coverage"
+    artifacts_path.mkdir(parents=True, exist_ok=True)
+    args = [
+        *prepare_coverage_tracing_args(lab_name),
+        *prepare_pytest_command(["-p", IMPACT_PLUGIN, *pytest_args]),
+    ]
+    return await _run_console_tool_async(
+        str(choose_python_exe(lab_path=root_dir)),
+        args,
+        cwd=root_dir,
+        debug=True,
+        env=get_coverage_env(get_coverage_data_path(artifacts_path, lab_name)),
+    )
+
+
+def prepare_single_session_pytest_args(
+    labs_target_scores: list[tuple[str, int]],
+    project_config: ProjectConfig,
+    junit_xml_path: Path,
+) -> list[str]:
+    """
+    Build the arguments for running tests of several labs in one pytest session.
+
+    Args:
+        labs_target_scores (list[tuple[str, int]]): Pairs of lab name and target score.
+        project_config (ProjectConfig): Project configuration.
+        junit_xml_path (Path): Path to JUnit XML report of the session.
+
+    Returns:
+        list[str]: List of arguments for pytest.
+    """
+    marker_expression = " or ".join(
+        f"(mark{target_score} and {lab_name})" for lab_name, target_score in labs_target_scores
+    )
+    pytest_args = [
+        "-m",
+        marker_expression,
+        "--capture=no",
+        "--continue-on-collection-errors",
+        f"--junitxml={junit_xml_path}",
+    ]
+
+    ignored_folders: dict[str, None] = {}
+    for lab_name, _ in labs_target_scores:
+        lab_config = project_config.get_lab(lab_name)
+        if lab_config and lab_config.settings and lab_config.settings.ignore:
+            ignored_folders.update(dict.fromkeys(lab_config.settings.ignore))
+    pytest_args.extend(f"--ignore={folder}" for folder in ignored_folders)
+
+    logger.info(pytest_args)
+    return pytest_args
+
+
+@handles_console_error(ok_codes=(0, 1, 5))
+def run_pytest_session(root_dir: Path, pytest_args: list[str]) -> tuple[str, str, int]:
+    """
+    Run pytest session that may contain failed tests of some labs.
+
+    Errors of collecting tests of a lab are reported as failed tests of that lab,
+    so that tests of other labs are still run.
+
+    Args:
+        pytest_args (list[str]): Arguments for pytest.
+
+    Returns:
+        tuple[str, str, int]: stdout, stderr, exit code
+    """
+    args = prepare_pytest_command(pytest_args)
     return _run_console_tool(
         str(choose_python_exe(lab_path=root_dir)), args, cwd=root_dir, debug=True
     )
@@ -102,6 +265,302 @@ def check_skip(root_dir: Path, lab_path: str) -> bool:
     return False
 
 
+def collect_labs_target_scores(root_dir: Path, labs_names: list[str]) -> list[tuple[str, int]]:
+    """
+    Get target scores of every lab that is not skipped.
+
+    Args:
+        root_dir (Path): Root directory of the project.
+        labs_names (list[str]): Names of labs to run tests for.
+
+    Returns:
+        list[tuple[str, int]]: Pairs of lab name and target score.
+    """
+    return [
+        (lab_name, get_target_score(root_dir / lab_name))
+        for lab_name in labs_names
+        if not check_skip(root_dir=root_dir, lab_path=lab_name)
+    ]
+
+
+def collect_labs_pytest_args(
+    root_dir: Path, labs_names: list[str], project_config_path: Path
+) -> list[tuple[str, list[str]]]:
+    """
+    Build pytest arguments for every lab that is not skipped.
+
+    Args:
+        root_dir (Path): Root directory of the project.
+        labs_names (list[str]): Names of labs to run tests for.
+        project_config_path (Path): Path to the project configuration.
+
+    Returns:
+        list[tuple[str, list[str]]]: Pairs of lab name and arguments for pytest.
+    """
+    return [
+        (
+            lab_name,
+            prepare_pytest_args(
+                lab_path=lab_name,
+                target_score=target_score,
+                project_config_path=project_config_path,
+            ),
+        )
+        for lab_name, target_score in collect_labs_target_scores(root_dir, labs_names)
+    ]
+
+
+def report_lab_result(lab_name: str, result: tuple[str, str, int]) -> bool:
+    """
+    Print result of tests of a lab.
+
+    Args:
+        lab_name (str): Name of the lab.
+        result (tuple[str, str, int]): stdout, stderr, exit code
+
+    Returns:
+        bool: True if tests of the lab passed
+    """
+    logger.info(f"Test results for lab {lab_name}")
+    passed = log_console_result(result, ok_codes=(0, 5))
+    if result[2] == 5:
+        logger.info(f"This combination of mark and label doesn't match any tests for {lab_name}.")
+    return passed
+
+
+def run_labs_in_single_session(
+    root_dir: Path,
+    labs_pytest_args: list[tuple[str, list[str]]],
+    project_config: ProjectConfig,
+    durations: LabDurations,
+) -> dict[str, tuple[str, str, int]]:
+    """
+    Run tests of all labs in one pytest session and split results for each lab.
+
+    Args:
+        root_dir (Path): Root directory of the project.
+        labs_pytest_args (list[tuple[str, list[str]]]): Pairs of lab name and pytest arguments.
+        project_config (ProjectConfig): Project configuration.
+        durations (LabDurations): Durations of labs to update.
+
+    Returns:
+        dict[str, tuple[str, str, int]]: Pytest-like exit code for each lab
+    """
+    labs_names = [lab_name for lab_name, _ in labs_pytest_args]
+    if not labs_names:
+        return {}
+
+    junit_xml_path = root_dir / "build" / "pytest" / "session.xml"
+    junit_xml_path.parent.mkdir(parents=True, exist_ok=True)
+    junit_xml_path.unlink(missing_ok=True)
+
+    run_pytest_session(
+        root_dir,
+        prepare_single_session_pytest_args(
+            [(lab_name, get_target_score(root_dir / lab_name)) for lab_name in labs_names],
+            project_config,
+            junit_xml_path,
+        ),
+    )
+
+    for lab_name, duration in sum_durations_by_labs(junit_xml_path, labs_names).items():
+        durations.record(lab_name, duration)
+
+    return {
+        lab_name: ("", "", return_code)
+        for lab_name, return_code in split_results_by_labs(junit_xml_path, labs_names).items()
+    }
+
+
+def run_labs_one_by_one(
+    root_dir: Path, labs_pytest_args: list[tuple[str, list[str]]], durations: LabDurations
+) -> dict[str, tuple[str, str, int]]:
+    """
+    Run pytest for labs one by one, stopping at the first failed lab.
+
+    Args:
+        root_dir (Path): Root directory of the project.
+        labs_pytest_args (list[tuple[str, list[str]]]): Pairs of lab name and pytest arguments.
+        durations (LabDurations): Durations of labs to update.
+
+    Returns:
+        dict[str, tuple[str, str, int]]: stdout, stderr and exit code for each lab
+    """
+    labs_results = {}
+    for lab_name, pytest_args in labs_pytest_args:
+        logger.info(f"Running tests for lab {lab_name}")
+
+        with durations.measure(lab_name):
+            labs_results[lab_name] = run_pytest(root_dir, pytest_args)
+        if labs_results[lab_name][2] == 5:
+            logger.info(
+                f"This combination of mark and label doesn't match any tests for {lab_name}."
+            )
+    return labs_results
+
+
+def run_labs_concurrently(
+    root_dir: Path,
+    labs_pytest_args: list[tuple[str, list[str]]],
+    durations: LabDurations,
+    jobs: int,
+) -> dict[str, tuple[str, str, int]]:
+    """
+    Run pytest for several labs at once and report results in the order of labs.
+
+    Args:
+        root_dir (Path): Root directory of the project.
+        labs_pytest_args (list[tuple[str, list[str]]]): Pairs of lab name and pytest arguments.
+        durations (LabDurations): Durations of labs to update.
+        jobs (int): Maximum number of pytest processes running at the same time.
+
+    Returns:
+        dict[str, tuple[str, str, int]]: stdout, stderr and exit code for each lab
+    """
+    results = run_concurrently(
+        (
+            durations.measure_async(lab_name, run_pytest_async(root_dir, pytest_args))
+            for lab_name, pytest_args in labs_pytest_args
+        ),
+        jobs=jobs,
+    )
+    labs_results = dict(zip((lab_name for lab_name, _ in labs_pytest_args), results))
+    for lab_name, result in labs_results.items():
+        report_lab_result(lab_name, result)
+    return labs_results
+
+
+def select_impacted_pytest_args(
+    root_dir: Path, labs_pytest_args: list[tuple[str, list[str]]], ref: str
+) -> list[tuple[str, list[str]]]:
+    """
+    Narrow tests of labs down to ones covering lines changed since the revision.
+
+    Labs without up-to-date index of covered lines or without impacted tests
+    keep all their tests.
+
+    Args:
+        root_dir (Path): Root directory of the project.
+        labs_pytest_args (list[tuple[str, list[str]]]): Pairs of lab name and pytest arguments.
+        ref (str): Git revision to compare with.
+
+    Returns:
+        list[tuple[str, list[str]]]: Pairs of lab name and pytest arguments
+    """
+    selected = []
+    for lab_name, pytest_args in labs_pytest_args:
+        if impacted_tests := select_impacted_tests(root_dir, lab_name, ref):
+            logger.info(f"Running {len(impacted_tests)} impacted tests of lab {lab_name}")
+            selected.append((lab_name, [*pytest_args, *impacted_tests]))
+        else:
+            # changes of the lab may still affect its tests through shared files
+            logger.info(f"Running all tests of lab {lab_name}")
+            selected.append((lab_name, pytest_args))
+    return selected
+
+
+def run_labs_with_coverage(
+    args: CommandLineInterface,
+    labs_pytest_args: list[tuple[str, list[str]]],
+    project_config: ProjectConfig,
+    durations: LabDurations,
+) -> dict[str, bool]:
+    """
+    Run tests of each lab once under coverage and check both tests and coverage.
+
+    Outcomes are not cached, as coverage of every lab is to be collected anew. Labs with
+    failing tests are reported as test failures only and their coverage is not compared.
+
+    Args:
+        args (CommandLineInterface): Parsed arguments.
+        labs_pytest_args (list[tuple[str, list[str]]]): Pairs of lab name and pytest arguments.
+        project_config (ProjectConfig): Project configuration.
+        durations (LabDurations): Durations of labs to update.
+
+    Returns:
+        dict[str, bool]: Whether tests passed and coverage did not decrease for each lab
+    """
+    root_dir = args.root_dir.resolve()
+    results = run_concurrently(
+        (
+            durations.measure_async(
+                lab_name, run_pytest_with_coverage_async(root_dir, lab_name, pytest_args)
+            )
+            for lab_name, pytest_args in labs_pytest_args
+        ),
+        jobs=args.jobs,
+    )
+
+    labs_passed = {}
+    coverage_results: dict[str, tuple[int | None]] = {}
+    for (lab_name, _), result in zip(labs_pytest_args, results):
+        labs_passed[lab_name] = report_lab_result(lab_name, result)
+        if not labs_passed[lab_name]:
+            continue
+        percentage = None
+        data_path = get_coverage_data_path(root_dir / "build" / "coverage", lab_name)
+        try:
+            percentage = create_coverage_report(data_path, root_dir)
+        except CoverageCreateReportError as e:
+            logger.error(str(e))
+        if percentage is not None:
+            build_index(data_path, root_dir, lab_name)
+        coverage_results[lab_name] = (percentage,)
+
+    coverage_passed = check_coverage_results(coverage_results, project_config)
+    return {lab_name: passed and coverage_passed for lab_name, passed in labs_passed.items()}
+
+
+def run_labs(
+    args: CommandLineInterface,
+    labs_pytest_args: list[tuple[str, list[str]]],
+    project_config: ProjectConfig,
+    durations: LabDurations,
+) -> dict[str, bool]:
+    """
+    Run tests of labs in the mode selected by the arguments.
+
+    Args:
+        args (CommandLineInterface): Parsed arguments.
+        labs_pytest_args (list[tuple[str, list[str]]]): Pairs of lab name and pytest arguments.
+        project_config (ProjectConfig): Project configuration.
+        durations (LabDurations): Durations of labs to update.
+
+    Returns:
+        dict[str, bool]: Whether tests passed for each lab
+    """
+    root_dir = args.root_dir.resolve()
+    cache = VerdictCache(root_dir, "run_tests", args.cache_size_mb) if args.use_cache else None
+    cached_results: dict[str, tuple[str, str, int]] = {}
+    if cache:
+        cached_results, labs_pytest_args = cache.partition(labs_pytest_args)
+
+    if args.single_session:
+        labs_results = run_labs_in_single_session(
+            root_dir, labs_pytest_args, project_config, durations
+        )
+    elif args.jobs > 1:
+        labs_results = run_labs_concurrently(root_dir, labs_pytest_args, durations, args.jobs)
+    else:
+        labs_results = run_labs_one_by_one(root_dir, labs_pytest_args, durations)
+
+    if args.single_session:
+        for lab_name, result in labs_results.items():
+            report_lab_result(lab_name, result)
+    for lab_name, result in cached_results.items():
+        report_lab_result(lab_name, result)
+
+    if cache:
+        for lab_name, result in labs_results.items():
+            if result[2] in (0, 5):
+                cache.store(lab_name, result)
+
+    return {
+        lab_name: result[2] in (0, 5)
+        for lab_name, result in {**labs_results, **cached_results}.items()
+    }
+
+
 def main() -> None:
     """
     Main function to run tests for only one lab or for one by one.
@@ -138,24 +597,28 @@ def main() -> None:
 
         logger.info(f"Current scope: {project_config.get_labs()}")
 
-        for lab in project_config.get_labs():
-            if check_skip(root_dir=root_dir, lab_path=lab.name):
-                continue
-            logger.info(f"Running tests for lab {lab.name}")
+        durations_db_path = get_default_db_path(root_dir)
+        durations = LabDurations(
+            root_dir,
+            "run_tests",
+            get_labs_durations(durations_db_path) if durations_db_path.exists() else None,
+        )
+        labs_names = durations.select_shard(
+            select_changed_names(
+                [lab.name for lab in project_config.get_labs()], root_dir, args.changed_since
+            ),
+            args.shard,
+        )
 
-            target_score = get_target_score(root_dir / lab.name)
-            pytest_args = prepare_pytest_args(
-                lab_path=lab.name,
-                target_score=target_score,
-                project_config_path=project_config_path,
+        labs_pytest_args = collect_labs_pytest_args(root_dir, labs_names, project_config_path)
+        if args.impacted_only and args.changed_since:
+            labs_pytest_args = select_impacted_pytest_args(
+                root_dir, labs_pytest_args, args.changed_since
             )
 
-            _, _, return_code = run_pytest(root_dir, pytest_args)
-            if return_code == 5:
-                logger.info(
-                    f"This combination of mark and label "
-                    f"doesn't match any tests for {lab.name}."
-                )
+        labs_results = (run_labs_with_coverage if args.with_coverage else run_labs)(
+            args, labs_pytest_args, project_config, durations
+        )
 
         for addon in project_config.get_addons():
             if not addon.run_tests:
@@ -169,6 +632,11 @@ def main() -> None:
                 project_config_path=project_config_path,
             )
 
+        write_shard_results(root_dir, "run_tests", args.shard, labs_results, durations)
+        if not all(labs_results.values()):
+            logger.error("\nTests failed for some of labs. Fix it.")
+            sys.exit(1)
+
 
 if __name__ == "__main__":
     main()
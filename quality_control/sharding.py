@@ -0,0 +1,350 @@
+"""
+Split labs across CI nodes and merge results of the nodes.
+"""
+
+import json
+import sys
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Awaitable, Iterator, Optional, TypeVar
+
+from logging518.config import fileConfig
+
+from quality_control.console_logging import get_child_logger
+from quality_control.quality_control_parser import QualityControlArgumentsParser
+from quality_control.test_durations.store import (
+    get_default_db_path,
+    get_tool_durations,
+    save_tool_durations,
+)
+
+logger = get_child_logger(__file__)
+
+T = TypeVar("T")
+
+
+class ShardFormatError(Exception):
+    """
+    Error for an invalid shard specification.
+    """
+
+
+def parse_shard(shard: str) -> tuple[int, int]:
+    """
+    Parse shard specification in the K/N format.
+
+    Args:
+        shard (str): Shard specification, for example 2/4
+
+    Returns:
+        tuple[int, int]: One-based index of the shard and number of shards
+    """
+    index, _, count = shard.partition("/")
+    if not index.isdigit() or not count.isdigit() or not 1 <= int(index) <= int(count):
+        raise ShardFormatError(f"Invalid shard '{shard}', expected K/N with 1 <= K <= N")
+    return int(index), int(count)
+
+
+def split_into_shards(
+    labs_names: list[str], durations: dict[str, float], shards_count: int
+) -> list[list[str]]:
+    """
+    Split labs into shards with close total durations.
+
+    The longest lab is put to the least loaded shard first, ties are resolved
+    by names, so every node computes the same split from the same durations.
+
+    Args:
+        labs_names (list[str]): Names of labs
+        durations (dict[str, float]): Known durations of labs in seconds
+        shards_count (int): Number of shards
+
+    Returns:
+        list[list[str]]: Names of labs for each shard
+    """
+    known = [durations[name] for name in labs_names if name in durations]
+    default_duration = sum(known) / len(known) if known else 1.0
+
+    shards: list[list[str]] = [[] for _ in range(shards_count)]
+    loads = [0.0] * shards_count
+    for name in sorted(labs_names, key=lambda x: (-durations.get(x, default_duration), x)):
+        least_loaded = loads.index(min(loads))
+        shards[least_loaded].append(name)
+        loads[least_loaded] += durations.get(name, default_duration)
+    return [sorted(shard) for shard in shards]
+
+
+class LabDurations:
+    """
+    Per-lab durations of a tool stored between runs.
+    """
+
+    def __init__(
+        self, root_dir: Path, tool_name: str, stored: Optional[dict[str, float]] = None
+    ) -> None:
+        """
+        Initialize LabDurations.
+
+        Args:
+            root_dir (Path): Root directory of the project
+            tool_name (str): Name of the tool durations belong to
+            stored (Optional[dict[str, float]]): Known durations of labs taking precedence
+                over the ones stored for the tool
+        """
+        self._db_path = get_default_db_path(root_dir)
+        self._tool_name = tool_name
+        self._stored: dict[str, float] = {}
+        if self._db_path.exists():
+            self._stored = get_tool_durations(self._db_path, tool_name)
+        self._stored.update(stored or {})
+        self._measured: dict[str, float] = {}
+        self._split: dict[str, list[str]] = {"all_labs": [], "shard_labs": []}
+
+    def select_shard(self, labs_names: list[str], shard: Optional[str]) -> list[str]:
+        """
+        Get names of labs to process on the current node.
+
+        Args:
+            labs_names (list[str]): Names of all labs
+            shard (Optional[str]): Shard specification in the K/N format, None for all labs
+
+        Returns:
+            list[str]: Names of labs of the shard
+        """
+        if shard is None:
+            return labs_names
+        index, count = parse_shard(shard)
+        selected = split_into_shards(labs_names, self._stored, count)[index - 1]
+        self._split = {"all_labs": sorted(labs_names), "shard_labs": selected}
+        logger.info(f"Shard {shard} processes labs: {selected}")
+        return [name for name in labs_names if name in selected]
+
+    def select_shard_paths(self, labs_paths: list[Path], shard: Optional[str]) -> list[Path]:
+        """
+        Get paths to labs to process on the current node.
+
+        Args:
+            labs_paths (list[Path]): Paths to all labs
+            shard (Optional[str]): Shard specification in the K/N format, None for all labs
+
+        Returns:
+            list[Path]: Paths to labs of the shard
+        """
+        selected = self.select_shard([lab_path.name for lab_path in labs_paths], shard)
+        return [lab_path for lab_path in labs_paths if lab_path.name in selected]
+
+    def record(self, lab_name: str, duration: float) -> None:
+        """
+        Record duration of a lab.
+
+        Args:
+            lab_name (str): Name of the lab
+            duration (float): Duration in seconds
+        """
+        self._measured[lab_name] = round(duration, 3)
+
+    @contextmanager
+    def measure(self, lab_name: str) -> Iterator[None]:
+        """
+        Measure duration of processing a lab.
+
+        Args:
+            lab_name (str): Name of the lab
+
+        Yields:
+            None: Control to the measured code
+        """
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            self.record(lab_name, time.monotonic() - start)
+
+    async def measure_async(self, lab_name: str, coroutine: Awaitable[T]) -> T:
+        """
+        Measure duration of a coroutine processing a lab.
+
+        Args:
+            lab_name (str): Name of the lab
+            coroutine (Awaitable[T]): Coroutine to await
+
+        Returns:
+            T: Result of the coroutine
+        """
+        with self.measure(lab_name):
+            return await coroutine
+
+    @property
+    def split(self) -> dict[str, list[str]]:
+        """
+        Property for labs split into shards and labs of the current shard.
+
+        Returns:
+            dict[str, list[str]]: Sorted names of all labs and of labs of the shard
+        """
+        return {name: list(labs_names) for name, labs_names in self._split.items()}
+
+    @property
+    def measured(self) -> dict[str, float]:
+        """
+        Property for durations measured during the current run.
+
+        Returns:
+            dict[str, float]: Durations of labs in seconds
+        """
+        return dict(self._measured)
+
+    def save(self) -> None:
+        """
+        Store measured durations for the next runs.
+        """
+        save_tool_durations(self._db_path, self._tool_name, self._measured)
+
+
+def is_first_shard(shard: Optional[str]) -> bool:
+    """
+    Determine whether the current node should also process addons.
+
+    Args:
+        shard (Optional[str]): Shard specification in the K/N format, None for all labs
+
+    Returns:
+        bool: True if there is no sharding or the shard is the first one
+    """
+    return shard is None or parse_shard(shard)[0] == 1
+
+
+def write_shard_results(
+    root_dir: Path,
+    tool_name: str,
+    shard: Optional[str],
+    labs_results: dict[str, bool],
+    durations: LabDurations,
+) -> None:
+    """
+    Store results of the current node to be merged later.
+
+    Args:
+        root_dir (Path): Root directory of the project
+        tool_name (str): Name of the tool
+        shard (Optional[str]): Shard specification in the K/N format, None for all labs
+        labs_results (dict[str, bool]): Whether each lab passed the check
+        durations (LabDurations): Durations of labs
+    """
+    durations.save()
+    if shard is None:
+        return
+    index, count = parse_shard(shard)
+    results_path = root_dir / "build" / "shards" / f"{tool_name}-{index}-of-{count}.json"
+    results_path.parent.mkdir(parents=True, exist_ok=True)
+    results_path.write_text(
+        json.dumps(
+            {
+                "tool": tool_name,
+                "shard": index,
+                "shards_count": count,
+                "labs": labs_results,
+                "durations": durations.measured,
+                **durations.split,
+            },
+            indent=4,
+        ),
+        encoding="utf-8",
+    )
+
+
+def check_shards_split(tool_name: str, tool_results: list[dict]) -> bool:
+    """
+    Check that shards split the same labs and every lab went to exactly one shard.
+
+    Nodes compute the split from their own durations, so different durations
+    on nodes lead to labs processed twice or not at all.
+
+    Args:
+        tool_name (str): Name of the tool
+        tool_results (list[dict]): Results of shards of the tool
+
+    Returns:
+        bool: True if labs of shards partition the labs split
+    """
+    splits = {tuple(results.get("all_labs", [])) for results in tool_results}
+    if len(splits) != 1:
+        logger.error(f"{tool_name}: shards split different labs: {sorted(splits)}")
+        return False
+    shards_labs = [name for results in tool_results for name in results.get("shard_labs", [])]
+    if sorted(shards_labs) != list(splits.pop()):
+        logger.error(
+            f"{tool_name}: labs of shards {sorted(shards_labs)} are not a split of all labs"
+        )
+        return False
+    return True
+
+
+def merge_shard_results(results_dir: Path, root_dir: Path) -> bool:
+    """
+    Merge results of all nodes into one verdict and store their durations.
+
+    Args:
+        results_dir (Path): Directory with results of nodes
+        root_dir (Path): Root directory of the project
+
+    Returns:
+        bool: True if every shard is present, every lab was processed once and passed
+    """
+    by_tool: dict[tuple[str, int], list[dict]] = {}
+    for results_path in sorted(results_dir.glob("*.json")):
+        results = json.loads(results_path.read_text(encoding="utf-8"))
+        by_tool.setdefault((results["tool"], results["shards_count"]), []).append(results)
+
+    if not by_tool:
+        logger.error(f"No results of shards found in {results_dir}")
+        return False
+
+    all_passed = True
+    for (tool_name, shards_count), tool_results in sorted(by_tool.items()):
+        missing = set(range(1, shards_count + 1)) - {results["shard"] for results in tool_results}
+        if missing:
+            logger.error(f"{tool_name}: no results for shards {sorted(missing)} of {shards_count}")
+            all_passed = False
+        elif not check_shards_split(tool_name, tool_results):
+            all_passed = False
+
+        durations = LabDurations(root_dir, tool_name)
+        for results in sorted(tool_results, key=lambda x: x["shard"]):
+            for lab_name, duration in results["durations"].items():
+                durations.record(lab_name, duration)
+            for lab_name, passed in sorted(results["labs"].items()):
+                logger.info(f'{tool_name:<20}{lab_name:<30}: {"OK" if passed else "FAIL"}')
+                all_passed = all_passed and passed
+        durations.save()
+    return all_passed
+
+
+class MergeShardsArgumentsParser(QualityControlArgumentsParser):
+    """
+    CLI for merging results of shards.
+    """
+
+    results_dir: Optional[Path] = None
+
+
+def main() -> None:
+    """
+    Entrypoint for merging results of shards.
+    """
+    args = MergeShardsArgumentsParser(underscores_to_dashes=True).parse_args()
+
+    root_dir = args.root_dir.resolve()
+    toml_config = (args.toml_config_path or (root_dir / "pyproject.toml")).resolve()
+    fileConfig(toml_config)
+
+    results_dir = (args.results_dir or (root_dir / "build" / "shards")).resolve()
+    if not merge_shard_results(results_dir, root_dir):
+        logger.error("\nSome of shards were failed. Fix it.")
+        sys.exit(1)
+    logger.info("All shards passed.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,198 @@
+"""
+Check of formatting with black run in-process over a pool of workers.
+"""
+
+import json
+import re
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import replace
+from itertools import repeat
+from pathlib import Path
+from typing import Any, Optional
+
+import black
+
+from quality_control.console_logging import get_child_logger
+from quality_control.file_index import FileIndex
+from quality_control.hashing import hash_file, hash_strings
+
+logger = get_child_logger(__file__)
+
+
+def get_black_mode(config: dict[str, Any]) -> black.Mode:
+    """
+    Build formatting options of black from its config.
+
+    Args:
+        config (dict[str, Any]): Options of the [tool.black] section
+
+    Returns:
+        black.Mode: Formatting options
+    """
+    return black.Mode(
+        target_versions={
+            black.TargetVersion[version.upper()] for version in config.get("target_version", [])
+        },
+        line_length=config.get("line_length", black.DEFAULT_LINE_LENGTH),
+        string_normalization=not config.get("skip_string_normalization", False),
+        magic_trailing_comma=not config.get("skip_magic_trailing_comma", False),
+        preview=config.get("preview", False),
+    )
+
+
+def get_black_files(paths: list[Path], root_dir: Path, config: dict[str, Any]) -> list[Path]:
+    """
+    Get Python files of the paths black is to check, honoring its exclusions.
+
+    Args:
+        paths (list[Path]): Paths to files and directories
+        root_dir (Path): Root directory of the project
+        config (dict[str, Any]): Options of the [tool.black] section
+
+    Returns:
+        list[Path]: Sorted paths to files
+    """
+    excludes = [
+        re.compile(pattern)
+        for pattern in (
+            config.get("exclude", black.DEFAULT_EXCLUDES),
+            config.get("extend_exclude"),
+            config.get("force_exclude"),
+        )
+        if pattern
+    ]
+    file_index = FileIndex(root_dir)
+    files = set()
+    for path in filter(Path.exists, paths):
+        for file_path in file_index.with_suffix(".py", ".pyi", directory=path):
+            relative_path = f"/{file_path.relative_to(root_dir).as_posix()}"
+            if not any(exclude.search(relative_path) for exclude in excludes):
+                files.add(file_path)
+    return sorted(files)
+
+
+def check_file_format(path: Path, mode: black.Mode) -> Optional[str]:
+    """
+    Check whether black would reformat a file.
+
+    Args:
+        path (Path): Path to the file
+        mode (black.Mode): Formatting options
+
+    Returns:
+        Optional[str]: Unified diff with formatted content or reason of failure,
+            None if the file is formatted
+    """
+    try:
+        source = path.read_text(encoding="utf-8")
+        formatted = black.format_file_contents(
+            source, fast=False, mode=replace(mode, is_pyi=path.suffix == ".pyi")
+        )
+    except black.NothingChanged:
+        return None
+    except ValueError as error:
+        return f"cannot format {path}: {error}"
+    return black.diff(source, formatted, f"{path}\toriginal", f"{path}\tformatted")
+
+
+class BlackCache:
+    """
+    Hashes of files which passed the check with the same version and options of black.
+    """
+
+    def __init__(self, root_dir: Path, mode: black.Mode) -> None:
+        """
+        Initialize BlackCache.
+
+        Args:
+            root_dir (Path): Root directory of the project
+            mode (black.Mode): Formatting options
+        """
+        self._path = root_dir / "build" / "black_cache.json"
+        self._settings_hash = hash_strings(black.__version__, mode.get_cache_key())
+        stored = json.loads(self._path.read_text(encoding="utf-8")) if self._path.exists() else {}
+        self._stored = (
+            set(stored["passed"]) if stored.get("settings") == self._settings_hash else set()
+        )
+        self._passed: set[str] = set()
+
+    @staticmethod
+    def compute_key(path: Path) -> str:
+        """
+        Get hash of the content and the kind of a file.
+
+        Args:
+            path (Path): Path to the file
+
+        Returns:
+            str: Cache key
+        """
+        return hash_strings(path.suffix, hash_file(path))
+
+    def partition(self, paths: list[Path]) -> list[Path]:
+        """
+        Get files without a stored passing result.
+
+        Args:
+            paths (list[Path]): Paths to files
+
+        Returns:
+            list[Path]: Paths to files to be checked
+        """
+        changed = []
+        for path in paths:
+            key = self.compute_key(path)
+            if key in self._stored:
+                self._passed.add(key)
+            else:
+                changed.append(path)
+        logger.info(f"Formatting of {len(paths) - len(changed)} files is reused from cache.")
+        return changed
+
+    def store(self, paths: list[Path]) -> None:
+        """
+        Save files which passed the check along with ones reused from the cache.
+
+        Args:
+            paths (list[Path]): Paths to files which passed the check
+        """
+        self._passed.update(map(self.compute_key, paths))
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._path.write_text(
+            json.dumps({"settings": self._settings_hash, "passed": sorted(self._passed)}),
+            encoding="utf-8",
+        )
+
+
+def check_black_in_process(
+    paths: list[Path], toml_config_path: Path, root_dir: Path, jobs: int, use_cache: bool = False
+) -> dict[Path, str]:
+    """
+    Check formatting of files of the paths with black in a pool of processes.
+
+    With the cache, files which passed with the same content and the same version
+    and options of black are not checked again.
+
+    Args:
+        paths (list[Path]): Paths to files and directories
+        toml_config_path (Path): Path to pyproject.toml (Black config)
+        root_dir (Path): Root directory of the project
+        jobs (int): Number of worker processes
+        use_cache (bool): Reuse and store files which passed the check
+
+    Returns:
+        dict[Path, str]: Diffs of files black would reformat
+    """
+    config = black.parse_pyproject_toml(str(toml_config_path))
+    mode = get_black_mode(config)
+    cache = BlackCache(root_dir, mode) if use_cache else None
+    files = get_black_files(paths, root_dir, config)
+    if cache is not None:
+        files = cache.partition(files)
+    diffs = {}
+    if files:
+        with ProcessPoolExecutor(max_workers=max(jobs, 1)) as executor:
+            diffs = dict(zip(files, executor.map(check_file_format, files, repeat(mode))))
+    if cache is not None:
+        cache.store([path for path, diff in diffs.items() if diff is None])
+    return {path: diff for path, diff in diffs.items() if diff is not None}
@@ -8,6 +8,7 @@ from pathlib import Path
 
 from logging518.config import fileConfig
 
+from quality_control.changed_labs import select_changed_paths
 from quality_control.generate_stubs.generator import cleanup_code
 from quality_control.generate_stubs.run_generator import (
     format_stub_file,
@@ -45,7 +46,9 @@ def main() -> None:
 
     fileConfig(toml_config)
 
-    labs_list = project_config.get_labs_paths(root_dir=root_dir)
+    labs_list = select_changed_paths(
+        project_config.get_labs_paths(root_dir=root_dir), root_dir, args.changed_since
+    )
     code_is_equal = True
 
     for lab_path in labs_list:
@@ -2,14 +2,17 @@
 Check black to check the style and quality of Python code.
 """
 
+import sys
 from pathlib import Path
 
 from logging518.config import fileConfig
 
+from quality_control.changed_labs import select_changed_paths
 from quality_control.cli_unifier import (
     _run_console_tool,
     choose_python_exe,
     handles_console_error,
+    log_output,
 )
 from quality_control.console_logging import get_child_logger
 from quality_control.project_config import ProjectConfig
@@ -20,6 +23,14 @@ from quality_control.quality_control_parser import QualityControlArgumentsParser
 logger = get_child_logger(__file__)
 
 
+class BlackArgumentsParser(QualityControlArgumentsParser):
+    """
+    CLI for black checks.
+    """
+
+    in_process: bool = False
+
+
 @handles_console_error()
 def check_black_on_paths(
     paths: list[Path],
@@ -50,11 +61,24 @@ def check_black_on_paths(
     )
 
 
+def report_black_diffs(diffs: dict[Path, str]) -> None:
+    """
+    Print files black would reformat with their diffs.
+
+    Args:
+        diffs (dict[Path, str]): Diffs of files black would reformat
+    """
+    for path, diff in diffs.items():
+        logger.error(f"Would reformat {path}")
+        log_output("Black diff", diff)
+    logger.error(f"{len(diffs)} files would be reformatted.")
+
+
 def main() -> None:
     """
     Entrypoint for the module.
     """
-    args = QualityControlArgumentsParser(underscores_to_dashes=True).parse_args()
+    args = BlackArgumentsParser(underscores_to_dashes=True).parse_args()
 
     root_dir = args.root_dir.resolve()
     toml_config = (args.toml_config_path or (root_dir / "pyproject.toml")).resolve()
@@ -65,20 +89,40 @@ def main() -> None:
 
     fileConfig(toml_config)
 
-    logger.info(f"Labs to check with black: {project_config.get_labs_paths(root_dir=root_dir)}")
-    check_black_on_paths(
-        project_config.get_labs_paths(root_dir=root_dir),
-        toml_config_path=toml_config,
-        root_dir=root_dir,
-    )
-    logger.info(
-        f"Addons to check with black: {project_config.get_addons_paths(root_dir=root_dir),}"
+    labs_paths = select_changed_paths(
+        project_config.get_labs_paths(root_dir=root_dir), root_dir, args.changed_since
     )
-    check_black_on_paths(
-        project_config.get_addons_paths(root_dir=root_dir),
-        toml_config_path=toml_config,
-        root_dir=root_dir,
+    logger.info(f"Labs to check with black: {labs_paths}")
+    addons_paths = select_changed_paths(
+        project_config.get_addons_paths(root_dir=root_dir), root_dir, args.changed_since
     )
+    logger.info(f"Addons to check with black: {addons_paths}")
+
+    if args.in_process:
+        # black is imported only here, as modules take the parser from this one
+        # pylint: disable-next=import-outside-toplevel
+        from quality_control.static_checks.black_checker import check_black_in_process
+
+        if diffs := check_black_in_process(
+            labs_paths + addons_paths, toml_config, root_dir, args.jobs, args.use_cache
+        ):
+            report_black_diffs(diffs)
+            sys.exit(1)
+        logger.info("All files are formatted.")
+        return
+
+    if labs_paths:
+        check_black_on_paths(
+            labs_paths,
+            toml_config_path=toml_config,
+            root_dir=root_dir,
+        )
+    if addons_paths:
+        check_black_on_paths(
+            addons_paths,
+            toml_config_path=toml_config,
+            root_dir=root_dir,
+        )
 
 
 if __name__ == "__main__":
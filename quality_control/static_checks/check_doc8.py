@@ -8,12 +8,14 @@ from pathlib import Path
 
 from logging518.config import fileConfig
 
+from quality_control.changed_labs import select_changed_paths
 from quality_control.cli_unifier import (
     _run_console_tool,
     choose_python_exe,
     handles_console_error,
 )
 from quality_control.console_logging import get_child_logger
+from quality_control.file_index import FileIndex
 from quality_control.project_config import ProjectConfig
 from quality_control.static_checks.check_black import QualityControlArgumentsParser
 
@@ -64,8 +66,10 @@ def main() -> None:
     project_config = ProjectConfig(project_config_path)
     fileConfig(toml_config)
 
+    file_index = FileIndex(root_dir)
+
     logger.info("Running doc8 for main docs")
-    rst_main_files = list(root_dir.glob("*rst"))
+    rst_main_files = file_index.select("*rst", recursive=False)
     check_doc8_on_paths(
         paths=rst_main_files,
         path_to_config=toml_config,
@@ -74,7 +78,7 @@ def main() -> None:
 
     logger.info("Running doc8 for other docs")
     docs_path = root_dir / "docs"
-    rst_files = list(docs_path.rglob("*.rst"))
+    rst_files = file_index.select("*.rst", directory=docs_path)
 
     check_doc8_on_paths(
         paths=rst_files,
@@ -82,10 +86,12 @@ def main() -> None:
         root_dir=root_dir,
     )
 
-    labs_list = project_config.get_labs_paths(root_dir=root_dir)
+    labs_list = select_changed_paths(
+        project_config.get_labs_paths(root_dir=root_dir), root_dir, args.changed_since
+    )
     for lab_name in labs_list:
         lab_path = root_dir / lab_name
-        rst_labs_files = list(lab_path.rglob("*.rst"))
+        rst_labs_files = file_index.select("*.rst", directory=lab_path)
         logger.info(f"Running doc8 for lab {lab_path}")
         check_doc8_on_paths(
             paths=rst_labs_files,
@@ -3,14 +3,21 @@ Check flake8 to check the style and quality of Python code.
 """
 
 # pylint: disable=duplicate-code
+import re
+import sys
 from pathlib import Path
 
 from logging518.config import fileConfig
 
+from quality_control.changed_labs import select_changed_paths
 from quality_control.cli_unifier import (
     _run_console_tool,
+    _run_console_tool_async,
     choose_python_exe,
     handles_console_error,
+    handles_console_error_async,
+    log_console_result,
+    run_concurrently,
 )
 from quality_control.console_logging import get_child_logger
 from quality_control.project_config import ProjectConfig
@@ -18,6 +25,17 @@ from quality_control.static_checks.check_black import QualityControlArgumentsPar
 
 logger = get_child_logger(__file__)
 
+FLAKE8_FORMAT = "%(path)s:%(row)d:%(col)d: %(code)s %(text)s"
+VIOLATION_PATTERN = re.compile(r"^(?P<path>.+?):\d+:\d+: \w+ ")
+
+
+class Flake8ArgumentsParser(QualityControlArgumentsParser):
+    """
+    CLI for flake8 checks.
+    """
+
+    batch: bool = False
+
 
 @handles_console_error()
 def check_flake8_on_paths(
@@ -40,11 +58,130 @@ def check_flake8_on_paths(
     )
 
 
+@handles_console_error_async()
+async def check_flake8_on_paths_async(
+    paths: list[Path],
+    root_dir: Path,
+) -> tuple[str, str, int]:
+    """
+    Run flake8 checks for the project without blocking other checks.
+
+    Args:
+        paths (list[Path]): Paths to the projects.
+
+    Returns:
+        tuple[str, str, int]: stdout, stderr, exit code
+    """
+    flake_args = ["-m", "flake8", *map(str, filter(lambda x: x.exists(), paths))]
+
+    return await _run_console_tool_async(
+        str(choose_python_exe(lab_path=root_dir)), flake_args, debug=True, cwd=root_dir
+    )
+
+
+@handles_console_error(ok_codes=(0, 1))
+def check_flake8_on_paths_in_batch(
+    paths: list[Path], root_dir: Path, jobs: int
+) -> tuple[str, str, int]:
+    """
+    Run flake8 checks for several projects at once with parallel jobs.
+
+    Args:
+        paths (list[Path]): Paths to the projects.
+        root_dir (Path): Root directory of the project.
+        jobs (int): Number of flake8 worker processes.
+
+    Returns:
+        tuple[str, str, int]: stdout, stderr, exit code
+    """
+    flake_args = [
+        "-m",
+        "flake8",
+        *map(str, filter(lambda x: x.exists(), paths)),
+        "--jobs",
+        str(jobs),
+        "--format",
+        FLAKE8_FORMAT,
+    ]
+    return _run_console_tool(
+        str(choose_python_exe(lab_path=root_dir)), flake_args, debug=True, cwd=root_dir
+    )
+
+
+def split_flake8_violations(
+    flake8_output: str, groups: dict[str, list[Path]]
+) -> tuple[dict[str, list[str]], list[str]]:
+    """
+    Split violations found by flake8 into groups of paths they belong to.
+
+    Args:
+        flake8_output (str): Output of flake8 with absolute paths.
+        groups (dict[str, list[Path]]): Paths of each group, for example of a lab.
+
+    Returns:
+        tuple[dict[str, list[str]], list[str]]: Violations of each group and
+            violations outside of all groups
+    """
+    violations: dict[str, list[str]] = {name: [] for name in groups}
+    unattributed = []
+    for line in flake8_output.splitlines():
+        if not (match := VIOLATION_PATTERN.match(line)):
+            continue
+        path = Path(match.group("path"))
+        names = [
+            name
+            for name, group_paths in groups.items()
+            if any(path.is_relative_to(group_path) for group_path in group_paths)
+        ]
+        for name in names:
+            violations[name].append(line)
+        if not names:
+            unattributed.append(line)
+    return violations, unattributed
+
+
+def check_flake8_in_batch(
+    addons_paths: list[Path], labs_list: list[Path], root_dir: Path, jobs: int
+) -> bool:
+    """
+    Run flake8 checks for addons and all labs in a single flake8 run.
+
+    Args:
+        addons_paths (list[Path]): Paths to addons.
+        labs_list (list[Path]): Paths to labs.
+        root_dir (Path): Root directory of the project.
+        jobs (int): Number of flake8 worker processes.
+
+    Returns:
+        bool: True if all checks passed
+    """
+    groups = {f"lab {lab_path}": [lab_path] for lab_path in labs_list}
+    if addons_paths:
+        groups["addons"] = addons_paths
+    if not groups:
+        return True
+    stdout, stderr, return_code = check_flake8_on_paths_in_batch(
+        [*addons_paths, *labs_list], root_dir, jobs
+    )
+    violations, unattributed = split_flake8_violations(stdout, groups)
+
+    is_passed = True
+    for name, group_violations in violations.items():
+        logger.info(f"Flake8 results for {name}")
+        if not log_console_result(("\n".join(group_violations), "", 1 if group_violations else 0)):
+            is_passed = False
+    if unattributed or (return_code and all(not lines for lines in violations.values())):
+        logger.error("Flake8 failed outside of labs and addons.")
+        log_console_result(("\n".join(unattributed), stderr, return_code))
+        is_passed = False
+    return is_passed
+
+
 def main() -> None:
     """
     Run flake8 checks for the project.
     """
-    args = QualityControlArgumentsParser(underscores_to_dashes=True).parse_args()
+    args = Flake8ArgumentsParser(underscores_to_dashes=True).parse_args()
 
     root_dir = args.root_dir.resolve()
     toml_config = (args.toml_config_path or (root_dir / "pyproject.toml")).resolve()
@@ -55,14 +192,35 @@ def main() -> None:
 
     fileConfig(toml_config)
 
-    addon_paths = project_config.get_addons_paths(root_dir=root_dir)
-    logger.info(f"Running flake8 on {' '.join(str(i) for i in addon_paths)}")
-    check_flake8_on_paths(addon_paths, root_dir=root_dir)
-
-    labs_list = project_config.get_labs_paths(root_dir=root_dir)
-    for lab_path in labs_list:
-        logger.info(f"Running flake8 for lab {lab_path}")
-        check_flake8_on_paths([lab_path], root_dir=root_dir)
+    addon_paths = select_changed_paths(
+        project_config.get_addons_paths(root_dir=root_dir), root_dir, args.changed_since
+    )
+    labs_list = select_changed_paths(
+        project_config.get_labs_paths(root_dir=root_dir), root_dir, args.changed_since
+    )
+    if args.batch:
+        if not check_flake8_in_batch(addon_paths, labs_list, root_dir, args.jobs):
+            logger.error("\nSome of checks were failed. Fix it.")
+            sys.exit(1)
+        return
+
+    if addon_paths:
+        logger.info(f"Running flake8 on {' '.join(str(i) for i in addon_paths)}")
+        check_flake8_on_paths(addon_paths, root_dir=root_dir)
+
+    results = run_concurrently(
+        (check_flake8_on_paths_async([lab_path], root_dir=root_dir) for lab_path in labs_list),
+        jobs=args.jobs,
+    )
+    check_is_failed = False
+    for lab_path, result in zip(labs_list, results):
+        logger.info(f"Flake8 results for lab {lab_path}")
+        if not log_console_result(result):
+            check_is_failed = True
+
+    if check_is_failed:
+        logger.error("\nSome of checks were failed. Fix it.")
+        sys.exit(1)
 
 
 if __name__ == "__main__":
@@ -4,10 +4,13 @@ Check availability of __init__.py in every directory except for excluded ones.
 
 import sys
 from pathlib import Path
+from typing import Optional
 
 from tap import Tap
 
 from quality_control.console_logging import get_child_logger
+from quality_control.file_index import DEFAULT_EXCLUDED_DIRS, FileIndex
+from quality_control.project_config import ProjectConfig
 
 logger = get_child_logger(__file__)
 
@@ -18,6 +21,7 @@ class InitArgumentsParser(Tap):
     """
 
     root_dir: Path = Path.cwd()
+    project_config_path: Optional[Path] = None
 
 
 def find_missing_inits(root_dir: Path, excluded_dirs: list[str]) -> list[Path]:
@@ -31,16 +35,11 @@ def find_missing_inits(root_dir: Path, excluded_dirs: list[str]) -> list[Path]:
     Returns:
         list[Path]: List of directories without __init__.py.
     """
-    missing_init = []
-    for directory in root_dir.rglob("*"):
-        if not directory.is_dir():
-            continue
-        if any(excluded in directory.parts for excluded in excluded_dirs):
-            continue
-        python_files = list(directory.glob("*.py"))
-        if python_files and not (directory / "__init__.py").exists():
-            missing_init.append(directory)
-    return missing_init
+    return [
+        directory
+        for directory, file_names in FileIndex(root_dir, excluded_dirs).get_directories().items()
+        if "__init__.py" not in file_names and any(name.endswith(".py") for name in file_names)
+    ]
 
 
 def main() -> None:
@@ -50,7 +49,12 @@ def main() -> None:
     args = InitArgumentsParser().parse_args()
     root_dir = args.root_dir.resolve()
 
-    excluded_dirs = ["venv", ".git", "__pycache__"]
+    project_config_path = (args.project_config_path or (root_dir / "project_config.json")).resolve()
+    excluded_dirs = list(DEFAULT_EXCLUDED_DIRS)
+    if project_config_path.exists():
+        excluded_dirs = sorted(
+            {*DEFAULT_EXCLUDED_DIRS, *ProjectConfig(project_config_path).get_init_config()}
+        )
     missing_init = find_missing_inits(root_dir, excluded_dirs)
 
     if missing_init:
@@ -4,26 +4,46 @@ Check lint for code style in Python code.
 
 # pylint: disable=duplicate-code
 import argparse
-import re
+import json
 import sys
 from os import listdir
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
 from logging518.config import fileConfig
 
+from quality_control.changed_labs import select_changed_paths
 from quality_control.cli_unifier import (
     _run_console_tool,
+    _run_console_tool_async,
     choose_python_exe,
     handles_console_error,
+    handles_console_error_async,
+    log_console_result,
+    run_concurrently,
 )
 from quality_control.console_logging import get_child_logger
+from quality_control.file_index import FileIndex
 from quality_control.lab_settings import LabSettings
 from quality_control.project_config import ProjectConfig
 from quality_control.quality_control_parser import QualityControlArgumentsParser
+from quality_control.sharding import is_first_shard, LabDurations, write_shard_results
+from quality_control.static_checks.lint_cache import CROSS_MODULE_MESSAGES, LintCache
+from quality_control.static_checks.lint_report import (
+    get_lint_output_path,
+    get_lint_report_path,
+    LintReport,
+    merge_lint_outputs,
+    parse_lint_output,
+    read_lint_output_file,
+    save_lint_report,
+    summarize_lint_output,
+)
 
 logger = get_child_logger(__file__)
 
+LINT_REPORTER = "quality_control.static_checks.lint_reporter.ModuleStatsReporter"
+
 
 class QualityControlLintArgumentsParser(QualityControlArgumentsParser):
     """
@@ -31,6 +51,7 @@ class QualityControlLintArgumentsParser(QualityControlArgumentsParser):
     """
 
     repository_type: Optional[str] = None
+    batch: bool = False
 
 
 def transform_score_into_lint(target_score: int) -> int:
@@ -47,23 +68,17 @@ def transform_score_into_lint(target_score: int) -> int:
     return target_score_to_lint_score.get(target_score, 0)
 
 
-def is_passed(lint_output: str, target_lint_level: int) -> bool:
+def is_passed(lint_score: float, target_lint_level: int) -> bool:
     """
     Determine whether lint level is passed.
 
     Args:
-        lint_output (str): Lint output
+        lint_score (float): Score given by pylint
         target_lint_level (int): Lint score
 
     Returns:
         bool: Lint check passed or not
     """
-    if not lint_output:
-        return True
-
-    lint_level = re.search(r"Your code has been rated at \d+\.\d+", lint_output).group(0)
-    lint_score = int(re.search(r"\d+", lint_level).group(0))
-
     if lint_score < target_lint_level:
         logger.error("\nLint check is not passed!\nFix the listed issues and try again.\n")
         return False
@@ -74,46 +89,432 @@ def is_passed(lint_output: str, target_lint_level: int) -> bool:
     return True
 
 
-@handles_console_error()
-def check_lint_on_paths(
+def prepare_lint_args(
     paths: list[Path],
     path_to_config: Path,
-    root_dir: Path,
+    output_path: Path,
     exit_zero: bool = False,
     ignore_tests: bool = False,
-) -> tuple[str, str, int]:
+) -> list[str]:
     """
-    Run lint checks for the project.
+    Build the arguments for running pylint.
+
+    Messages are printed as text, while statistics of modules are written to a file.
+    Output of a previous run in the file is removed.
 
     Args:
         paths (list[Path]): Paths to the projects.
         path_to_config (Path): Path to the config.
+        output_path (Path): Path to the output of ModuleStatsReporter.
         exit_zero (bool): Exit-zero lint argument.
         ignore_tests (bool): Ignore lint argument.
 
     Returns:
-        tuple[str, str, int]: stdout, stderr, exit code
+        list[str]: List of arguments for pylint
     """
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.unlink(missing_ok=True)
     lint_args = [
         "-m",
         "pylint",
         *map(str, filter(lambda x: x.exists(), paths)),
         "--rcfile",
         str(path_to_config),
+        "--output-format",
+        f"text,{LINT_REPORTER}:{output_path}",
     ]
     if ignore_tests:
         lint_args.extend(["--ignore", "tests"])
     if exit_zero:
         lint_args.append("--exit-zero")
-    return _run_console_tool(str(choose_python_exe(lab_path=root_dir)), lint_args, debug=True)
+    return lint_args
+
+
+@handles_console_error()
+def check_lint_on_paths(
+    paths: list[Path],
+    path_to_config: Path,
+    root_dir: Path,
+    output_path: Path,
+    exit_zero: bool = False,
+    ignore_tests: bool = False,
+) -> tuple[str, str, int]:
+    """
+    Run lint checks for the project.
+
+    Args:
+        paths (list[Path]): Paths to the projects.
+        path_to_config (Path): Path to the config.
+        root_dir (Path): Root directory of the project.
+        output_path (Path): Path to the output of ModuleStatsReporter.
+        exit_zero (bool): Exit-zero lint argument.
+        ignore_tests (bool): Ignore lint argument.
+
+    Returns:
+        tuple[str, str, int]: stdout, stderr, exit code
+    """
+    lint_args = prepare_lint_args(paths, path_to_config, output_path, exit_zero, ignore_tests)
+    return _run_console_tool(
+        str(choose_python_exe(lab_path=root_dir)), lint_args, debug=True, cwd=root_dir
+    )
+
+
+@handles_console_error_async()
+async def check_lint_on_paths_async(
+    paths: list[Path],
+    path_to_config: Path,
+    root_dir: Path,
+    output_path: Path,
+    exit_zero: bool = False,
+    ignore_tests: bool = False,
+) -> tuple[str, str, int]:
+    """
+    Run lint checks for the project without blocking other checks.
+
+    Args:
+        paths (list[Path]): Paths to the projects.
+        path_to_config (Path): Path to the config.
+        root_dir (Path): Root directory of the project.
+        output_path (Path): Path to the output of ModuleStatsReporter.
+        exit_zero (bool): Exit-zero lint argument.
+        ignore_tests (bool): Ignore lint argument.
+
+    Returns:
+        tuple[str, str, int]: stdout, stderr, exit code
+    """
+    lint_args = prepare_lint_args(paths, path_to_config, output_path, exit_zero, ignore_tests)
+    return await _run_console_tool_async(
+        str(choose_python_exe(lab_path=root_dir)), lint_args, debug=True, cwd=root_dir
+    )
+
+
+@handles_console_error()
+def check_lint_on_labs(
+    labs_paths: list[Path],
+    path_to_config: Path,
+    root_dir: Path,
+    jobs: int,
+    ignore_tests: bool = False,
+) -> tuple[str, str, int]:
+    """
+    Run lint checks for several labs at once with statistics of each module.
+
+    Statistics are written to the output of labs returned by get_lint_output_path.
+
+    Args:
+        labs_paths (list[Path]): Paths to labs.
+        path_to_config (Path): Path to the config.
+        root_dir (Path): Root directory of the project.
+        jobs (int): Number of pylint worker processes.
+        ignore_tests (bool): Ignore lint argument.
+
+    Returns:
+        tuple[str, str, int]: stdout, stderr, exit code
+    """
+    lint_args = prepare_lint_args(
+        labs_paths,
+        path_to_config,
+        get_lint_output_path(root_dir, "labs"),
+        exit_zero=True,
+        ignore_tests=ignore_tests,
+    )
+    lint_args.extend(["--jobs", str(jobs)])
+    return _run_console_tool(
+        str(choose_python_exe(lab_path=root_dir)), lint_args, debug=True, cwd=root_dir
+    )
+
+
+def check_labs_lint_in_batch(
+    labs_to_check: list[tuple[Path, int]],
+    path_to_config: Path,
+    root_dir: Path,
+    jobs: int,
+    ignore_tests: bool = False,
+) -> dict[str, bool]:
+    """
+    Run lint checks for all labs in a single pylint run and check score of each lab.
+
+    Args:
+        labs_to_check (list[tuple[Path, int]]): Pairs of lab path and target score.
+        path_to_config (Path): Path to the config.
+        root_dir (Path): Root directory of the project.
+        jobs (int): Number of pylint worker processes.
+        ignore_tests (bool): Ignore lint argument.
+
+    Returns:
+        dict[str, bool]: Whether each lab passed the check
+    """
+    if not labs_to_check:
+        return {}
+    check_lint_on_labs(
+        [lab_path for lab_path, _ in labs_to_check], path_to_config, root_dir, jobs, ignore_tests
+    )
+    return check_labs_lint_output(
+        read_lint_output_file(get_lint_output_path(root_dir, "labs")), labs_to_check, root_dir
+    )
+
+
+@handles_console_error()
+def get_lint_version(root_dir: Path) -> tuple[str, str, int]:
+    """
+    Get versions of pylint, astroid and Python of the project.
+
+    Args:
+        root_dir (Path): Root directory of the project.
+
+    Returns:
+        tuple[str, str, int]: stdout, stderr, exit code
+    """
+    return _run_console_tool(
+        str(choose_python_exe(lab_path=root_dir)), ["-m", "pylint", "--version"], cwd=root_dir
+    )
+
+
+@handles_console_error()
+def list_enabled_lint_messages(path_to_config: Path, root_dir: Path) -> tuple[str, str, int]:
+    """
+    List messages pylint emits with the config.
+
+    Args:
+        path_to_config (Path): Path to the config.
+        root_dir (Path): Root directory of the project.
+
+    Returns:
+        tuple[str, str, int]: stdout, stderr, exit code
+    """
+    return _run_console_tool(
+        str(choose_python_exe(lab_path=root_dir)),
+        ["-m", "pylint", "--rcfile", str(path_to_config), "--list-msgs-enabled"],
+        cwd=root_dir,
+    )
+
+
+def are_cross_module_checks_enabled(path_to_config: Path, root_dir: Path) -> bool:
+    """
+    Determine whether pylint compares modules with each other with the config.
+
+    Args:
+        path_to_config (Path): Path to the config.
+        root_dir (Path): Root directory of the project.
+
+    Returns:
+        bool: True if any message of CROSS_MODULE_MESSAGES is enabled
+    """
+    stdout, _, _ = list_enabled_lint_messages(path_to_config, root_dir)
+    enabled_section = stdout.partition("Disabled messages:")[0]
+    return any(
+        line.split()[0] in CROSS_MODULE_MESSAGES
+        for line in enabled_section.splitlines()
+        if line.startswith(" ")
+    )
+
+
+def get_labs_modules(
+    labs_paths: list[Path], root_dir: Path, ignore_tests: bool
+) -> dict[Path, list[Path]]:
+    """
+    Get Python files of labs pylint is to check.
+
+    Args:
+        labs_paths (list[Path]): Paths to labs.
+        root_dir (Path): Root directory of the project.
+        ignore_tests (bool): Skip tests directories.
+
+    Returns:
+        dict[Path, list[Path]]: Paths to modules of each lab
+    """
+    file_index = FileIndex(root_dir)
+    return {
+        lab_path: [
+            module_path
+            for module_path in file_index.with_suffix(".py", directory=lab_path)
+            if not (ignore_tests and "tests" in module_path.relative_to(lab_path).parts[:-1])
+        ]
+        for lab_path in labs_paths
+    }
+
+
+def check_labs_lint_with_cache(
+    labs_to_check: list[tuple[Path, int]],
+    path_to_config: Path,
+    root_dir: Path,
+    jobs: int,
+    ignore_tests: bool,
+    cache_size_mb: int,
+) -> dict[str, bool]:
+    """
+    Run lint checks for modules of labs without stored results and check score of each lab.
+
+    Modules of each lab with a cache miss are linted in a separate pylint run,
+    and their results are merged with stored results of the rest of modules of the lab.
+
+    Args:
+        labs_to_check (list[tuple[Path, int]]): Pairs of lab path and target score.
+        path_to_config (Path): Path to the config.
+        root_dir (Path): Root directory of the project.
+        jobs (int): Number of pylint runs at once.
+        ignore_tests (bool): Skip tests directories.
+        cache_size_mb (int): Maximum size of the cache in megabytes.
+
+    Returns:
+        dict[str, bool]: Whether each lab passed the check
+    """
+    if not labs_to_check:
+        return {}
+    cache = LintCache(
+        root_dir,
+        path_to_config,
+        get_lint_version(root_dir)[0],
+        cache_size_mb,
+        are_cross_module_checks_enabled(path_to_config, root_dir),
+    )
+    labs_outputs, labs_changed_paths = cache.partition(
+        get_labs_modules([lab_path for lab_path, _ in labs_to_check], root_dir, ignore_tests)
+    )
+    run_concurrently(
+        (
+            check_lint_on_paths_async(
+                changed_paths,
+                path_to_config,
+                root_dir,
+                get_lint_output_path(root_dir, lab_path.name),
+                exit_zero=True,
+            )
+            for lab_path, changed_paths in labs_changed_paths.items()
+        ),
+        jobs=jobs,
+    )
+    for lab_path in labs_changed_paths:
+        try:
+            fresh_output = json.loads(
+                read_lint_output_file(get_lint_output_path(root_dir, lab_path.name))
+            )
+            cache.store(fresh_output)
+        except (ValueError, KeyError) as error:
+            logger.error(f"\nLint results of {lab_path.name} cannot be read: {error}\n")
+            fresh_output = {"messages": [], "modules": {}, "paths": {}}
+        labs_outputs[lab_path] = merge_lint_outputs([labs_outputs[lab_path], fresh_output])
+
+    labs_results = {}
+    for lab_path, target_score in labs_to_check:
+        logger.info(f"Lint results for lab {lab_path}")
+        lint_report = read_lint_output(
+            labs_outputs[lab_path], root_dir, lab_path.name, directory=lab_path
+        )
+        labs_results[lab_path.name] = check_lint_level(lint_report, target_score)
+    return labs_results
+
+
+def check_labs_lint_output(
+    lint_output: str | dict[str, Any], labs_to_check: list[tuple[Path, int]], root_dir: Path
+) -> dict[str, bool]:
+    """
+    Check score of each lab in results of a pylint run over several labs.
+
+    Args:
+        lint_output (str | dict[str, Any]): Pylint check output, parsed or not.
+        labs_to_check (list[tuple[Path, int]]): Pairs of lab path and target score.
+        root_dir (Path): Root directory of the project.
+
+    Returns:
+        dict[str, bool]: Whether each lab passed the check
+    """
+    labs_results = {}
+    for lab_path, target_score in labs_to_check:
+        logger.info(f"Lint results for lab {lab_path}")
+        lint_report = read_lint_output(lint_output, root_dir, lab_path.name, directory=lab_path)
+        labs_results[lab_path.name] = check_lint_level(lint_report, target_score)
+    return labs_results
+
+
+def check_labs_lint_separately(
+    labs_to_check: list[tuple[Path, int]],
+    path_to_config: Path,
+    root_dir: Path,
+    jobs: int,
+    ignore_tests: bool,
+    durations: LabDurations,
+) -> dict[str, bool]:
+    """
+    Run lint checks for each lab in a separate pylint run and check its score.
+
+    Args:
+        labs_to_check (list[tuple[Path, int]]): Pairs of lab path and target score.
+        path_to_config (Path): Path to the config.
+        root_dir (Path): Root directory of the project.
+        jobs (int): Number of pylint runs at once.
+        ignore_tests (bool): Ignore lint argument.
+        durations (LabDurations): Storage of durations of labs checks.
+
+    Returns:
+        dict[str, bool]: Whether each lab passed the check
+    """
+    results = run_concurrently(
+        (
+            durations.measure_async(
+                lab_path.name,
+                check_lint_on_paths_async(
+                    [lab_path],
+                    path_to_config,
+                    ignore_tests=ignore_tests,
+                    exit_zero=True,
+                    root_dir=root_dir,
+                    output_path=get_lint_output_path(root_dir, lab_path.name),
+                ),
+            )
+            for lab_path, _ in labs_to_check
+        ),
+        jobs=jobs,
+    )
+    labs_results = {}
+    for (lab_path, target_score), result in zip(labs_to_check, results):
+        logger.info(f"Lint results for lab {lab_path}")
+        labs_results[lab_path.name] = log_console_result(result) and check_lint_level(
+            read_lint_output(
+                read_lint_output_file(get_lint_output_path(root_dir, lab_path.name)),
+                root_dir,
+                lab_path.name,
+                directory=lab_path,
+            ),
+            target_score,
+        )
+    return labs_results
+
+
+def read_lint_output(
+    lint_output: str | dict[str, Any], root_dir: Path, name: str, directory: Optional[Path] = None
+) -> Optional[LintReport]:
+    """
+    Read results of a pylint run and store them for further use.
+
+    Args:
+        lint_output (str | dict[str, Any]): Pylint check output, parsed or not.
+        root_dir (Path): Root directory of the project.
+        name (str): Name of the lab or addons.
+        directory (Optional[Path]): Directory to take modules of, all modules by default.
+
+    Returns:
+        Optional[LintReport]: Results of the run, None if the output cannot be read
+    """
+    try:
+        lint_report = (
+            parse_lint_output(lint_output, directory)
+            if isinstance(lint_output, str)
+            else summarize_lint_output(lint_output, directory)
+        )
+    except ValueError as error:
+        logger.error(f"\nLint results cannot be read: {error}\n")
+        return None
+    save_lint_report(lint_report, get_lint_report_path(root_dir, name))
+    return lint_report
 
 
-def check_lint_level(lint_output: str, target_score: int) -> bool:
+def check_lint_level(lint_report: Optional[LintReport], target_score: int) -> bool:
     """
     Run lint level check for the project.
 
     Args:
-        lint_output (str): Pylint check output.
+        lint_report (Optional[LintReport]): Results of pylint run.
         target_score (int): Target score.
 
     Returns:
@@ -125,7 +526,33 @@ def check_lint_level(lint_output: str, target_score: int) -> bool:
     if not target_lint_level:
         logger.error("\nInvalid value for target score: accepted are 4, 6, 8, 10.\n")
         return False
-    return is_passed(lint_output, target_lint_level)
+    if lint_report is None:
+        return False
+    logger.info(f"Lint score is {lint_report.score:.2f}")
+    return is_passed(lint_report.score, target_lint_level)
+
+
+def get_labs_target_scores(labs_list: list[Path], root_dir: Path) -> list[tuple[Path, int]]:
+    """
+    Get target scores of labs that should be linted.
+
+    Args:
+        labs_list (list[Path]): Paths to labs.
+        root_dir (Path): Root directory of the project.
+
+    Returns:
+        list[tuple[Path, int]]: Pairs of lab path and target score.
+    """
+    labs_to_check = []
+    for lab_path in labs_list:
+
+        if "settings.json" in listdir(lab_path):
+            target_score = LabSettings(root_dir / f"{lab_path}/settings.json").target_score
+            if target_score == 0:
+                logger.info("Skipping check")
+                continue
+            labs_to_check.append((lab_path, target_score))
+    return labs_to_check
 
 
 def parse_arguments() -> argparse.Namespace:
@@ -155,42 +582,58 @@ def main() -> None:
 
     fileConfig(toml_config)
 
-    check_is_failed = False
+    labs_results = {}
 
-    addons_paths = project_config.get_addons_paths(root_dir=root_dir)
-    if addons_paths:
-        stdout, _, _ = check_lint_on_paths(
+    addons_paths = select_changed_paths(
+        project_config.get_addons_paths(root_dir=root_dir), root_dir, args.changed_since
+    )
+    if addons_paths and is_first_shard(args.shard):
+        addons_output_path = get_lint_output_path(root_dir, "addons")
+        check_lint_on_paths(
             addons_paths,
             toml_config,
             exit_zero=True,
             root_dir=root_dir,
+            output_path=addons_output_path,
+        )
+        labs_results["addons"] = check_lint_level(
+            read_lint_output(read_lint_output_file(addons_output_path), root_dir, "addons"), 10
         )
-        if not check_lint_level(stdout, 10):
+        if not labs_results["addons"]:
             msg = ", ".join(str(i) for i in addons_paths)
             logger.info(f"Running lint on {msg} failed!")
-            check_is_failed = True
-
-    labs_list = project_config.get_labs_paths(root_dir=root_dir)
-    for lab_path in labs_list:
-
-        if "settings.json" in listdir(lab_path):
-            target_score = LabSettings(root_dir / f"{lab_path}/settings.json").target_score
-            if target_score == 0:
-                logger.info("Skipping check")
-                continue
 
-            logger.info(f"Running lint for lab {lab_path}")
-            stdout, _, _ = check_lint_on_paths(
-                [lab_path],
-                toml_config,
-                ignore_tests=args.repository_type == "public",
-                exit_zero=True,
-                root_dir=root_dir,
+    durations = LabDurations(root_dir, "check_lint")
+    labs_to_check = get_labs_target_scores(
+        durations.select_shard_paths(
+            select_changed_paths(
+                project_config.get_labs_paths(root_dir=root_dir), root_dir, args.changed_since
+            ),
+            args.shard,
+        ),
+        root_dir,
+    )
+
+    ignore_tests = args.repository_type == "public"
+    if args.use_cache:
+        labs_results.update(
+            check_labs_lint_with_cache(
+                labs_to_check, toml_config, root_dir, args.jobs, ignore_tests, args.cache_size_mb
+            )
+        )
+    elif args.batch:
+        labs_results.update(
+            check_labs_lint_in_batch(labs_to_check, toml_config, root_dir, args.jobs, ignore_tests)
+        )
+    else:
+        labs_results.update(
+            check_labs_lint_separately(
+                labs_to_check, toml_config, root_dir, args.jobs, ignore_tests, durations
             )
-            if not check_lint_level(stdout, target_score):
-                check_is_failed = True
+        )
 
-    if check_is_failed:
+    write_shard_results(root_dir, "check_lint", args.shard, labs_results, durations)
+    if not all(labs_results.values()):
         logger.error("\nSome of checks were failed. Fix it.")
         sys.exit(1)
 
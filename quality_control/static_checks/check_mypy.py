@@ -2,28 +2,118 @@
 Check mypy for type checking in Python code.
 """
 
+import os
+import re
+import shutil
+import sys
 from os import listdir
 from pathlib import Path
+from typing import Optional
 
 # pylint: disable=duplicate-code
 from logging518.config import fileConfig
 
+from quality_control.changed_labs import select_changed_paths
 from quality_control.cli_unifier import (
     _run_console_tool,
+    _run_console_tool_async,
     choose_python_exe,
     handles_console_error,
+    handles_console_error_async,
+    log_console_result,
+    run_concurrently,
 )
 from quality_control.console_logging import get_child_logger
 from quality_control.lab_settings import LabSettings
 from quality_control.project_config import ProjectConfig
+from quality_control.sharding import is_first_shard, LabDurations, write_shard_results
 from quality_control.static_checks.check_black import QualityControlArgumentsParser
 
 logger = get_child_logger(__file__)
 
+MYPY_ERROR_PATTERN = re.compile(r"^(?P<path>.+?):\d+(?::\d+)?: error:", re.MULTILINE)
+
+
+class MypyArgumentsParser(QualityControlArgumentsParser):
+    """
+    CLI for mypy checks.
+    """
+
+    batch: bool = False
+    daemon: bool = False
+    stop: bool = False
+
+
+def prepare_mypy_args(
+    paths: list[Path], path_to_config: Path, cache_dir: Optional[Path] = None
+) -> list[str]:
+    """
+    Build the arguments for running mypy.
+
+    Args:
+        paths (list[Path]): Paths to the projects.
+        path_to_config (Path): Path to the config.
+        cache_dir (Optional[Path]): Path to the incremental cache of mypy.
+
+    Returns:
+        list[str]: List of arguments for mypy
+    """
+    mypy_args = [
+        "-m",
+        "mypy",
+        *map(str, filter(lambda x: x.exists(), paths)),
+        "--config-file",
+        str(path_to_config),
+    ]
+    if cache_dir is not None:
+        mypy_args.extend(["--cache-dir", str(cache_dir)])
+    return mypy_args
+
+
+@handles_console_error()
+def get_mypy_version(root_dir: Path) -> tuple[str, str, int]:
+    """
+    Get version of mypy of the project.
+
+    Args:
+        root_dir (Path): Root directory of the project.
+
+    Returns:
+        tuple[str, str, int]: stdout, stderr, exit code
+    """
+    return _run_console_tool(
+        str(choose_python_exe(lab_path=root_dir)), ["-m", "mypy", "--version"], cwd=root_dir
+    )
+
+
+def prepare_mypy_cache_dir(root_dir: Path) -> Path:
+    """
+    Get persistent cache directory for the version of mypy, removing ones of other versions.
+
+    The directory can be saved and restored between CI runs as a whole.
+
+    Args:
+        root_dir (Path): Root directory of the project.
+
+    Returns:
+        Path: Path to the incremental cache of mypy
+    """
+    stdout, _, _ = get_mypy_version(root_dir)
+    version = re.sub(r"[^\w.]+", "-", stdout.split("(")[0].strip())
+    caches_dir = root_dir / "build" / "mypy_cache"
+    if caches_dir.exists():
+        for stale_dir in caches_dir.iterdir():
+            if stale_dir.name != version:
+                logger.info(f"Removing mypy cache of another version {stale_dir.name}")
+                shutil.rmtree(stale_dir, ignore_errors=True)
+    cache_dir = caches_dir / version
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    return cache_dir
+
 
 @handles_console_error()
 def check_mypy_on_paths(
-    paths: list[Path], path_to_config: Path, root_dir: Path
+    paths: list[Path], path_to_config: Path, root_dir: Path, cache_dir: Optional[Path] = None
 ) -> tuple[str, str, int]:
     """
     Run mypy checks for the project.
@@ -31,28 +121,257 @@ def check_mypy_on_paths(
     Args:
         paths (list[Path]): Paths to the projects.
         path_to_config (Path): Path to the config.
+        root_dir (Path): Root directory of the project.
+        cache_dir (Optional[Path]): Path to the incremental cache of mypy.
 
     Returns:
         tuple[str, str, int]: stdout, stderr, exit code
     """
-    mypy_args = [
-        "-m",
-        "mypy",
-        *map(str, filter(lambda x: x.exists(), paths)),
+    return _run_console_tool(
+        str(choose_python_exe(lab_path=root_dir)),
+        prepare_mypy_args(paths, path_to_config, cache_dir),
+        debug=True,
+        cwd=root_dir,
+    )
+
+
+@handles_console_error_async()
+async def check_mypy_on_paths_async(
+    paths: list[Path], path_to_config: Path, root_dir: Path, cache_dir: Optional[Path] = None
+) -> tuple[str, str, int]:
+    """
+    Run mypy checks for the project without blocking other checks.
+
+    Args:
+        paths (list[Path]): Paths to the projects.
+        path_to_config (Path): Path to the config.
+        root_dir (Path): Root directory of the project.
+        cache_dir (Optional[Path]): Path to the incremental cache of mypy.
+
+    Returns:
+        tuple[str, str, int]: stdout, stderr, exit code
+    """
+    return await _run_console_tool_async(
+        str(choose_python_exe(lab_path=root_dir)),
+        prepare_mypy_args(paths, path_to_config, cache_dir),
+        debug=True,
+        cwd=root_dir,
+    )
+
+
+@handles_console_error(ok_codes=(0, 1))
+def check_mypy_on_labs(
+    labs_paths: list[Path], path_to_config: Path, root_dir: Path, cache_dir: Path
+) -> tuple[str, str, int]:
+    """
+    Run mypy checks for several labs at once.
+
+    Args:
+        labs_paths (list[Path]): Paths to labs.
+        path_to_config (Path): Path to the config.
+        root_dir (Path): Root directory of the project.
+        cache_dir (Path): Path to the incremental cache of mypy.
+
+    Returns:
+        tuple[str, str, int]: stdout, stderr, exit code
+    """
+    return _run_console_tool(
+        str(choose_python_exe(lab_path=root_dir)),
+        [*prepare_mypy_args(labs_paths, path_to_config, cache_dir), "--show-absolute-path"],
+        debug=True,
+        cwd=root_dir,
+    )
+
+
+def prepare_dmypy_args(root_dir: Path, command: list[str]) -> list[str]:
+    """
+    Build the arguments for running a command of the mypy daemon client.
+
+    Args:
+        root_dir (Path): Root directory of the project.
+        command (list[str]): Command of dmypy with its arguments.
+
+    Returns:
+        list[str]: List of arguments for dmypy
+    """
+    status_path = root_dir / "build" / "dmypy.json"
+    status_path.parent.mkdir(parents=True, exist_ok=True)
+    return ["-m", "mypy.dmypy", "--status-file", str(status_path), *command]
+
+
+@handles_console_error(ok_codes=(0, 1))
+def check_mypy_with_daemon(
+    labs_paths: list[Path], path_to_config: Path, root_dir: Path
+) -> tuple[str, str, int]:
+    """
+    Run mypy checks for several labs with the daemon, starting it if necessary.
+
+    The daemon keeps the state of the previous check, so only changed files are rechecked.
+    It is started without PYTHONPATH, as mypy takes its entries for installed packages
+    and the daemon does not watch changes of them.
+
+    Args:
+        labs_paths (list[Path]): Paths to labs.
+        path_to_config (Path): Path to the config.
+        root_dir (Path): Root directory of the project.
+
+    Returns:
+        tuple[str, str, int]: stdout, stderr, exit code
+    """
+    command = [
+        "run",
+        "--",
+        *map(str, filter(lambda x: x.exists(), labs_paths)),
         "--config-file",
         str(path_to_config),
+        "--show-absolute-path",
     ]
+    return _run_console_tool(
+        str(choose_python_exe(lab_path=root_dir)),
+        prepare_dmypy_args(root_dir, command),
+        debug=True,
+        cwd=root_dir,
+        env={name: value for name, value in os.environ.items() if name != "PYTHONPATH"},
+    )
 
+
+@handles_console_error(ok_codes=(0, 2))
+def stop_mypy_daemon(root_dir: Path) -> tuple[str, str, int]:
+    """
+    Stop the mypy daemon of the project.
+
+    Args:
+        root_dir (Path): Root directory of the project.
+
+    Returns:
+        tuple[str, str, int]: stdout, stderr, exit code
+    """
     return _run_console_tool(
-        str(choose_python_exe(lab_path=root_dir)), mypy_args, debug=True, cwd=root_dir
+        str(choose_python_exe(lab_path=root_dir)),
+        prepare_dmypy_args(root_dir, ["stop"]),
+        cwd=root_dir,
     )
 
 
+def get_labs_mypy_results(
+    mypy_output: str, return_code: int, labs_paths: list[Path], root_dir: Path
+) -> dict[str, bool]:
+    """
+    Determine whether each lab passed mypy checks by paths of files with errors.
+
+    Errors outside of labs fail all of them, as any lab could import the file.
+    Paths may be relative even with --show-absolute-path, as mypy replays errors
+    from its cache in the format of the run that stored them.
+
+    Args:
+        mypy_output (str): Output of mypy.
+        return_code (int): Exit code of mypy.
+        labs_paths (list[Path]): Paths to labs.
+        root_dir (Path): Root directory of the project relative paths are resolved against.
+
+    Returns:
+        dict[str, bool]: Whether each lab passed the check
+    """
+    labs_results = {lab_path.name: True for lab_path in labs_paths}
+    failed_paths = {
+        (root_dir / match.group("path")).resolve()
+        for match in MYPY_ERROR_PATTERN.finditer(mypy_output)
+    }
+    if return_code and not failed_paths:
+        logger.error("Mypy failed without errors in files.")
+        return dict.fromkeys(labs_results, False)
+    for failed_path in sorted(failed_paths):
+        failed_labs = [
+            lab_path for lab_path in labs_paths if failed_path.is_relative_to(lab_path.resolve())
+        ]
+        if not failed_labs:
+            logger.error(f"Mypy found errors in {failed_path} outside of labs.")
+            return dict.fromkeys(labs_results, False)
+        for lab_path in failed_labs:
+            labs_results[lab_path.name] = False
+    return labs_results
+
+
+def check_labs_mypy_in_batch(
+    labs_to_check: list[Path],
+    path_to_config: Path,
+    root_dir: Path,
+    cache_dir: Path,
+    daemon: bool = False,
+) -> dict[str, bool]:
+    """
+    Run mypy checks for all labs in a single mypy run.
+
+    Args:
+        labs_to_check (list[Path]): Paths to labs.
+        path_to_config (Path): Path to the config.
+        root_dir (Path): Root directory of the project.
+        cache_dir (Path): Path to the incremental cache of mypy.
+        daemon (bool): Check with the mypy daemon instead of a new mypy process.
+
+    Returns:
+        dict[str, bool]: Whether each lab passed the check
+    """
+    if not labs_to_check:
+        return {}
+    if daemon:
+        stdout, _, return_code = check_mypy_with_daemon(labs_to_check, path_to_config, root_dir)
+    else:
+        stdout, _, return_code = check_mypy_on_labs(
+            labs_to_check, path_to_config, root_dir, cache_dir
+        )
+    labs_results = get_labs_mypy_results(stdout, return_code, labs_to_check, root_dir)
+    for lab_name, is_lab_passed in labs_results.items():
+        logger.info(f"Mypy results for lab {lab_name}: {'passed' if is_lab_passed else 'failed'}")
+    return labs_results
+
+
+def check_labs_mypy_separately(
+    labs_to_check: list[Path],
+    path_to_config: Path,
+    root_dir: Path,
+    cache_dir: Path,
+    jobs: int,
+    durations: LabDurations,
+) -> dict[str, bool]:
+    """
+    Run mypy checks for each lab in a separate mypy run.
+
+    Args:
+        labs_to_check (list[Path]): Paths to labs.
+        path_to_config (Path): Path to the config.
+        root_dir (Path): Root directory of the project.
+        cache_dir (Path): Path to the incremental cache of mypy.
+        jobs (int): Number of mypy runs at once.
+        durations (LabDurations): Storage of durations of labs checks.
+
+    Returns:
+        dict[str, bool]: Whether each lab passed the check
+    """
+    results = run_concurrently(
+        (
+            durations.measure_async(
+                lab_path.name,
+                check_mypy_on_paths_async(
+                    [lab_path], path_to_config, root_dir=root_dir, cache_dir=cache_dir
+                ),
+            )
+            for lab_path in labs_to_check
+        ),
+        jobs=jobs,
+    )
+    labs_results = {}
+    for lab_path, result in zip(labs_to_check, results):
+        logger.info(f"Mypy results for lab {lab_path}")
+        labs_results[lab_path.name] = log_console_result(result)
+    return labs_results
+
+
 def main() -> None:
     """
     Run mypy checks for the project.
     """
-    args = QualityControlArgumentsParser(underscores_to_dashes=True).parse_args()
+    args = MypyArgumentsParser(underscores_to_dashes=True).parse_args()
 
     root_dir = args.root_dir.resolve()
     toml_config = (args.toml_config_path or (root_dir / "pyproject.toml")).resolve()
@@ -61,24 +380,52 @@ def main() -> None:
     project_config = ProjectConfig(project_config_path)
     fileConfig(toml_config)
 
-    addons_paths = project_config.get_addons_paths(root_dir=root_dir)
-    if addons_paths:
+    if args.stop:
+        stop_mypy_daemon(root_dir)
+        return
+    cache_dir = prepare_mypy_cache_dir(root_dir)
+
+    addons_paths = select_changed_paths(
+        project_config.get_addons_paths(root_dir=root_dir), root_dir, args.changed_since
+    )
+    if addons_paths and is_first_shard(args.shard):
         logger.info(f"Running mypy on {' '.join(str(i) for i in addons_paths)}")
         check_mypy_on_paths(
             addons_paths,
             toml_config,
             root_dir=root_dir,
+            cache_dir=cache_dir,
         )
     print(f"ROOT DIR: {root_dir}")
 
-    labs_list = project_config.get_labs_paths(root_dir=root_dir)
+    durations = LabDurations(root_dir, "check_mypy")
+    labs_to_check = []
+    labs_list = durations.select_shard_paths(
+        select_changed_paths(
+            project_config.get_labs_paths(root_dir=root_dir), root_dir, args.changed_since
+        ),
+        args.shard,
+    )
     for lab_path in labs_list:
         if "settings.json" in listdir(lab_path):
             target_score = LabSettings(root_dir / f"{lab_path}/settings.json").target_score
 
             if target_score > 7:
-                logger.info(f"Running mypy for lab {lab_path}")
-                check_mypy_on_paths([lab_path], toml_config, root_dir=root_dir)
+                labs_to_check.append(lab_path)
+
+    if args.batch or args.daemon:
+        labs_results = check_labs_mypy_in_batch(
+            labs_to_check, toml_config, root_dir, cache_dir, daemon=args.daemon
+        )
+    else:
+        labs_results = check_labs_mypy_separately(
+            labs_to_check, toml_config, root_dir, cache_dir, args.jobs, durations
+        )
+
+    write_shard_results(root_dir, "check_mypy", args.shard, labs_results, durations)
+    if not all(labs_results.values()):
+        logger.error("\nSome of checks were failed. Fix it.")
+        sys.exit(1)
 
 
 if __name__ == "__main__":
@@ -2,18 +2,27 @@
 Check newline at the end of a file.
 """
 
+import codecs
+import mmap
+import os
 import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Optional
 
 from logging518.config import fileConfig
 
 from quality_control.console_logging import get_child_logger
+from quality_control.file_index import FileIndex
 from quality_control.project_config import ProjectConfig
 from quality_control.static_checks.check_black import QualityControlArgumentsParser
 
 logger = get_child_logger(__file__)
 
+SAMPLE_SIZE = 8192
+MMAP_THRESHOLD = 1024 * 1024
+
 
 def get_all_files(root_dir: Path) -> list[Path]:
     """
@@ -25,7 +34,7 @@ def get_all_files(root_dir: Path) -> list[Path]:
     Returns:
         list[Path]: List of all non-empty files collected
     """
-    return [path for path in root_dir.rglob("*") if path.is_file() and path.stat().st_size != 0]
+    return [file.path for file in FileIndex(root_dir).files if file.size != 0]
 
 
 def compile_patterns(patterns: list[str]) -> list[re.Pattern]:
@@ -76,12 +85,76 @@ def filter_paths(paths: list[Path], patterns: list[re.Pattern]) -> list[Path]:
     return [path for path in paths if not is_excluded(path, patterns)]
 
 
-def has_newline(paths: list[Path]) -> bool:
+def read_edges(path: Path) -> tuple[bytes, bytes]:
+    """
+    Read the beginning and the last byte of a file.
+
+    Large files are mapped into memory instead of being read through a buffer.
+
+    Args:
+        path (Path): Path to file
+
+    Returns:
+        tuple[bytes, bytes]: Head sample and the last byte, empty for an empty file
+    """
+    with path.open("rb") as file:
+        size = os.fstat(file.fileno()).st_size
+        if not size:
+            return b"", b""
+        if size >= MMAP_THRESHOLD:
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return mapped[:SAMPLE_SIZE], mapped[-1:]
+        head = file.read(SAMPLE_SIZE)
+        if size <= SAMPLE_SIZE:
+            return head, head[-1:]
+        file.seek(-1, os.SEEK_END)
+        return head, file.read(1)
+
+
+def is_text(sample: bytes, final: bool) -> bool:
+    """
+    Guess whether a file is a UTF-8 text by its head sample.
+
+    Args:
+        sample (bytes): Beginning of the file
+        final (bool): Whether the sample is the whole file
+
+    Returns:
+        bool: True if the sample has no NUL bytes and decodes as UTF-8
+    """
+    if b"\0" in sample:
+        return False
+    try:
+        codecs.getincrementaldecoder("utf-8")().decode(sample, final=final)
+    except UnicodeDecodeError:
+        return False
+    return True
+
+
+def check_file_ending(path: Path) -> Optional[bool]:
+    """
+    Check a newline at the end of a single file.
+
+    Args:
+        path (Path): Path to file
+
+    Returns:
+        Optional[bool]: Has newline or not, None for non-text files
+    """
+    head, last_byte = read_edges(path)
+    if not is_text(head, final=len(head) < SAMPLE_SIZE):
+        return None
+    return not last_byte or last_byte in (b"\n", b"\r")
+
+
+def has_newline(paths: list[Path], jobs: Optional[int] = None) -> bool:
     """
     Check for a newline at the end.
 
     Args:
         paths (list[Path]): Appropriate paths
+        jobs (Optional[int]): Number of files checked at the same time, default of
+            ThreadPoolExecutor if None
 
     Returns:
         bool: Has newline or not
@@ -89,17 +162,18 @@ def has_newline(paths: list[Path]) -> bool:
     bad_paths = []
     check_is_good = True
 
-    for path in sorted(paths):
+    sorted_paths = sorted(paths)
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        endings = executor.map(check_file_ending, sorted_paths)
+
+    for path, ending in zip(sorted_paths, endings):
         logger.info(f"Analyzing {path}")
 
-        try:
-            with open(path, encoding="utf-8") as file:
-                lines = file.readlines()
-        except UnicodeDecodeError:
+        if ending is None:
             logger.info(f"Skipping non-text file: {path}")
             continue
 
-        if lines and not lines[-1].endswith("\n"):
+        if not ending:
             bad_paths.append(path)
             check_is_good = False
 
@@ -131,7 +205,7 @@ def main() -> None:
     all_files = get_all_files(root_dir)
     filtered_files = filter_paths(all_files, patterns)
 
-    result = has_newline(filtered_files)
+    result = has_newline(filtered_files, args.jobs)
     sys.exit(not result)
 
 
@@ -11,6 +11,7 @@ from logging518.config import fileConfig
 
 from quality_control.console_logging import get_child_logger
 from quality_control.constants import PROJECT_ROOT
+from quality_control.file_index import FileIndex
 from quality_control.static_checks.check_black import QualityControlArgumentsParser
 
 logger = get_child_logger(__file__)
@@ -23,7 +24,7 @@ def get_paths(root_dir: Path) -> list[Path]:
     Returns:
         list[Path]: Paths to non-python files
     """
-    return [path for path in root_dir.rglob("requirements*.txt") if "venv" not in str(path)]
+    return FileIndex(root_dir).select("requirements*.txt")
 
 
 def get_requirements(path: Path) -> list:
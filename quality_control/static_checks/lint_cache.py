@@ -0,0 +1,155 @@
+"""
+Storage of pylint results of modules for reuse while modules and their imports stay unchanged.
+"""
+
+import json
+from pathlib import Path
+from typing import Any
+
+from quality_control.console_logging import get_child_logger
+from quality_control.hashing import hash_file, hash_paths, hash_strings
+from quality_control.import_closure import get_import_closure
+from quality_control.verdict_cache import evict_least_recently_used
+
+logger = get_child_logger(__file__)
+
+CROSS_MODULE_MESSAGES = ("duplicate-code", "cyclic-import")
+
+
+class LintCache:
+    """
+    Statistics and messages of modules from pylint runs with hash of their inputs.
+
+    Results of a module depend on its own file and files it imports, directly or not.
+    Checkers comparing modules with each other, such as duplicate-code and cyclic-import,
+    make results depend on all modules of the lab, so with them enabled a change
+    of any module invalidates results of the whole lab.
+    """
+
+    def __init__(
+        self,
+        root_dir: Path,
+        path_to_config: Path,
+        lint_version: str,
+        max_size_mb: int,
+        cross_module: bool,
+    ) -> None:
+        """
+        Initialize LintCache.
+
+        Args:
+            root_dir (Path): Root directory of the project
+            path_to_config (Path): Path to the config of pylint
+            lint_version (str): Versions of pylint, astroid and Python
+            max_size_mb (int): Maximum size of the cache in megabytes
+            cross_module (bool): Whether checkers comparing modules with each other are enabled
+        """
+        self._root_dir = root_dir
+        self._max_size = max_size_mb * 1024 * 1024
+        self._cache_dir = root_dir / "build" / "lint_cache"
+        self._cross_module = cross_module
+        self._keys: dict[Path, str] = {}
+        self._imports: dict[Path, list[Path]] = {}
+        self._shared_hash = hash_strings(
+            hash_paths([path_to_config], root_dir), lint_version, str(cross_module)
+        )
+
+    def compute_key(self, module_path: Path, lab_hash: str = "") -> str:
+        """
+        Get hash of a module, files it imports, the config and versions of tools.
+
+        Args:
+            module_path (Path): Path to the module
+            lab_hash (str): Hash of all modules of the lab if results depend on them
+
+        Returns:
+            str: Cache key
+        """
+        return hash_strings(
+            self._shared_hash,
+            lab_hash,
+            module_path.relative_to(self._root_dir).as_posix(),
+            hash_file(module_path),
+            *(
+                hash_file(imported_path)
+                for imported_path in get_import_closure(module_path, self._root_dir, self._imports)
+            ),
+        )
+
+    def partition(
+        self, labs_modules: dict[Path, list[Path]]
+    ) -> tuple[dict[Path, dict[str, Any]], dict[Path, list[Path]]]:
+        """
+        Split modules of each lab into ones with stored results and ones to be linted.
+
+        Args:
+            labs_modules (dict[Path, list[Path]]): Paths to modules of each lab
+
+        Returns:
+            tuple[dict[Path, dict[str, Any]], dict[Path, list[Path]]]: Stored results
+                of each lab in the form of pylint output and paths to modules without them
+                of labs to be linted
+        """
+        labs_hits = {}
+        labs_misses = {}
+        for lab_path, modules_paths in labs_modules.items():
+            lab_hash = hash_paths(modules_paths, self._root_dir) if self._cross_module else ""
+            hits: dict[str, Any] = {"messages": [], "modules": {}, "paths": {}}
+            misses = []
+            for module_path in modules_paths:
+                key = self._keys[module_path] = self.compute_key(module_path, lab_hash)
+                entry_path = self._cache_dir / f"{key}.json"
+                if not entry_path.exists():
+                    misses.append(module_path)
+                    continue
+                entry_path.touch()
+                entry = json.loads(entry_path.read_text(encoding="utf-8"))
+                hits["messages"].extend(entry["messages"])
+                hits["modules"][entry["module"]] = entry["stats"]
+                hits["paths"][entry["module"]] = str(module_path)
+                hits["evaluation"] = entry["evaluation"]
+            if misses and self._cross_module:
+                hits = {"messages": [], "modules": {}, "paths": {}}
+                misses = modules_paths
+            if misses:
+                labs_misses[lab_path] = misses
+            labs_hits[lab_path] = hits
+            logger.info(
+                f"Lint results of {len(hits['modules'])} modules of {lab_path.name} "
+                "are reused from cache."
+            )
+        return labs_hits, labs_misses
+
+    def store(self, lint_output: dict[str, Any]) -> None:
+        """
+        Store results of modules linted after partitioning.
+
+        Args:
+            lint_output (dict[str, Any]): Parsed output of pylint with ModuleStatsReporter
+        """
+        self._cache_dir.mkdir(parents=True, exist_ok=True)
+        for module_name, module_path in lint_output["paths"].items():
+            if (key := self._keys.get(Path(module_path))) is None:
+                continue
+            (self._cache_dir / f"{key}.json").write_text(
+                json.dumps(
+                    {
+                        "module": module_name,
+                        "stats": lint_output["modules"][module_name],
+                        "messages": [
+                            message
+                            for message in lint_output["messages"]
+                            if message["module"] == module_name
+                        ],
+                        "evaluation": lint_output["evaluation"],
+                    }
+                ),
+                encoding="utf-8",
+            )
+        self.evict()
+
+    def evict(self) -> None:
+        """
+        Remove least recently used results until the cache fits into its size.
+        """
+        evict_least_recently_used(self._cache_dir, self._max_size)
@@ -0,0 +1,213 @@
+"""
+Results of pylint runs read from the machine-readable report.
+"""
+
+import json
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from pydantic.dataclasses import dataclass
+
+MESSAGE_TYPES = ("fatal", "error", "warning", "refactor", "convention", "info", "statement")
+
+
+@dataclass
+class LintReport:
+    """
+    DTO for storing results of a pylint run.
+    """
+
+    score: float
+    modules: dict[str, dict[str, int]]
+    files: dict[str, dict[str, int]]
+
+
+def evaluate_lint_score(evaluation: str, counts: dict[str, int]) -> float:
+    """
+    Compute lint score with the evaluation formula of pylint.
+
+    Args:
+        evaluation (str): Python expression of the score
+        counts (dict[str, int]): Numbers of messages of each type and of statements
+
+    Returns:
+        float: Lint score
+    """
+    # the formula comes from the rcfile of the project, the same way pylint evaluates it
+    score = eval(  # pylint: disable=eval-used
+        evaluation, {}, {**counts, "statement": counts["statement"] or 1}
+    )
+    return float(score)
+
+
+def summarize_lint_output(
+    parsed_output: dict[str, Any], directory: Optional[Path] = None
+) -> LintReport:
+    """
+    Collect statistics of modules, message counts of files and score.
+
+    Args:
+        parsed_output (dict[str, Any]): Parsed output of pylint with ModuleStatsReporter
+        directory (Optional[Path]): Directory to take modules of, all modules by default
+
+    Returns:
+        LintReport: Results of the run
+
+    Raises:
+        ValueError: If the output is not a report of ModuleStatsReporter
+            or has no modules of the directory
+    """
+
+    def is_selected(file_path: str) -> bool:
+        return directory is None or Path(file_path).resolve().is_relative_to(directory.resolve())
+
+    try:
+        lint_report = _summarize(parsed_output, is_selected)
+    except (KeyError, TypeError, AttributeError) as error:
+        raise ValueError(f"Unexpected structure of lint report: {error}") from error
+    if directory is not None and not lint_report.modules:
+        raise ValueError(f"No modules of {directory} are found in lint report")
+    return lint_report
+
+
+def _summarize(parsed_output: dict[str, Any], is_selected: Callable[[str], bool]) -> LintReport:
+    """
+    Collect statistics of selected modules, message counts of their files and score.
+
+    Modules are selected by their files, as names of modules outside of packages
+    do not tell which lab they belong to.
+
+    Args:
+        parsed_output (dict[str, Any]): Parsed output of pylint with ModuleStatsReporter
+        is_selected (Callable[[str], bool]): Whether a module in the file is to be taken
+
+    Returns:
+        LintReport: Results of the run
+    """
+    paths = parsed_output["paths"]
+    modules = {
+        module_name: module_stats
+        for module_name, module_stats in parsed_output["modules"].items()
+        if is_selected(paths.get(module_name, ""))
+    }
+    counts = dict.fromkeys(MESSAGE_TYPES, 0)
+    for module_stats in modules.values():
+        for message_type in MESSAGE_TYPES:
+            counts[message_type] += module_stats[message_type]
+
+    files: dict[str, dict[str, int]] = {}
+    for message in parsed_output["messages"]:
+        if is_selected(message["absolutePath"]):
+            file_counts = files.setdefault(message["path"], {})
+            file_counts[message["symbol"]] = file_counts.get(message["symbol"], 0) + 1
+
+    return LintReport(evaluate_lint_score(parsed_output["evaluation"], counts), modules, files)
+
+
+def parse_lint_output(lint_output: str, directory: Optional[Path] = None) -> LintReport:
+    """
+    Read results of a pylint run from its output.
+
+    Args:
+        lint_output (str): Output of pylint with ModuleStatsReporter
+        directory (Optional[Path]): Directory to take modules of, all modules by default
+
+    Returns:
+        LintReport: Results of the run
+
+    Raises:
+        ValueError: If the output is not a report of ModuleStatsReporter
+            or has no modules of the directory
+    """
+    return summarize_lint_output(json.loads(lint_output), directory)
+
+
+def merge_lint_outputs(lint_outputs: list[dict[str, Any]]) -> dict[str, Any]:
+    """
+    Combine outputs of pylint runs over different modules into one.
+
+    Args:
+        lint_outputs (list[dict[str, Any]]): Parsed outputs of pylint with ModuleStatsReporter
+
+    Returns:
+        dict[str, Any]: Output as if all modules were linted in a single run
+    """
+    merged: dict[str, Any] = {"messages": [], "modules": {}, "paths": {}}
+    for lint_output in lint_outputs:
+        merged["messages"].extend(lint_output["messages"])
+        merged["modules"].update(lint_output["modules"])
+        merged["paths"].update(lint_output["paths"])
+        if "evaluation" in lint_output:
+            merged["evaluation"] = lint_output["evaluation"]
+    return merged
+
+
+def get_lint_report_path(root_dir: Path, name: str) -> Path:
+    """
+    Get path to the stored results of linting a lab or addons.
+
+    Args:
+        root_dir (Path): Root directory of the project
+        name (str): Name of the lab or addons
+
+    Returns:
+        Path: Path to the results
+    """
+    return root_dir / "build" / "lint" / f"{name}.json"
+
+
+def get_lint_output_path(root_dir: Path, name: str) -> Path:
+    """
+    Get path to the machine-readable output of linting a lab or addons.
+
+    Args:
+        root_dir (Path): Root directory of the project
+        name (str): Name of the lab or addons
+
+    Returns:
+        Path: Path to the output of ModuleStatsReporter
+    """
+    return root_dir / "build" / "lint" / f"{name}.pylint.json"
+
+
+def read_lint_output_file(output_path: Path) -> str:
+    """
+    Read the machine-readable output of a pylint run.
+
+    Args:
+        output_path (Path): Path to the output of ModuleStatsReporter
+
+    Returns:
+        str: Output of the run, empty if pylint did not write it
+    """
+    if not output_path.exists():
+        return ""
+    return output_path.read_text(encoding="utf-8")
+
+
+def save_lint_report(lint_report: LintReport, report_path: Path) -> None:
+    """
+    Store results of a pylint run.
+
+    Args:
+        lint_report (LintReport): Results of the run
+        report_path (Path): Path to the results
+    """
+    report_path.parent.mkdir(parents=True, exist_ok=True)
+    report_path.write_text(json.dumps(asdict(lint_report), indent=4), encoding="utf-8")
+
+
+def load_lint_report(report_path: Path) -> Optional[LintReport]:
+    """
+    Read stored results of a pylint run.
+
+    Args:
+        report_path (Path): Path to the results
+
+    Returns:
+        Optional[LintReport]: Results of the run, None if they are missing
+    """
+    if not report_path.exists():
+        return None
+    return LintReport(**json.loads(report_path.read_text(encoding="utf-8")))
@@ -0,0 +1,51 @@
+"""
+Pylint reporter with statistics of each linted module.
+"""
+
+import json
+
+from pylint.reporters import JSON2Reporter
+from pylint.reporters.ureports.nodes import Section
+
+
+class ModuleStatsReporter(JSON2Reporter):
+    """
+    JSON2 reporter which also prints message counts and statements of each module.
+    """
+
+    name = "json2-modules"
+
+    def __init__(self) -> None:
+        """
+        Initialize ModuleStatsReporter.
+        """
+        super().__init__()
+        self._paths: dict[str, str] = {}
+
+    def on_set_current_module(self, module: str, filepath: str | None) -> None:
+        """
+        Remember the file of the module being linted.
+
+        Args:
+            module (str): Name of the module
+            filepath (str | None): Path to the file of the module
+        """
+        super().on_set_current_module(module, filepath)
+        if filepath is not None:
+            self._paths[module] = filepath
+
+    def display_messages(self, layout: Section | None) -> None:
+        """
+        Print messages, statistics and files of each module and evaluation formula.
+
+        Args:
+            layout (Section | None): Layout of reports, not used
+        """
+        output = {
+            "messages": [self.serialize(message) for message in self.messages],
+            "statistics": self.serialize_stats(),
+            "modules": dict(self.linter.stats.by_module),
+            "paths": self._paths,
+            "evaluation": self.linter.config.evaluation,
+        }
+        print(json.dumps(output, indent=4), file=self.out)
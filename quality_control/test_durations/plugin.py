@@ -0,0 +1,76 @@
+"""
+Pytest plugin recording duration and outcome of every test.
+"""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from quality_control.test_durations.store import (
+    DB_ENV_VARIABLE,
+    get_default_db_path,
+    save_run,
+    TestRecord,
+)
+
+
+def get_lab(report: pytest.TestReport) -> str:
+    """
+    Get name of the lab a test belongs to.
+
+    Args:
+        report (pytest.TestReport): Report of a test phase
+
+    Returns:
+        str: Name of the top-level folder of the test module
+    """
+    return Path(report.location[0]).parts[0]
+
+
+class DurationsRecorder:
+    """
+    Collector of test results of a pytest session.
+    """
+
+    def __init__(self, db_path: Path) -> None:
+        """
+        Initialize DurationsRecorder.
+
+        Args:
+            db_path (Path): Path to the database
+        """
+        self._db_path = db_path
+        self._records: dict[str, TestRecord] = {}
+
+    def pytest_runtest_logreport(self, report: pytest.TestReport) -> None:
+        """
+        Accumulate duration and outcome of a test phase.
+
+        Args:
+            report (pytest.TestReport): Report of a test phase
+        """
+        record = self._records.setdefault(
+            report.nodeid,
+            TestRecord(nodeid=report.nodeid, lab=get_lab(report), outcome="passed", duration=0),
+        )
+        record.duration += report.duration
+        if report.outcome != "passed" and record.outcome != "failed":
+            record.outcome = report.outcome
+
+    def pytest_sessionfinish(self) -> None:
+        """
+        Store results of the session.
+        """
+        save_run(self._db_path, list(self._records.values()))
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """
+    Register the recorder for the session.
+
+    Args:
+        config (pytest.Config): Pytest configuration
+    """
+    db_path = Path(os.environ.get(DB_ENV_VARIABLE, get_default_db_path(config.rootpath)))
+    config.pluginmanager.register(DurationsRecorder(db_path), "fipl_test_durations")
@@ -0,0 +1,63 @@
+"""
+Report on durations of tests collected during previous runs.
+"""
+
+import sys
+from typing import Optional
+
+from logging518.config import fileConfig
+
+from quality_control.console_logging import get_child_logger
+from quality_control.quality_control_parser import QualityControlArgumentsParser
+from quality_control.test_durations.store import (
+    get_default_db_path,
+    get_labs_trend,
+    get_slowest_tests,
+)
+
+logger = get_child_logger(__file__)
+
+
+class TestDurationsArgumentsParser(QualityControlArgumentsParser):
+    """
+    CLI for test durations report.
+    """
+
+    top: int = 10
+    runs: int = 5
+    lab: Optional[str] = None
+
+
+def main() -> None:
+    """
+    Entrypoint for test durations report.
+    """
+    args = TestDurationsArgumentsParser(underscores_to_dashes=True).parse_args()
+
+    root_dir = args.root_dir.resolve()
+    toml_config = (args.toml_config_path or (root_dir / "pyproject.toml")).resolve()
+    fileConfig(toml_config)
+
+    db_path = get_default_db_path(root_dir)
+    if not db_path.exists():
+        logger.error(f"No test durations found in {db_path}. Run tests first.")
+        sys.exit(1)
+
+    logger.info("\n\n------------------\nSLOWEST TESTS\n------------------")
+    for nodeid, _, average, last, runs in get_slowest_tests(db_path, args.top, args.lab):
+        logger.info(f"{average:>8.2f}s avg {last:>8.2f}s last {runs:>4} runs  {nodeid}")
+
+    trend = {
+        lab: durations
+        for lab, durations in get_labs_trend(db_path, args.runs).items()
+        if args.lab in (None, lab)
+    }
+    logger.info("\n\n------------------\nSLOWEST LABS\n------------------")
+    for lab, durations in sorted(trend.items(), key=lambda x: -x[1][-1])[: args.top]:
+        history = " -> ".join(f"{duration:.2f}" for duration in durations)
+        logger.info(f"{lab:<30}: {durations[-1]:>8.2f}s (last {len(durations)} runs: {history})")
+    logger.info("\n\n------------------\nEND OF REPORT\n------------------")
+
+
+if __name__ == "__main__":
+    main()
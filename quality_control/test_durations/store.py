@@ -0,0 +1,198 @@
+"""
+Storage of per-test durations collected during pytest runs and per-lab durations of tools.
+"""
+
+import sqlite3
+import time
+from contextlib import closing
+from pathlib import Path
+
+from pydantic.dataclasses import dataclass
+
+DB_ENV_VARIABLE = "FIPL_TEST_DURATIONS_DB"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    finished_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS tests (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    nodeid TEXT NOT NULL,
+    lab TEXT NOT NULL,
+    outcome TEXT NOT NULL,
+    duration REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS tests_lab ON tests (lab, run_id);
+CREATE TABLE IF NOT EXISTS labs (
+    tool TEXT NOT NULL,
+    lab TEXT NOT NULL,
+    duration REAL NOT NULL,
+    PRIMARY KEY (tool, lab)
+);
+"""
+
+
+@dataclass
+class TestRecord:
+    """
+    DTO for storing result of a single test.
+    """
+
+    nodeid: str
+    lab: str
+    outcome: str
+    duration: float
+
+
+def get_default_db_path(root_dir: Path) -> Path:
+    """
+    Get path to the durations database of a project.
+
+    Args:
+        root_dir (Path): Root directory of the project
+
+    Returns:
+        Path: Path to the database
+    """
+    return root_dir / "build" / "test_durations.sqlite"
+
+
+def connect(db_path: Path) -> sqlite3.Connection:
+    """
+    Open the durations database creating it if needed.
+
+    Args:
+        db_path (Path): Path to the database
+
+    Returns:
+        sqlite3.Connection: Connection to the database
+    """
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    connection = sqlite3.connect(db_path, timeout=60)
+    connection.executescript(_SCHEMA)
+    return connection
+
+
+def save_run(db_path: Path, records: list[TestRecord]) -> None:
+    """
+    Store results of tests of a single pytest session.
+
+    Args:
+        db_path (Path): Path to the database
+        records (list[TestRecord]): Results of tests
+    """
+    if not records:
+        return
+    with closing(connect(db_path)) as connection:
+        with connection:
+            run_id = connection.execute(
+                "INSERT INTO runs (finished_at) VALUES (?)", (time.time(),)
+            ).lastrowid
+            connection.executemany(
+                "INSERT INTO tests (run_id, nodeid, lab, outcome, duration) VALUES (?, ?, ?, ?, ?)",
+                [
+                    (run_id, record.nodeid, record.lab, record.outcome, record.duration)
+                    for record in records
+                ],
+            )
+
+
+def get_slowest_tests(
+    db_path: Path, top: int, lab: str | None = None
+) -> list[tuple[str, str, float, float, int]]:
+    """
+    Get tests with the longest average duration.
+
+    Args:
+        db_path (Path): Path to the database
+        top (int): Number of tests to get
+        lab (str | None): Name of the lab to get tests of, None for all labs
+
+    Returns:
+        list[tuple[str, str, float, float, int]]: Node id, lab, average and last duration,
+            number of runs
+    """
+    with closing(connect(db_path)) as connection:
+        return connection.execute(
+            """
+            SELECT nodeid, lab, AVG(duration),
+                   (SELECT duration FROM tests AS last WHERE last.nodeid = tests.nodeid
+                    ORDER BY run_id DESC LIMIT 1),
+                   COUNT(*)
+            FROM tests WHERE ? IS NULL OR lab = ?
+            GROUP BY nodeid, lab ORDER BY AVG(duration) DESC LIMIT ?
+            """,
+            (lab, lab, top),
+        ).fetchall()
+
+
+def get_labs_trend(db_path: Path, runs: int) -> dict[str, list[float]]:
+    """
+    Get total duration of tests of each lab in its latest runs.
+
+    Args:
+        db_path (Path): Path to the database
+        runs (int): Number of latest runs to get for each lab
+
+    Returns:
+        dict[str, list[float]]: Durations of lab runs from the oldest to the newest
+    """
+    with closing(connect(db_path)) as connection:
+        rows = connection.execute(
+            "SELECT lab, run_id, SUM(duration) FROM tests GROUP BY lab, run_id ORDER BY run_id"
+        ).fetchall()
+    trend: dict[str, list[float]] = {}
+    for lab, _, duration in rows:
+        trend.setdefault(lab, []).append(duration)
+    return {lab: durations[-runs:] for lab, durations in trend.items()}
+
+
+def get_labs_durations(db_path: Path) -> dict[str, float]:
+    """
+    Get total duration of tests of each lab in its latest run.
+
+    Args:
+        db_path (Path): Path to the database
+
+    Returns:
+        dict[str, float]: Durations of labs in seconds
+    """
+    return {lab: durations[-1] for lab, durations in get_labs_trend(db_path, 1).items()}
+
+
+def save_tool_durations(db_path: Path, tool_name: str, durations: dict[str, float]) -> None:
+    """
+    Store durations of labs processed by a tool, replacing the previous ones.
+
+    Args:
+        db_path (Path): Path to the database
+        tool_name (str): Name of the tool
+        durations (dict[str, float]): Durations of labs in seconds
+    """
+    if not durations:
+        return
+    with closing(connect(db_path)) as connection:
+        with connection:
+            connection.executemany(
+                "INSERT OR REPLACE INTO labs (tool, lab, duration) VALUES (?, ?, ?)",
+                [(tool_name, lab, duration) for lab, duration in durations.items()],
+            )
+
+
+def get_tool_durations(db_path: Path, tool_name: str) -> dict[str, float]:
+    """
+    Get durations of labs processed by a tool in its latest runs.
+
+    Args:
+        db_path (Path): Path to the database
+        tool_name (str): Name of the tool
+
+    Returns:
+        dict[str, float]: Durations of labs in seconds
+    """
+    with closing(connect(db_path)) as connection:
+        rows = connection.execute(
+            "SELECT lab, duration FROM labs WHERE tool = ?", (tool_name,)
+        ).fetchall()
+    return dict(rows)
@@ -0,0 +1,202 @@
+"""
+Index of source lines covered by each test and selection of tests impacted by a diff.
+"""
+
+import json
+import re
+from pathlib import Path
+from typing import Optional
+
+from coverage import CoverageData
+
+from quality_control.changed_labs import get_changed_files
+from quality_control.cli_unifier import _run_console_tool, handles_console_error
+from quality_control.console_logging import get_child_logger
+from quality_control.hashing import hash_git_blob
+
+logger = get_child_logger(__file__)
+
+HUNK_PATTERN = re.compile(r"^@@ -(?P<start>\d+)(?:,(?P<count>\d+))? \+\d+(?:,\d+)? @@")
+
+
+def get_index_path(root_dir: Path, lab_name: str) -> Path:
+    """
+    Get path to the index of a lab.
+
+    Args:
+        root_dir (Path): Root directory of the project
+        lab_name (str): Name of the lab
+
+    Returns:
+        Path: Path to the index
+    """
+    return root_dir / "build" / "test_impact" / f"{lab_name}.json"
+
+
+def build_index(data_path: Path, root_dir: Path, lab_name: str) -> None:
+    """
+    Save lines covered by each test of a lab from coverage data with per-test contexts.
+
+    Traced sources are saved with git object ids of their content, so that the index
+    can be matched against a revision later. Lines run outside of tests, for example
+    at import of modules during collection, are covered by the empty context and
+    are not attributed to any test.
+
+    Args:
+        data_path (Path): Path to coverage data file
+        root_dir (Path): Root directory of the project
+        lab_name (str): Name of the lab
+    """
+    data = CoverageData(basename=str(data_path))
+    data.read()
+    tests: dict[str, dict[str, list[int]]] = {}
+    sources = {}
+    for measured_file in sorted(data.measured_files()):
+        path = Path(measured_file)
+        if not path.is_relative_to(root_dir) or not path.exists():
+            continue
+        relative_path = path.relative_to(root_dir).as_posix()
+        sources[relative_path] = hash_git_blob(path)
+        for line, contexts in sorted(data.contexts_by_lineno(measured_file).items()):
+            for context in filter(None, contexts):
+                tests.setdefault(context, {}).setdefault(relative_path, []).append(line)
+
+    index_path = get_index_path(root_dir, lab_name)
+    index_path.parent.mkdir(parents=True, exist_ok=True)
+    index_path.write_text(json.dumps({"sources": sources, "tests": tests}), encoding="utf-8")
+    logger.info(f"Saved lines covered by {len(tests)} tests of {lab_name} to {index_path}")
+
+
+@handles_console_error()
+def run_git_ls_tree(root_dir: Path, ref: str, lab_name: str) -> tuple[str, str, int]:
+    """
+    List objects of files of a lab at the revision.
+
+    Args:
+        root_dir (Path): Root directory of the project
+        ref (str): Git revision
+        lab_name (str): Name of the lab
+
+    Returns:
+        tuple[str, str, int]: stdout, stderr, exit code
+    """
+    return _run_console_tool("git", ["ls-tree", "-r", ref, "--", lab_name], cwd=root_dir)
+
+
+@handles_console_error()
+def run_git_diff_lines(root_dir: Path, ref: str, lab_name: str) -> tuple[str, str, int]:
+    """
+    Show changes of files of a lab since the revision without context lines.
+
+    Args:
+        root_dir (Path): Root directory of the project
+        ref (str): Git revision to compare with
+        lab_name (str): Name of the lab
+
+    Returns:
+        tuple[str, str, int]: stdout, stderr, exit code
+    """
+    return _run_console_tool(
+        "git", ["diff", "-U0", "--no-prefix", "--relative", ref, "--", lab_name], cwd=root_dir
+    )
+
+
+def parse_changed_lines(diff: str) -> dict[str, set[int]]:
+    """
+    Get lines of the old version of files touched by a diff.
+
+    Lines around pure insertions are considered changed too.
+
+    Args:
+        diff (str): Output of git diff with zero context lines and no prefixes
+
+    Returns:
+        dict[str, set[int]]: Changed lines of each file
+    """
+    changed_lines: dict[str, set[int]] = {}
+    current: set[int] = set()
+    for line in diff.splitlines():
+        if line.startswith("--- "):
+            old_path = line[4:]
+            current = set()
+            if old_path != "/dev/null":
+                changed_lines[old_path] = current
+        elif line.startswith("+++ ") and line[4:] != "/dev/null":
+            current = changed_lines.setdefault(line[4:], current)
+        elif match := HUNK_PATTERN.match(line):
+            start = int(match.group("start"))
+            count = int(match.group("count") or 1)
+            current.update(range(start, start + count) if count else (start, start + 1))
+    return changed_lines
+
+
+def match_impacted_tests(
+    tests: dict[str, dict[str, list[int]]], changed_lines: dict[str, set[int]]
+) -> Optional[list[str]]:
+    """
+    Get tests which covered changed lines.
+
+    Args:
+        tests (dict[str, dict[str, list[int]]]): Lines of files covered by each test
+        changed_lines (dict[str, set[int]]): Changed lines of each file
+
+    Returns:
+        Optional[list[str]]: Node ids of impacted tests, None if some changed lines
+            are not covered by any test, as their impact is unknown
+    """
+    attributed: dict[str, set[int]] = {}
+    for covered in tests.values():
+        for path, lines in covered.items():
+            attributed.setdefault(path, set()).update(lines)
+    if any(lines - attributed.get(path, set()) for path, lines in changed_lines.items()):
+        return None
+    return [
+        test
+        for test, covered in tests.items()
+        if any(
+            changed_lines.get(path, set()).intersection(lines) for path, lines in covered.items()
+        )
+    ]
+
+
+def select_impacted_tests(root_dir: Path, lab_name: str, ref: str) -> Optional[list[str]]:
+    """
+    Get tests of a lab which covered lines changed since the revision.
+
+    Args:
+        root_dir (Path): Root directory of the project
+        lab_name (str): Name of the lab
+        ref (str): Git revision to compare with
+
+    Returns:
+        Optional[list[str]]: Node ids of impacted tests, None if all tests of the lab
+            are to be run because the index is missing or stale, untraced files changed
+            or changed lines are not covered by any test
+    """
+    index_path = get_index_path(root_dir, lab_name)
+    if not index_path.exists():
+        logger.info(f"No index of covered lines for {lab_name}")
+        return None
+    index = json.loads(index_path.read_text(encoding="utf-8"))
+
+    stdout, _, _ = run_git_ls_tree(root_dir, ref, lab_name)
+    objects = {}
+    for line in stdout.splitlines():
+        description, path = line.split("\t", maxsplit=1)
+        objects[path] = description.split()[2]
+    if any(objects.get(path) != object_id for path, object_id in index["sources"].items()):
+        logger.info(f"Index of covered lines for {lab_name} does not match {ref}")
+        return None
+
+    changed_files = {
+        file.as_posix() for file in get_changed_files(root_dir, ref) if file.parts[0] == lab_name
+    }
+    if not changed_files.issubset(index["sources"]):
+        logger.info(f"Files of {lab_name} not traced by coverage changed since {ref}")
+        return None
+
+    stdout, _, _ = run_git_diff_lines(root_dir, ref, lab_name)
+    impacted_tests = match_impacted_tests(index["tests"], parse_changed_lines(stdout))
+    if impacted_tests is None:
+        logger.info(f"Lines of {lab_name} not covered by any test changed since {ref}")
+    return impacted_tests
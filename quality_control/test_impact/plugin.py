@@ -0,0 +1,49 @@
+"""
+Pytest plugin switching coverage context to the test being run.
+"""
+
+import coverage
+import pytest
+
+
+class ContextSwitcher:
+    """
+    Marker of lines covered by each test with its node id.
+    """
+
+    def __init__(self, cov: coverage.Coverage) -> None:
+        """
+        Initialize ContextSwitcher.
+
+        Args:
+            cov (coverage.Coverage): Coverage measuring the session
+        """
+        self._cov = cov
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_runtest_setup(self, item: pytest.Item) -> None:
+        """
+        Attribute lines executed from now on to the test.
+
+        Args:
+            item (pytest.Item): Test to be run
+        """
+        self._cov.switch_context(item.nodeid)
+
+    def pytest_runtest_logfinish(self) -> None:
+        """
+        Stop attributing executed lines to the finished test.
+        """
+        self._cov.switch_context("")
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """
+    Register the switcher if the session runs under coverage.
+
+    Args:
+        config (pytest.Config): Pytest configuration
+    """
+    cov = coverage.Coverage.current()
+    if cov is not None:
+        config.pluginmanager.register(ContextSwitcher(cov), "fipl_test_impact")
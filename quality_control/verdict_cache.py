@@ -0,0 +1,178 @@
+"""
+Cache of successful outcomes of labs keyed by hashes of their inputs.
+"""
+
+import json
+from pathlib import Path
+
+from quality_control.changed_labs import SHARED_PATHS
+from quality_control.cli_unifier import _run_console_tool, choose_python_exe, handles_console_error
+from quality_control.console_logging import get_child_logger
+from quality_control.file_index import FileIndex
+from quality_control.hashing import hash_paths, hash_strings
+from quality_control.import_closure import get_external_imports
+
+logger = get_child_logger(__file__)
+
+
+@handles_console_error()
+def get_python_version(root_dir: Path) -> tuple[str, str, int]:
+    """
+    Get version of the interpreter labs are checked with.
+
+    Args:
+        root_dir (Path): Root directory of the project
+
+    Returns:
+        tuple[str, str, int]: stdout, stderr, exit code
+    """
+    return _run_console_tool(str(choose_python_exe(lab_path=root_dir)), ["--version"], cwd=root_dir)
+
+
+def get_shared_hash(root_dir: Path) -> str:
+    """
+    Get hash of inputs shared by all labs: common files and the interpreter.
+
+    Args:
+        root_dir (Path): Root directory of the project
+
+    Returns:
+        str: Hex digest of shared inputs
+    """
+    stdout, stderr, _ = get_python_version(root_dir)
+    return hash_strings(
+        hash_paths((root_dir / name for name in SHARED_PATHS), root_dir),
+        str(choose_python_exe(lab_path=root_dir).resolve()),
+        stdout,
+        stderr,
+    )
+
+
+def get_lab_hash(lab_path: Path, root_dir: Path, file_index: FileIndex) -> str:
+    """
+    Get hash of files of a lab and files of the project it imports, directly or not.
+
+    Args:
+        lab_path (Path): Path to lab
+        root_dir (Path): Root directory of the project
+        file_index (FileIndex): Files of the project
+
+    Returns:
+        str: Hex digest of files of the lab and its imports
+    """
+    return hash_paths([lab_path, *get_external_imports(lab_path, root_dir, file_index)], root_dir)
+
+
+def evict_least_recently_used(cache_dir: Path, max_size: int) -> None:
+    """
+    Remove least recently used entries of a cache until it fits into its size.
+
+    Args:
+        cache_dir (Path): Directory of the cache
+        max_size (int): Maximum size of the cache in bytes
+    """
+    entries = sorted(cache_dir.glob("*.json"), key=lambda x: x.stat().st_mtime)
+    total_size = sum(entry.stat().st_size for entry in entries)
+    for entry in entries:
+        if total_size <= max_size:
+            break
+        total_size -= entry.stat().st_size
+        entry.unlink()
+
+
+class VerdictCache:
+    """
+    Storage of outcomes of green runs for unchanged labs.
+    """
+
+    def __init__(self, root_dir: Path, tool_name: str, max_size_mb: int) -> None:
+        """
+        Initialize VerdictCache.
+
+        Args:
+            root_dir (Path): Root directory of the project
+            tool_name (str): Name of the tool outcomes belong to
+            max_size_mb (int): Maximum size of the cache in megabytes
+        """
+        self._root_dir = root_dir
+        self._tool_name = tool_name
+        self._max_size = max_size_mb * 1024 * 1024
+        self._cache_dir = root_dir / "build" / "verdict_cache"
+        self._keys: dict[str, str] = {}
+        self._shared_hash = get_shared_hash(root_dir)
+        self._file_index = FileIndex(root_dir)
+
+    def compute_key(self, lab_name: str, arguments: list[str]) -> str:
+        """
+        Get hash of everything the outcome of a lab depends on.
+
+        Args:
+            lab_name (str): Name of the lab
+            arguments (list[str]): Arguments the lab is checked with
+
+        Returns:
+            str: Cache key
+        """
+        return hash_strings(
+            self._tool_name,
+            self._shared_hash,
+            get_lab_hash(self._root_dir / lab_name, self._root_dir, self._file_index),
+            *arguments,
+        )
+
+    def partition(
+        self, labs_arguments: list[tuple[str, list[str]]]
+    ) -> tuple[dict[str, tuple[str, str, int]], list[tuple[str, list[str]]]]:
+        """
+        Split labs into ones with stored outcomes and ones to be checked.
+
+        Args:
+            labs_arguments (list[tuple[str, list[str]]]): Pairs of lab name and arguments
+
+        Returns:
+            tuple[dict[str, tuple[str, str, int]], list[tuple[str, list[str]]]]: Stored
+                outcomes of labs and labs without them
+        """
+        hits = {}
+        misses = []
+        for lab_name, arguments in labs_arguments:
+            key = self._keys[lab_name] = self.compute_key(lab_name, arguments)
+            entry_path = self._cache_dir / f"{key}.json"
+            if not entry_path.exists():
+                misses.append((lab_name, arguments))
+                continue
+            entry_path.touch()
+            entry = json.loads(entry_path.read_text(encoding="utf-8"))
+            logger.info(f"Cache hit for {lab_name}, replaying outcome of {self._tool_name}.")
+            hits[lab_name] = (entry["stdout"], entry["stderr"], entry["return_code"])
+        return hits, misses
+
+    def store(self, lab_name: str, result: tuple[str, str, int]) -> None:
+        """
+        Store outcome of a green run of a lab.
+
+        Args:
+            lab_name (str): Name of the lab partitioned before
+            result (tuple[str, str, int]): stdout, stderr, exit code
+        """
+        self._cache_dir.mkdir(parents=True, exist_ok=True)
+        stdout, stderr, return_code = result
+        (self._cache_dir / f"{self._keys[lab_name]}.json").write_text(
+            json.dumps(
+                {
+                    "tool": self._tool_name,
+                    "lab": lab_name,
+                    "stdout": stdout,
+                    "stderr": stderr,
+                    "return_code": return_code,
+                }
+            ),
+            encoding="utf-8",
+        )
+        self.evict()
+
+    def evict(self) -> None:
+        """
+        Remove least recently used outcomes until the cache fits into its size.
+        """
+        evict_least_recently_used(self._cache_dir, self._max_size)
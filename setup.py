@@ -40,6 +40,9 @@ setup(
             "fiplconfig.run_tests=quality_control.run_tests:main",
             "fiplconfig.run_start=quality_control.run_start:main",
             "fiplconfig.update_forks=quality_control.github.update_forks:main",
+            "fiplconfig.merge_shards=quality_control.sharding:main",
+            "fiplconfig.test_durations=quality_control.test_durations.report:main",
+            "fiplconfig.run_all=quality_control.run_all:main",
         ]
     },
     long_description=(Path(__file__).parent / "README.md").read_text(encoding="utf-8"),
@@ -0,0 +1,53 @@
+"""
+Base of tests working with files of a project.
+"""
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+from quality_control.cli_unifier import choose_python_exe
+
+
+class ProjectTestCase(unittest.TestCase):
+    """
+    Test case with an empty temporary project directory.
+    """
+
+    def setUp(self) -> None:
+        """
+        Create the project directory removed after the test.
+        """
+        temp_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.addCleanup(temp_dir.cleanup)
+        self.root_dir = Path(temp_dir.name).resolve()
+
+    def write_file(self, relative_path: str, content: str = "") -> Path:
+        """
+        Create a file of the project with its parent directories.
+
+        Args:
+            relative_path (str): Path to the file relative to the project directory
+            content (str): Content of the file
+
+        Returns:
+            Path: Path to the file
+        """
+        path = self.root_dir / relative_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content, encoding="utf-8")
+        return path
+
+    def link_interpreter(self) -> Path:
+        """
+        Make the current interpreter the one of the project.
+
+        Returns:
+            Path: Path to the interpreter of the project
+        """
+        python_exe_path = choose_python_exe(lab_path=self.root_dir)
+        if python_exe_path.is_absolute():
+            python_exe_path.parent.mkdir(parents=True, exist_ok=True)
+            python_exe_path.symlink_to(sys.executable)
+        return python_exe_path
@@ -0,0 +1,95 @@
+"""
+Tests for checking formatting with black in-process.
+"""
+
+import unittest
+from pathlib import Path
+
+import black
+from tests.project_test_case import ProjectTestCase
+
+from quality_control.static_checks.black_checker import BlackCache, check_black_in_process
+
+
+class BlackCacheTest(ProjectTestCase):
+    """
+    Tests for BlackCache.
+    """
+
+    def setUp(self) -> None:
+        """
+        Create a formatted module and a stub.
+        """
+        super().setUp()
+        self.module_path = self.write_file("lab_1/main.py", "VALUE = 1\n")
+        self.stub_path = self.write_file("lab_1/main.pyi", "VALUE: int\n")
+        self.mode = black.Mode()
+
+    def store(self, paths: list[Path]) -> None:
+        """
+        Store files as passed the check.
+
+        Args:
+            paths (list[Path]): Paths to files which passed the check
+        """
+        cache = BlackCache(self.root_dir, self.mode)
+        cache.partition(paths)
+        cache.store(paths)
+
+    def test_passed_files_are_skipped(self) -> None:
+        """
+        Files stored as passed are not checked again.
+        """
+        self.store([self.module_path])
+        cache = BlackCache(self.root_dir, self.mode)
+        self.assertEqual([self.stub_path], cache.partition([self.module_path, self.stub_path]))
+
+    def test_changed_content_is_checked(self) -> None:
+        """
+        File with another content is checked again.
+        """
+        self.store([self.module_path])
+        self.module_path.write_text("VALUE = 2\n", encoding="utf-8")
+        cache = BlackCache(self.root_dir, self.mode)
+        self.assertEqual([self.module_path], cache.partition([self.module_path]))
+
+    def test_changed_mode_is_checked(self) -> None:
+        """
+        Files are checked again with other formatting options.
+        """
+        self.store([self.module_path])
+        cache = BlackCache(self.root_dir, black.Mode(line_length=100))
+        self.assertEqual([self.module_path], cache.partition([self.module_path]))
+
+    def test_reused_files_are_kept(self) -> None:
+        """
+        Files reused from the cache stay stored after the next run.
+        """
+        self.store([self.module_path])
+        cache = BlackCache(self.root_dir, self.mode)
+        cache.store(cache.partition([self.module_path, self.stub_path]))
+        cache = BlackCache(self.root_dir, self.mode)
+        self.assertEqual([], cache.partition([self.module_path, self.stub_path]))
+
+
+class CheckBlackInProcessTest(ProjectTestCase):
+    """
+    Tests for check_black_in_process.
+    """
+
+    def test_unformatted_file_is_reported(self) -> None:
+        """
+        Only files black would reformat are reported, also when reusing the cache.
+        """
+        config_path = self.write_file("pyproject.toml", "[tool.black]\nline-length = 100\n")
+        self.write_file("lab_1/main.py", "VALUE = 1\n")
+        unformatted_path = self.write_file("lab_1/helpers.py", "VALUE=1\n")
+        for _ in range(2):
+            diffs = check_black_in_process(
+                [self.root_dir / "lab_1"], config_path, self.root_dir, 1, use_cache=True
+            )
+            self.assertEqual([unformatted_path], list(diffs))
+
+
+if __name__ == "__main__":
+    unittest.main()
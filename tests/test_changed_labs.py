@@ -0,0 +1,64 @@
+"""
+Tests for selecting labs affected by changes.
+"""
+
+import subprocess
+import unittest
+
+from tests.project_test_case import ProjectTestCase
+
+from quality_control.changed_labs import select_changed_names
+
+
+class SelectChangedNamesTest(ProjectTestCase):
+    """
+    Tests for select_changed_names.
+    """
+
+    def setUp(self) -> None:
+        """
+        Create a repository with the first lab importing a module of the second one.
+        """
+        super().setUp()
+        self.write_file("lab_1/__init__.py")
+        self.write_file("lab_1/main.py", "from lab_2.helpers import FACTOR\n")
+        self.write_file("lab_2/__init__.py")
+        self.write_file("lab_2/helpers.py", "FACTOR = 2\n")
+        self.write_file("lab_2/main.py", "VALUE = 1\n")
+        self.write_file("lab_3/__init__.py")
+        self.write_file("lab_3/main.py", "VALUE = 1\n")
+        for args in (
+            ["init", "-q"],
+            ["add", "."],
+            ["-c", "user.name=test", "-c", "user.email=test@test", "commit", "-q", "-m", "init"],
+        ):
+            subprocess.run(["git", *args], cwd=self.root_dir, check=True)
+        self.names = ["lab_1", "lab_2", "lab_3"]
+
+    def test_importing_lab_is_selected(self) -> None:
+        """
+        Change of a module selects labs importing it.
+        """
+        self.write_file("lab_2/helpers.py", "FACTOR = 3\n")
+        self.assertEqual(
+            ["lab_1", "lab_2"], select_changed_names(self.names, self.root_dir, "HEAD")
+        )
+
+    def test_not_imported_change_stays_in_lab(self) -> None:
+        """
+        Change of a module nobody imports selects only its lab.
+        """
+        self.write_file("lab_2/main.py", "VALUE = 2\n")
+        self.assertEqual(["lab_2"], select_changed_names(self.names, self.root_dir, "HEAD"))
+
+    def test_shared_change_selects_everything(self) -> None:
+        """
+        Change of a shared file selects every lab.
+        """
+        self.write_file("pyproject.toml", "[tool.black]\n")
+        subprocess.run(["git", "add", "pyproject.toml"], cwd=self.root_dir, check=True)
+        self.assertEqual(self.names, select_changed_names(self.names, self.root_dir, "HEAD"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,114 @@
+"""
+Tests for attributing mypy errors to labs and checking them with the daemon.
+"""
+
+import unittest
+from pathlib import Path
+
+from tests.project_test_case import ProjectTestCase
+
+from quality_control.static_checks.check_mypy import (
+    check_mypy_with_daemon,
+    get_labs_mypy_results,
+    stop_mypy_daemon,
+)
+
+ROOT_DIR = Path("/project")
+LABS_PATHS = [ROOT_DIR / "lab_1", ROOT_DIR / "lab_2"]
+ERROR = 'main.py:11: error: Incompatible return value type (got "str", expected "int")'
+
+
+class GetLabsMypyResultsTest(unittest.TestCase):
+    """
+    Tests for get_labs_mypy_results.
+    """
+
+    def test_absolute_paths(self) -> None:
+        """
+        Errors with absolute paths fail only their lab.
+        """
+        self.assertEqual(
+            get_labs_mypy_results(f"{ROOT_DIR}/lab_2/{ERROR}\n", 1, LABS_PATHS, ROOT_DIR),
+            {"lab_1": True, "lab_2": False},
+        )
+
+    def test_relative_paths(self) -> None:
+        """
+        Errors replayed from the cache with relative paths fail only their lab.
+        """
+        self.assertEqual(
+            get_labs_mypy_results(f"lab_2/{ERROR}\nFound 1 error\n", 1, LABS_PATHS, ROOT_DIR),
+            {"lab_1": True, "lab_2": False},
+        )
+
+    def test_errors_outside_of_labs(self) -> None:
+        """
+        Errors in files outside of labs fail every lab.
+        """
+        self.assertEqual(
+            get_labs_mypy_results(f"core_utils/{ERROR}\n", 1, LABS_PATHS, ROOT_DIR),
+            {"lab_1": False, "lab_2": False},
+        )
+
+    def test_failure_without_errors(self) -> None:
+        """
+        A failed run without errors in files fails every lab.
+        """
+        self.assertEqual(
+            get_labs_mypy_results("mypy: error: bad config\n", 2, LABS_PATHS, ROOT_DIR),
+            {"lab_1": False, "lab_2": False},
+        )
+
+    def test_clean_run(self) -> None:
+        """
+        A run without errors passes every lab.
+        """
+        self.assertEqual(
+            get_labs_mypy_results("Success: no issues found\n", 0, LABS_PATHS, ROOT_DIR),
+            {"lab_1": True, "lab_2": True},
+        )
+
+
+class CheckMypyWithDaemonTest(ProjectTestCase):
+    """
+    Tests for check_mypy_with_daemon.
+    """
+
+    def setUp(self) -> None:
+        """
+        Create a project with two labs and stop its daemon after the test.
+        """
+        super().setUp()
+        self.link_interpreter()
+        self.config_path = self.write_file("pyproject.toml", "[tool.mypy]\nstrict = true\n")
+        self.labs_paths = [self.root_dir / "lab_1", self.root_dir / "lab_2"]
+        for lab_path in self.labs_paths:
+            self.write_file(f"{lab_path.name}/__init__.py")
+            self.write_file(f"{lab_path.name}/main.py", "def get() -> int:\n    return 1\n")
+        self.addCleanup(stop_mypy_daemon, self.root_dir)
+
+    def check_labs(self) -> dict[str, bool]:
+        """
+        Check labs with the daemon.
+
+        Returns:
+            dict[str, bool]: Whether each lab passed
+        """
+        stdout, _, return_code = check_mypy_with_daemon(
+            self.labs_paths, self.config_path, self.root_dir
+        )
+        return get_labs_mypy_results(stdout, return_code, self.labs_paths, self.root_dir)
+
+    def test_edits_are_rechecked(self) -> None:
+        """
+        Running daemon notices edits of labs between checks.
+        """
+        self.assertEqual({"lab_1": True, "lab_2": True}, self.check_labs())
+        self.write_file("lab_2/main.py", "def get() -> int:\n    return 'one'\n")
+        self.assertEqual({"lab_1": True, "lab_2": False}, self.check_labs())
+        self.write_file("lab_2/main.py", "def get() -> int:\n    return 2\n")
+        self.assertEqual({"lab_1": True, "lab_2": True}, self.check_labs())
+
+
+if __name__ == "__main__":
+    unittest.main()
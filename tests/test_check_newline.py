@@ -0,0 +1,83 @@
+"""
+Tests for checking newlines at the end of files.
+"""
+
+import unittest
+
+from tests.project_test_case import ProjectTestCase
+
+from quality_control.static_checks.check_newline import (
+    check_file_ending,
+    MMAP_THRESHOLD,
+    read_edges,
+    SAMPLE_SIZE,
+)
+
+
+class ReadEdgesTest(ProjectTestCase):
+    """
+    Tests for read_edges.
+    """
+
+    def test_empty_file(self) -> None:
+        """
+        Empty file has no edges.
+        """
+        self.assertEqual((b"", b""), read_edges(self.write_file("empty.txt")))
+
+    def test_edges_of_files_of_any_size(self) -> None:
+        """
+        Head sample and the last byte are read from small, medium and mapped files.
+        """
+        for size in (1, SAMPLE_SIZE, SAMPLE_SIZE + 1, MMAP_THRESHOLD + 1):
+            with self.subTest(size=size):
+                path = self.root_dir / "file.bin"
+                path.write_bytes(b"a" * (size - 1) + b"z")
+                head, last_byte = read_edges(path)
+                self.assertEqual(min(size, SAMPLE_SIZE), len(head))
+                self.assertEqual(b"z", last_byte)
+
+
+class CheckFileEndingTest(ProjectTestCase):
+    """
+    Tests for check_file_ending.
+    """
+
+    def test_text_files(self) -> None:
+        """
+        Text files are checked for a trailing newline.
+        """
+        for content, expected in (
+            (b"", True),
+            (b"text\n", True),
+            (b"text\r\n", True),
+            (b"text", False),
+            ("текст\n".encode(), True),
+            (b"a" * MMAP_THRESHOLD, False),
+        ):
+            with self.subTest(content=content[:10]):
+                path = self.root_dir / "file.txt"
+                path.write_bytes(content)
+                self.assertEqual(expected, check_file_ending(path))
+
+    def test_binary_files_are_skipped(self) -> None:
+        """
+        Files with NUL bytes or invalid UTF-8 are not checked.
+        """
+        for content in (b"\0\1\2", b"\xff\xfe text"):
+            with self.subTest(content=content):
+                path = self.root_dir / "file.bin"
+                path.write_bytes(content)
+                self.assertIsNone(check_file_ending(path))
+
+    def test_sample_cutting_a_character_is_text(self) -> None:
+        """
+        Multibyte character cut by the end of the head sample does not make a file binary.
+        """
+        path = self.root_dir / "file.txt"
+        path.write_bytes(b"a" * (SAMPLE_SIZE - 1) + "ы\n".encode())
+        self.assertTrue(check_file_ending(path))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+"""
+Tests for checking content of start.py of labs.
+"""
+
+import ast
+import unittest
+
+from quality_control.check_start_content import check_assert_line, is_result_assert
+
+
+class IsResultAssertTest(unittest.TestCase):
+    """
+    Tests for is_result_assert.
+    """
+
+    def parse_statement(self, code: str) -> ast.stmt:
+        """
+        Parse a single statement.
+
+        Args:
+            code (str): Code of the statement
+
+        Returns:
+            ast.stmt: Node of the statement
+        """
+        return ast.parse(code).body[0]
+
+    def test_result_asserts(self) -> None:
+        """
+        Asserts of the result variable alone or compared with something are detected.
+        """
+        for code in (
+            "assert result",
+            "assert RESULT",
+            "assert result, 'Not working'",
+            "assert result == 1",
+            "assert result is not None",
+        ):
+            with self.subTest(code=code):
+                self.assertTrue(is_result_assert(self.parse_statement(code)))
+
+    def test_other_statements(self) -> None:
+        """
+        Asserts of other expressions and other statements are not detected.
+        """
+        for code in (
+            "assert results",
+            "assert not result",
+            "assert 1 == result",
+            "assert result.value",
+            "result = 1",
+            "print(result)",
+        ):
+            with self.subTest(code=code):
+                self.assertFalse(is_result_assert(self.parse_statement(code)))
+
+
+class CheckAssertLineTest(unittest.TestCase):
+    """
+    Tests for check_assert_line.
+    """
+
+    def test_nested_assert(self) -> None:
+        """
+        Assert inside a function is found.
+        """
+        self.assertTrue(check_assert_line("def main():\n    result = 1\n    assert result\n"))
+
+    def test_commented_assert(self) -> None:
+        """
+        Commented or quoted assert is not counted.
+        """
+        self.assertFalse(check_assert_line("# assert result\nprint('assert result')\n"))
+
+    def test_invalid_code(self) -> None:
+        """
+        Code with syntax errors does not pass.
+        """
+        self.assertFalse(check_assert_line("assert result ==\n"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+"""
+Tests for reusing coverage data of unchanged labs.
+"""
+
+import json
+import unittest
+
+from tests.project_test_case import ProjectTestCase
+
+from quality_control.collect_coverage.coverage_cache import CoverageCache
+from quality_control.collect_coverage.run_coverage import get_coverage_data_path
+
+
+class CoverageCacheTest(ProjectTestCase):
+    """
+    Tests for CoverageCache.
+    """
+
+    def setUp(self) -> None:
+        """
+        Create a project with a single lab and traced coverage data of it.
+        """
+        super().setUp()
+        self.link_interpreter()
+        self.lab_path = self.write_file(
+            "lab_1/settings.json", json.dumps({"target_score": 8})
+        ).parent
+        self.write_file("lab_1/main.py", "FACTOR = 2\n")
+        self.artifacts_path = self.root_dir / "build" / "coverage"
+        self.artifacts_path.mkdir(parents=True)
+        get_coverage_data_path(self.artifacts_path, "lab_1").write_bytes(b"data")
+
+    def test_unchanged_lab_is_reused(self) -> None:
+        """
+        Coverage data and percentage of an unchanged lab are restored.
+        """
+        CoverageCache(self.root_dir, self.artifacts_path).store(self.lab_path, 75)
+        get_coverage_data_path(self.artifacts_path, "lab_1").unlink()
+
+        reused, changed = CoverageCache(self.root_dir, self.artifacts_path).partition(
+            [self.lab_path]
+        )
+        self.assertEqual(reused, {"lab_1": (75,)})
+        self.assertEqual(changed, [])
+        self.assertEqual(get_coverage_data_path(self.artifacts_path, "lab_1").read_bytes(), b"data")
+
+    def test_changed_lab_is_traced(self) -> None:
+        """
+        A lab with changed sources is not reused.
+        """
+        CoverageCache(self.root_dir, self.artifacts_path).store(self.lab_path, 75)
+        (self.lab_path / "main.py").write_text("FACTOR = 3\n", encoding="utf-8")
+
+        reused, changed = CoverageCache(self.root_dir, self.artifacts_path).partition(
+            [self.lab_path]
+        )
+        self.assertEqual(reused, {})
+        self.assertEqual(changed, [self.lab_path])
+
+    def test_changed_import_of_other_lab_is_traced(self) -> None:
+        """
+        A lab importing a changed module of another lab is not reused.
+        """
+        self.write_file("lab_1/main.py", "from lab_2.helpers import FACTOR\n")
+        helpers_path = self.write_file("lab_2/helpers.py", "FACTOR = 2\n")
+        CoverageCache(self.root_dir, self.artifacts_path).store(self.lab_path, 75)
+        helpers_path.write_text("FACTOR = 3\n", encoding="utf-8")
+
+        reused, changed = CoverageCache(self.root_dir, self.artifacts_path).partition(
+            [self.lab_path]
+        )
+        self.assertEqual(reused, {})
+        self.assertEqual(changed, [self.lab_path])
+
+    def test_missing_data_file_is_a_miss(self) -> None:
+        """
+        A lab whose stored coverage data is gone is traced again instead of failing.
+        """
+        CoverageCache(self.root_dir, self.artifacts_path).store(self.lab_path, 75)
+        (self.root_dir / "build" / "coverage_cache" / "lab_1" / ".coverage").unlink()
+
+        reused, changed = CoverageCache(self.root_dir, self.artifacts_path).partition(
+            [self.lab_path]
+        )
+        self.assertEqual(reused, {})
+        self.assertEqual(changed, [self.lab_path])
+
+
+if __name__ == "__main__":
+    unittest.main()
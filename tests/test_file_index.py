@@ -0,0 +1,86 @@
+"""
+Tests for the index of repository files.
+"""
+
+import subprocess
+import unittest
+
+from tests.project_test_case import ProjectTestCase
+
+from quality_control.file_index import FileIndex
+
+
+class FileIndexTest(ProjectTestCase):
+    """
+    Tests for FileIndex.
+    """
+
+    def setUp(self) -> None:
+        """
+        Create a project with sources, an ignored build and a virtual environment.
+        """
+        super().setUp()
+        self.main_path = self.write_file("lab_1/main.py")
+        self.stub_path = self.write_file("lab_1/main.pyi")
+        self.settings_path = self.write_file("lab_1/settings.json")
+        self.test_path = self.write_file("lab_1/tests/test_main.py")
+        self.write_file("venv/lib/site.py")
+        self.write_file("lab_1/__pycache__/main.cpython-311.pyc")
+        self.write_file(".gitignore", "build/\n")
+        self.write_file("build/report.py")
+
+    def assert_indexes_sources(self, file_index: FileIndex) -> None:
+        """
+        Check that sources of the lab are indexed and excluded directories are skipped.
+
+        Args:
+            file_index (FileIndex): Index of the project
+        """
+        self.assertEqual(
+            [self.main_path, self.test_path],
+            file_index.with_suffix(".py", directory=self.root_dir / "lab_1"),
+        )
+        self.assertEqual(
+            [self.main_path, self.stub_path],
+            file_index.select("main.py*", directory=self.root_dir / "lab_1", recursive=False),
+        )
+        self.assertNotIn(self.root_dir / "venv" / "lib" / "site.py", file_index.with_suffix(".py"))
+
+    def test_walk_skips_excluded_directories(self) -> None:
+        """
+        Walking the tree skips excluded directories at any depth.
+        """
+        file_index = FileIndex(self.root_dir, use_git=False)
+        self.assert_indexes_sources(file_index)
+        self.assertIn(self.root_dir / "build" / "report.py", file_index.with_suffix(".py"))
+
+    def test_git_skips_ignored_files(self) -> None:
+        """
+        Listing files with git skips ignored and excluded files and keeps untracked ones.
+        """
+        subprocess.run(["git", "init", "-q"], cwd=self.root_dir, check=True)
+        file_index = FileIndex(self.root_dir)
+        self.assert_indexes_sources(file_index)
+        self.assertNotIn(self.root_dir / "build" / "report.py", file_index.with_suffix(".py"))
+
+    def test_directories_list_file_names(self) -> None:
+        """
+        Directories below the root are listed with names of their files.
+        """
+        directories = FileIndex(self.root_dir, use_git=False).get_directories()
+        self.assertEqual(
+            {"main.py", "main.pyi", "settings.json"}, directories[self.root_dir / "lab_1"]
+        )
+        self.assertNotIn(self.root_dir, directories)
+
+    def test_sizes_are_indexed(self) -> None:
+        """
+        Files are indexed with their sizes.
+        """
+        self.settings_path.write_text("{}", encoding="utf-8")
+        sizes = {file.path: file.size for file in FileIndex(self.root_dir, use_git=False).files}
+        self.assertEqual(2, sizes[self.settings_path])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,118 @@
+"""
+Tests for reusing pylint results of unchanged modules.
+"""
+
+import unittest
+
+from tests.project_test_case import ProjectTestCase
+
+from quality_control.import_closure import get_import_closure
+from quality_control.static_checks.lint_cache import LintCache
+
+
+class LintCacheTest(ProjectTestCase):
+    """
+    Tests for LintCache.
+    """
+
+    def setUp(self) -> None:
+        """
+        Create a lab with a chain of imports main -> helpers -> constants.
+        """
+        super().setUp()
+        self.lab_path = self.root_dir / "lab_1"
+        self.modules = {
+            "__init__": "",
+            "main": "from lab_1.helpers import scale\n",
+            "helpers": "from .constants import FACTOR\n",
+            "constants": "FACTOR = 2\n",
+        }
+        for name, content in self.modules.items():
+            self.write_file(f"lab_1/{name}.py", content)
+        self.config_path = self.write_file("pyproject.toml")
+
+    def get_cache(self, cross_module: bool = False) -> LintCache:
+        """
+        Create a cache of the project.
+
+        Args:
+            cross_module (bool): Whether checkers comparing modules are enabled
+
+        Returns:
+            LintCache: Cache of lint results
+        """
+        return LintCache(self.root_dir, self.config_path, "pylint 4", 1, cross_module)
+
+    def get_lint_output(self, names: list[str]) -> dict:
+        """
+        Get output of a pylint run over modules of the lab.
+
+        Args:
+            names (list[str]): Names of linted modules
+
+        Returns:
+            dict: Parsed output of pylint with ModuleStatsReporter
+        """
+        return {
+            "messages": [],
+            "modules": {f"lab_1.{name}": {"statement": 1} for name in names},
+            "paths": {f"lab_1.{name}": str(self.lab_path / f"{name}.py") for name in names},
+            "evaluation": "10.0",
+        }
+
+    def test_import_closure_is_transitive(self) -> None:
+        """
+        Files imported through other imported files are found.
+        """
+        self.assertEqual(
+            get_import_closure(self.lab_path / "main.py", self.root_dir),
+            [self.lab_path / name for name in ("__init__.py", "constants.py", "helpers.py")],
+        )
+
+    def test_key_depends_on_indirect_imports(self) -> None:
+        """
+        Changing a file imported indirectly changes the key of the module.
+        """
+        main_path = self.lab_path / "main.py"
+        key = self.get_cache().compute_key(main_path)
+        (self.lab_path / "constants.py").write_text("FACTOR = 3\n", encoding="utf-8")
+        self.assertNotEqual(self.get_cache().compute_key(main_path), key)
+
+    def test_unchanged_modules_are_reused(self) -> None:
+        """
+        Only modules affected by a change are linted again.
+        """
+        modules_paths = sorted(self.lab_path.glob("*.py"))
+        cache = self.get_cache()
+        cache.partition({self.lab_path: modules_paths})
+        cache.store(self.get_lint_output(list(self.modules)))
+
+        (self.lab_path / "main.py").write_text("from lab_1 import helpers\n", encoding="utf-8")
+        hits, misses = self.get_cache().partition({self.lab_path: modules_paths})
+        self.assertEqual(misses, {self.lab_path: [self.lab_path / "main.py"]})
+        self.assertEqual(
+            sorted(hits[self.lab_path]["modules"]),
+            ["lab_1.__init__", "lab_1.constants", "lab_1.helpers"],
+        )
+
+    def test_cross_module_checks_invalidate_lab(self) -> None:
+        """
+        With checkers comparing modules, a change of one module makes the whole lab linted.
+        """
+        modules_paths = sorted(self.lab_path.glob("*.py"))
+        cache = self.get_cache(cross_module=True)
+        cache.partition({self.lab_path: modules_paths})
+        cache.store(self.get_lint_output(list(self.modules)))
+
+        hits, misses = self.get_cache(cross_module=True).partition({self.lab_path: modules_paths})
+        self.assertEqual(misses, {})
+        self.assertEqual(len(hits[self.lab_path]["modules"]), 4)
+
+        (self.lab_path / "main.py").write_text("from lab_1 import helpers\n", encoding="utf-8")
+        hits, misses = self.get_cache(cross_module=True).partition({self.lab_path: modules_paths})
+        self.assertEqual(misses, {self.lab_path: modules_paths})
+        self.assertEqual(hits[self.lab_path]["modules"], {})
+
+
+if __name__ == "__main__":
+    unittest.main()
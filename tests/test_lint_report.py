@@ -0,0 +1,110 @@
+"""
+Tests for reading results of pylint runs.
+"""
+
+import unittest
+from pathlib import Path
+from typing import Any
+
+from quality_control.static_checks.lint_report import summarize_lint_output
+
+ROOT_DIR = Path("/project")
+
+
+def get_stats(statement: int, convention: int = 0) -> dict[str, int]:
+    """
+    Get statistics of a module.
+
+    Args:
+        statement (int): Number of statements
+        convention (int): Number of convention messages
+
+    Returns:
+        dict[str, int]: Statistics of the module
+    """
+    return {
+        "fatal": 0,
+        "error": 0,
+        "warning": 0,
+        "refactor": 0,
+        "convention": convention,
+        "info": 0,
+        "statement": statement,
+    }
+
+
+def get_lint_output() -> dict[str, Any]:
+    """
+    Get output of a pylint run over a package lab and a lab without __init__.py.
+
+    Returns:
+        dict[str, Any]: Parsed output of pylint with ModuleStatsReporter
+    """
+    return {
+        "messages": [
+            {
+                "module": "main",
+                "path": "lab_1/main.py",
+                "absolutePath": str(ROOT_DIR / "lab_1" / "main.py"),
+                "symbol": "missing-docstring",
+            },
+        ],
+        "modules": {
+            "Command line": get_stats(0),
+            "main": get_stats(10, convention=1),
+            "lab_2": get_stats(0),
+            "lab_2.main": get_stats(10),
+        },
+        "paths": {
+            "main": str(ROOT_DIR / "lab_1" / "main.py"),
+            "lab_2": str(ROOT_DIR / "lab_2" / "__init__.py"),
+            "lab_2.main": str(ROOT_DIR / "lab_2" / "main.py"),
+        },
+        "evaluation": (
+            "max(0, 0 if fatal else 10.0 - ((float(5 * error + warning + refactor + "
+            "convention) / statement) * 10))"
+        ),
+    }
+
+
+class SummarizeLintOutputTest(unittest.TestCase):
+    """
+    Tests for summarize_lint_output.
+    """
+
+    def test_modules_outside_of_packages(self) -> None:
+        """
+        Modules of a lab without __init__.py are attributed to it by their files.
+        """
+        lint_report = summarize_lint_output(get_lint_output(), ROOT_DIR / "lab_1")
+        self.assertEqual(list(lint_report.modules), ["main"])
+        self.assertEqual(lint_report.files, {"lab_1/main.py": {"missing-docstring": 1}})
+        self.assertAlmostEqual(lint_report.score, 9.0)
+
+    def test_modules_of_packages(self) -> None:
+        """
+        Modules of a package lab do not include modules of other labs.
+        """
+        lint_report = summarize_lint_output(get_lint_output(), ROOT_DIR / "lab_2")
+        self.assertEqual(list(lint_report.modules), ["lab_2", "lab_2.main"])
+        self.assertEqual(lint_report.files, {})
+        self.assertAlmostEqual(lint_report.score, 10.0)
+
+    def test_lab_without_modules_fails(self) -> None:
+        """
+        A lab without linted modules is not given the full score.
+        """
+        with self.assertRaises(ValueError):
+            summarize_lint_output(get_lint_output(), ROOT_DIR / "lab_3")
+
+    def test_all_modules(self) -> None:
+        """
+        All modules are taken without a directory.
+        """
+        lint_report = summarize_lint_output(get_lint_output())
+        self.assertEqual(len(lint_report.modules), 4)
+        self.assertAlmostEqual(lint_report.score, 9.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
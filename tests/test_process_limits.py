@@ -0,0 +1,105 @@
+"""
+Tests for running processes with timeout and resource limits.
+"""
+
+import sys
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from tests.project_test_case import ProjectTestCase
+
+from quality_control.process_limits import (
+    LimitedRunResult,
+    ResourceLimits,
+    run_with_limits,
+    wrap_with_limits,
+)
+
+
+@unittest.skipIf(sys.platform == "win32", "resource limits are available on POSIX only")
+class RunWithLimitsTest(ProjectTestCase):
+    """
+    Tests for run_with_limits.
+    """
+
+    def run_code(self, code: str, limits: ResourceLimits) -> LimitedRunResult:
+        """
+        Run Python code in the project directory.
+
+        Args:
+            code (str): Code to run
+            limits (ResourceLimits): Limits of the process
+
+        Returns:
+            LimitedRunResult: Outcome and resource usage of the process
+        """
+        return run_with_limits([sys.executable, "-c", code], self.root_dir, limits)
+
+    def test_output_and_usage_are_collected(self) -> None:
+        """
+        Output, exit code and resource usage of the process are returned.
+        """
+        result = self.run_code(
+            "import sys; print('out'); print('err', file=sys.stderr); sys.exit(3)",
+            ResourceLimits(timeout=30, memory_mb=1024, cpu_seconds=30),
+        )
+        self.assertEqual("out", result.stdout.strip())
+        self.assertEqual("err", result.stderr.strip())
+        self.assertEqual(3, result.return_code)
+        self.assertFalse(result.timed_out)
+        self.assertIsNotNone(result.cpu_time)
+        self.assertGreater(result.max_rss_mb or 0, 0)
+
+    def test_timeout_kills_children(self) -> None:
+        """
+        Process and its children are killed when the timeout expires.
+        """
+        result = self.run_code(
+            "import subprocess, sys, time\n"
+            "subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(60)'])\n"
+            "time.sleep(60)\n",
+            ResourceLimits(timeout=1),
+        )
+        self.assertTrue(result.timed_out)
+        self.assertLess(result.wall_time, 30)
+
+    def test_memory_limit_is_applied(self) -> None:
+        """
+        Process cannot allocate more memory than allowed.
+        """
+        result = self.run_code("b'x' * 512 * 1024 * 1024", ResourceLimits(memory_mb=256))
+        self.assertNotEqual(0, result.return_code)
+        self.assertIn("MemoryError", result.stderr)
+
+    def test_limits_are_applied_from_threads(self) -> None:
+        """
+        Processes started from several threads get their own limits.
+        """
+        code = "import resource; print(resource.getrlimit(resource.RLIMIT_CPU)[0])"
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(
+                executor.map(
+                    lambda cpu: self.run_code(code, ResourceLimits(cpu_seconds=cpu)),
+                    range(10, 18),
+                )
+            )
+        self.assertEqual(
+            [str(cpu) for cpu in range(10, 18)], [result.stdout.strip() for result in results]
+        )
+
+
+class WrapWithLimitsTest(unittest.TestCase):
+    """
+    Tests for wrap_with_limits.
+    """
+
+    def test_command_without_limits_is_unchanged(self) -> None:
+        """
+        Command is run directly when there are no limits to set.
+        """
+        options = ["python", "-m", "pytest"]
+        self.assertEqual(options, wrap_with_limits(options, ResourceLimits(timeout=10)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+"""
+Tests for running all checks.
+"""
+
+import unittest
+
+from quality_control.run_all import (
+    CHECKS,
+    prepare_check_args,
+    RunAllArgumentsParser,
+    select_checks,
+    split_jobs,
+)
+
+
+class SplitJobsTest(unittest.TestCase):
+    """
+    Tests for split_jobs.
+    """
+
+    def test_jobs_are_not_oversubscribed(self) -> None:
+        """
+        Checks running at once use no more jobs than requested together.
+        """
+        for jobs in range(1, 33):
+            for checks_count in range(1, 16):
+                concurrent_checks, check_jobs = split_jobs(jobs, checks_count)
+                self.assertLessEqual(concurrent_checks * check_jobs, jobs)
+                self.assertLessEqual(concurrent_checks, checks_count)
+
+    def test_spare_jobs_go_to_checks(self) -> None:
+        """
+        Jobs left over by few checks are given to each of them.
+        """
+        self.assertEqual(split_jobs(8, 2), (2, 4))
+        self.assertEqual(split_jobs(4, 15), (4, 1))
+
+
+class SelectChecksTest(unittest.TestCase):
+    """
+    Tests for ordering and arguments of checks.
+    """
+
+    def test_stubs_are_generated_before_checks_of_labs(self) -> None:
+        """
+        Checks reading directories of labs start after stubs are written into them.
+        """
+        names = [check.name for check in select_checks([], [])]
+        for name in ("check_black", "check_flake8", "check_lint", "check_mypy", "run_tests"):
+            self.assertLess(names.index("generate_labs_stubs"), names.index(name))
+
+    def test_project_config_is_passed_to_every_check(self) -> None:
+        """
+        Checks with own arguments still get the project config of the run.
+        """
+        args = RunAllArgumentsParser(underscores_to_dashes=True).parse_args(
+            ["--project-config-path", "custom.json"]
+        )
+        for check in CHECKS:
+            check_args = prepare_check_args(check, args, 1)
+            self.assertIn("custom.json", check_args, check.name)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,50 @@
+"""
+Tests for running tests of labs.
+"""
+
+import contextlib
+import io
+import unittest
+
+from quality_control.run_tests import CommandLineInterface
+
+
+class CommandLineInterfaceTest(unittest.TestCase):
+    """
+    Tests for validation of arguments of run_tests.
+    """
+
+    def assert_rejected(self, args: list[str]) -> None:
+        """
+        Check that arguments are rejected by the parser.
+
+        Args:
+            args (list[str]): Command line arguments
+        """
+        with contextlib.redirect_stderr(io.StringIO()), self.assertRaises(SystemExit):
+            CommandLineInterface(underscores_to_dashes=True).parse_args(args)
+
+    def test_impacted_only_requires_changed_since(self) -> None:
+        """
+        Selecting impacted tests without a base revision is rejected.
+        """
+        self.assert_rejected(["--impacted-only"])
+
+    def test_impacted_only_conflicts_with_single_session(self) -> None:
+        """
+        Selecting impacted tests in a single pytest session is rejected.
+        """
+        self.assert_rejected(["--impacted-only", "--changed-since", "HEAD", "--single-session"])
+
+    def test_impacted_only_with_changed_since(self) -> None:
+        """
+        Selecting impacted tests against a base revision is accepted.
+        """
+        args = CommandLineInterface(underscores_to_dashes=True).parse_args(
+            ["--impacted-only", "--changed-since", "HEAD"]
+        )
+        self.assertTrue(args.impacted_only)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,153 @@
+"""
+Tests for splitting labs across shards.
+"""
+
+import json
+import unittest
+
+from tests.project_test_case import ProjectTestCase
+
+from quality_control.sharding import (
+    LabDurations,
+    merge_shard_results,
+    split_into_shards,
+    write_shard_results,
+)
+from quality_control.test_durations.store import (
+    get_default_db_path,
+    get_labs_durations,
+    save_run,
+)
+from quality_control.test_durations.store import TestRecord as DurationRecord
+
+
+class SplitIntoShardsTest(unittest.TestCase):
+    """
+    Tests for split_into_shards.
+    """
+
+    def test_balances_known_durations(self) -> None:
+        """
+        Longest labs are spread across the shards.
+        """
+        durations = {"lab_1": 10.0, "lab_2": 6.0, "lab_3": 5.0, "lab_4": 1.0}
+        shards = split_into_shards(sorted(durations), durations, 2)
+        self.assertEqual(shards, [["lab_1", "lab_4"], ["lab_2", "lab_3"]])
+
+    def test_covers_every_lab_once(self) -> None:
+        """
+        Every lab is put to exactly one shard, unknown labs included.
+        """
+        labs_names = [f"lab_{index}" for index in range(7)]
+        shards = split_into_shards(labs_names, {"lab_0": 3.0}, 3)
+        self.assertEqual(sorted(name for shard in shards for name in shard), labs_names)
+
+    def test_split_is_deterministic(self) -> None:
+        """
+        The same labs and durations give the same split regardless of order.
+        """
+        durations = {"lab_1": 1.0, "lab_2": 1.0, "lab_3": 1.0}
+        self.assertEqual(
+            split_into_shards(["lab_3", "lab_1", "lab_2"], durations, 2),
+            split_into_shards(["lab_1", "lab_2", "lab_3"], durations, 2),
+        )
+
+
+class LabDurationsTest(ProjectTestCase):
+    """
+    Tests for LabDurations.
+    """
+
+    def test_saved_durations_are_used_for_sharding(self) -> None:
+        """
+        Durations measured by a tool are read back from the durations database.
+        """
+        durations = LabDurations(self.root_dir, "check_lint")
+        durations.record("lab_1", 10.0)
+        durations.record("lab_2", 1.0)
+        durations.record("lab_3", 1.0)
+        durations.save()
+
+        selected = LabDurations(self.root_dir, "check_lint").select_shard(
+            ["lab_1", "lab_2", "lab_3"], "1/2"
+        )
+        self.assertEqual(selected, ["lab_1"])
+        self.assertEqual(
+            LabDurations(self.root_dir, "check_mypy").select_shard(["lab_1"], "1/1"), ["lab_1"]
+        )
+
+    def test_durations_of_tests_take_precedence(self) -> None:
+        """
+        Durations of tests recorded by the pytest plugin override measured ones.
+        """
+        db_path = get_default_db_path(self.root_dir)
+        save_run(
+            db_path,
+            [
+                DurationRecord(
+                    nodeid="lab_2/tests/test_a.py::test",
+                    lab="lab_2",
+                    outcome="passed",
+                    duration=9.0,
+                ),
+            ],
+        )
+        durations = LabDurations(self.root_dir, "run_tests")
+        durations.record("lab_1", 5.0)
+        durations.record("lab_2", 1.0)
+        durations.save()
+
+        selected = LabDurations(
+            self.root_dir, "run_tests", get_labs_durations(db_path)
+        ).select_shard(["lab_1", "lab_2", "lab_3"], "1/2")
+        self.assertEqual(selected, ["lab_2"])
+
+
+class MergeShardResultsTest(ProjectTestCase):
+    """
+    Tests for merge_shard_results.
+    """
+
+    labs_names = ["lab_1", "lab_2", "lab_3"]
+
+    def run_shard(self, shard: str, durations: dict[str, float]) -> None:
+        """
+        Process labs of a shard as a node would and store its results.
+
+        Args:
+            shard (str): Shard specification in the K/N format
+            durations (dict[str, float]): Durations of labs measured by the node
+        """
+        lab_durations = LabDurations(self.root_dir, "run_tests")
+        selected = lab_durations.select_shard(self.labs_names, shard)
+        for lab_name in selected:
+            lab_durations.record(lab_name, durations.get(lab_name, 1.0))
+        write_shard_results(
+            self.root_dir, "run_tests", shard, dict.fromkeys(selected, True), lab_durations
+        )
+
+    def test_shards_with_the_same_split(self) -> None:
+        """
+        Shards splitting labs the same way pass when all their labs pass.
+        """
+        self.run_shard("1/2", {})
+        self.run_shard("2/2", {})
+        self.assertTrue(merge_shard_results(self.root_dir / "build" / "shards", self.root_dir))
+
+    def test_shards_with_different_splits(self) -> None:
+        """
+        A lab missed or run twice because nodes split labs by different durations fails the merge.
+        """
+        self.run_shard("1/2", {"lab_1": 10.0})
+        self.run_shard("2/2", {})
+        results_dir = self.root_dir / "build" / "shards"
+        shards_labs = [
+            json.loads(path.read_text(encoding="utf-8"))["shard_labs"]
+            for path in sorted(results_dir.glob("*.json"))
+        ]
+        self.assertNotEqual(sorted(name for labs in shards_labs for name in labs), self.labs_names)
+        self.assertFalse(merge_shard_results(results_dir, self.root_dir))
+
+
+if __name__ == "__main__":
+    unittest.main()
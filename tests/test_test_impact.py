@@ -0,0 +1,127 @@
+"""
+Tests for selection of tests impacted by changes.
+"""
+
+import json
+import unittest
+
+from coverage import CoverageData
+from tests.project_test_case import ProjectTestCase
+
+from quality_control.test_impact.index import (
+    build_index,
+    get_index_path,
+    match_impacted_tests,
+    parse_changed_lines,
+)
+
+DIFF = """\
+diff --git lab_1/main.py lab_1/main.py
+--- lab_1/main.py
++++ lab_1/main.py
+@@ -3 +3 @@ def scale(value):
+-    return value * FACTOR
++    return value * FACTOR + 1
+@@ -10,2 +9,0 @@ def shift(value):
+-    value += 1
+-    return value
+@@ -20,0 +19,2 @@ def unused():
++    pass
++    pass
+diff --git lab_1/new.py lab_1/new.py
+new file mode 100644
+--- /dev/null
++++ lab_1/new.py
+@@ -0,0 +1 @@
++NEW = 1
+"""
+
+TESTS = {
+    "lab_1/tests/test_main.py::test_scale": {"lab_1/main.py": [3, 4]},
+    "lab_1/tests/test_main.py::test_shift": {"lab_1/main.py": [10, 11]},
+}
+
+
+class ParseChangedLinesTest(unittest.TestCase):
+    """
+    Tests for parse_changed_lines.
+    """
+
+    def test_modified_deleted_and_inserted_lines(self) -> None:
+        """
+        Modified and deleted lines and lines around insertions are changed.
+        """
+        self.assertEqual(
+            parse_changed_lines(DIFF),
+            {"lab_1/main.py": {3, 10, 11, 20, 21}, "lab_1/new.py": {0, 1}},
+        )
+
+
+class MatchImpactedTestsTest(unittest.TestCase):
+    """
+    Tests for match_impacted_tests.
+    """
+
+    def test_tests_covering_changed_lines(self) -> None:
+        """
+        Only tests covering changed lines are selected.
+        """
+        self.assertEqual(
+            match_impacted_tests(TESTS, {"lab_1/main.py": {3}}),
+            ["lab_1/tests/test_main.py::test_scale"],
+        )
+
+    def test_lines_not_covered_by_tests(self) -> None:
+        """
+        A changed line not attributed to any test makes all tests run.
+        """
+        self.assertIsNone(match_impacted_tests(TESTS, {"lab_1/main.py": {1, 3}}))
+
+    def test_no_changed_lines(self) -> None:
+        """
+        No tests are selected without changed lines.
+        """
+        self.assertEqual(match_impacted_tests(TESTS, {}), [])
+
+
+class BuildIndexTest(ProjectTestCase):
+    """
+    Tests for build_index.
+    """
+
+    def setUp(self) -> None:
+        """
+        Create a lab with coverage data traced with per-test contexts.
+        """
+        super().setUp()
+        source_path = self.write_file(
+            "lab_1/main.py", "FACTOR = 2\n\n\ndef scale(value):\n    return value * FACTOR\n"
+        )
+        self.data_path = self.root_dir / ".coverage"
+        data = CoverageData(basename=str(self.data_path))
+        data.set_context("")
+        data.add_lines({str(source_path): [1, 4]})
+        data.set_context("lab_1/tests/test_main.py::test_scale")
+        data.add_lines({str(source_path): [5]})
+        data.write()
+
+    def test_lines_run_at_import_are_not_attributed(self) -> None:
+        """
+        Changing a line run at import selects all tests instead of none.
+        """
+        build_index(self.data_path, self.root_dir, "lab_1")
+        index = json.loads(get_index_path(self.root_dir, "lab_1").read_text(encoding="utf-8"))
+
+        self.assertEqual(list(index["sources"]), ["lab_1/main.py"])
+        self.assertEqual(
+            index["tests"], {"lab_1/tests/test_main.py::test_scale": {"lab_1/main.py": [5]}}
+        )
+        self.assertIsNone(match_impacted_tests(index["tests"], {"lab_1/main.py": {1}}))
+        self.assertEqual(
+            match_impacted_tests(index["tests"], {"lab_1/main.py": {5}}),
+            ["lab_1/tests/test_main.py::test_scale"],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
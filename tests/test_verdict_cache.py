@@ -0,0 +1,87 @@
+"""
+Tests for reusing outcomes of green runs of unchanged labs.
+"""
+
+import unittest
+
+from tests.project_test_case import ProjectTestCase
+
+from quality_control.verdict_cache import VerdictCache
+
+
+class VerdictCacheTest(ProjectTestCase):
+    """
+    Tests for VerdictCache.
+    """
+
+    def setUp(self) -> None:
+        """
+        Create two labs, the first one importing a module of the second one.
+        """
+        super().setUp()
+        self.link_interpreter()
+        self.write_file("lab_1/__init__.py")
+        self.write_file("lab_1/main.py", "from lab_2.helpers import scale\n")
+        self.write_file("lab_2/__init__.py")
+        self.helpers_path = self.write_file("lab_2/helpers.py", "FACTOR = 2\n")
+        self.labs_arguments = [("lab_1", ["--target", "8"])]
+        self.result = ("stdout", "stderr", 0)
+
+    def get_cache(self) -> VerdictCache:
+        """
+        Create a cache of the current state of the project.
+
+        Returns:
+            VerdictCache: Cache of outcomes
+        """
+        return VerdictCache(self.root_dir, "run_start", 1)
+
+    def store_result(self) -> None:
+        """
+        Store the outcome of the first lab.
+        """
+        cache = self.get_cache()
+        cache.partition(self.labs_arguments)
+        cache.store("lab_1", self.result)
+
+    def test_unchanged_lab_is_replayed(self) -> None:
+        """
+        Stored outcome is returned for an unchanged lab.
+        """
+        self.store_result()
+        hits, misses = self.get_cache().partition(self.labs_arguments)
+        self.assertEqual({"lab_1": self.result}, hits)
+        self.assertEqual([], misses)
+
+    def test_changed_arguments_miss(self) -> None:
+        """
+        Lab checked with other arguments is checked again.
+        """
+        self.store_result()
+        labs_arguments = [("lab_1", ["--target", "10"])]
+        hits, misses = self.get_cache().partition(labs_arguments)
+        self.assertEqual({}, hits)
+        self.assertEqual(labs_arguments, misses)
+
+    def test_changed_import_of_other_lab_misses(self) -> None:
+        """
+        Change of a module imported from another lab invalidates the outcome.
+        """
+        self.store_result()
+        self.helpers_path.write_text("FACTOR = 3\n", encoding="utf-8")
+        hits, misses = self.get_cache().partition(self.labs_arguments)
+        self.assertEqual({}, hits)
+        self.assertEqual(self.labs_arguments, misses)
+
+    def test_change_of_unused_module_hits(self) -> None:
+        """
+        Change of a module the lab does not import keeps the outcome.
+        """
+        self.store_result()
+        self.write_file("lab_2/unused.py", "VALUE = 1\n")
+        hits, _ = self.get_cache().partition(self.labs_arguments)
+        self.assertEqual({"lab_1": self.result}, hits)
+
+
+if __name__ == "__main__":
+    unittest.main()